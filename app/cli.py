@@ -0,0 +1,283 @@
+# app/cli.py
+"""
+Command-line interface to the CV archive, for scripts and cron jobs.
+
+    python -m app.cli import resume.pdf --company Acme --role Dev --date 2024-05-01
+    python -m app.cli bulk-import ~/Downloads/cvs --company Acme --date 2024-05-01
+    python -m app.cli list --search acme --since 2024-01-01
+    python -m app.cli export --format csv -o applications.csv
+    python -m app.cli verify --repair
+    python -m app.cli delete 12 13
+    python -m app.cli extract-text
+
+Only app.core is imported here, never Qt, so this starts quickly and runs
+on machines without a display.
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from app.core import database, file_manager, pdf_text
+
+# --order-by choices -> the ORDER BY clauses database.search_applications() accepts
+ORDER_BYS = {
+    "newest": "date_applied DESC, id DESC",
+    "oldest": "date_applied ASC, id ASC",
+    "company": "company ASC, date_applied DESC",
+    "company-desc": "company DESC, date_applied DESC",
+    "created": "created_at DESC",
+}
+
+LIST_FIELDS = ("id", "date_applied", "company", "role", "file_path")
+
+
+def _add_filters(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-s", "--search", help="match company, role or notes")
+    parser.add_argument("--since", metavar="YYYY-MM-DD", help="only applications on or after this date")
+    parser.add_argument("--order-by", choices=ORDER_BYS, default="newest")
+    parser.add_argument("--exact", action="store_true",
+                        help="substring match instead of the full-text index")
+
+
+def _query(args: argparse.Namespace, limit: Optional[int] = None, offset: int = 0) -> List[database.Application]:
+    return database.search_applications(
+        search=args.search,
+        min_date=args.since,
+        order_by=ORDER_BYS[args.order_by],
+        limit=limit,
+        offset=offset,
+        fulltext=not args.exact,
+    )
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    app_id, action = file_manager.import_pdf(
+        args.file, args.company, args.role, args.date, args.notes, dedup=args.dedup
+    )
+    print(f"{action}\t{app_id}")
+    return 0
+
+
+def cmd_bulk_import(args: argparse.Namespace) -> int:
+    from app.core import bulk_import
+
+    paths = bulk_import.collect_pdfs(args.paths, recursive=not args.no_recursive)
+    defaults = {"company": args.company or "", "role": args.role, "date": args.date or "", "notes": args.notes}
+    items, failures = bulk_import.plan_imports(paths, defaults)
+
+    def progress(done, total, path):
+        if not args.quiet:
+            print(f"[{done}/{total}] {path.name}", file=sys.stderr)
+
+    result = bulk_import.bulk_import(
+        items, batch_size=args.batch_size, workers=args.workers, progress=progress, dedup=args.dedup
+    )
+    failures += result.failures
+    for failure in failures:
+        print(f"failed\t{failure.path}\t{failure.error}", file=sys.stderr)
+    print(f"imported {result.imported}, linked {result.linked}, skipped {result.skipped}, failed {len(failures)}")
+    return 1 if failures else 0
+
+
+def cmd_import_manifest(args: argparse.Namespace) -> int:
+    from app.core import manifest
+
+    def progress(rows, accepted):
+        if not args.quiet:
+            print(f"[{rows}] {accepted} accepted", file=sys.stderr)
+
+    result = manifest.import_manifest(
+        args.manifest, fmt=args.format, batch_size=args.batch_size, workers=args.workers,
+        dry_run=args.dry_run, dedup=args.dedup, progress=progress,
+    )
+    for rejection in result.rejected:
+        print(f"rejected\tline {rejection.line}\t{rejection.error}", file=sys.stderr)
+    summary = f"{result.rows} row(s), {result.accepted} accepted, {len(result.rejected)} rejected"
+    if not result.dry_run:
+        summary += f"; imported {result.imported}, linked {result.linked}, skipped {result.skipped}"
+    print(f"{summary} in {result.seconds:.2f}s ({result.rows_per_second:.0f} rows/s)")
+    return 1 if result.rejected else 0
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    if args.count:
+        print(database.count_applications(search=args.search, min_date=args.since, fulltext=not args.exact))
+        return 0
+    if args.json:
+        # Streamed with full notes: list rows carry a preview, and reading
+        # each row's notes separately would cost a query per row
+        rows = database.iter_applications(
+            search=args.search,
+            min_date=args.since,
+            order_by=ORDER_BYS[args.order_by],
+            fulltext=not args.exact,
+            limit=args.limit,
+            offset=args.offset,
+        )
+        for row in rows:
+            print(json.dumps(dict(row), ensure_ascii=False))
+        return 0
+    for row in _query(args, limit=args.limit, offset=args.offset):
+        print("\t".join(str(row[f] if row[f] is not None else "") for f in LIST_FIELDS))
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    from app.core import export
+
+    dest = sys.stdout.buffer if args.output in (None, "-") else args.output
+    count = export.export_applications(
+        dest,
+        args.format,
+        search=args.search,
+        min_date=args.since,
+        order_by=ORDER_BYS[args.order_by],
+        fulltext=not args.exact,
+    )
+    if dest is sys.stdout.buffer:
+        sys.stdout.buffer.flush()
+    print(f"exported {count} application(s)", file=sys.stderr)
+    return 0
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    from app.core import integrity
+
+    report = integrity.scan(workers=args.workers)
+    plan = integrity.repair_plan(report)
+    if args.json:
+        print(json.dumps(
+            {"report": report.to_dict(), "plan": [vars(step) for step in plan]},
+            ensure_ascii=False, indent=2,
+        ))
+    else:
+        print(f"scanned {report.scanned} file(s), hashed {report.hashed}")
+        for name in ("missing", "drifted", "unhashed", "unreadable", "orphans", "orphan_blobs", "stale_staging"):
+            found = getattr(report, name)
+            if found:
+                print(f"{name}: {len(found)}")
+        for step in plan:
+            print(f"  {step.action}\t{step.path}\t{step.reason}")
+    if args.repair:
+        actions = list(integrity.SAFE_ACTIONS) + (["drop_row"] if args.drop_missing else [])
+        counts = integrity.apply_repairs(plan, actions)
+        print("repaired: " + (", ".join(f"{k} {v}" for k, v in sorted(counts.items())) or "nothing"), file=sys.stderr)
+        return 0
+    return 0 if report.ok else 1
+
+
+def cmd_delete(args: argparse.Namespace) -> int:
+    found = database.get_applications_by_ids(args.ids)
+    missing = [i for i in args.ids if i not in found]
+    for app_id in missing:
+        print(f"No application with id {app_id}", file=sys.stderr)
+    deleted = file_manager.delete_many(found) if found else 0
+    print(f"deleted {deleted} application(s)")
+    return 1 if missing else 0
+
+
+def cmd_backfill_hashes(args: argparse.Namespace) -> int:
+    print(f"hashed {file_manager.backfill_hashes(workers=args.workers)} application(s)")
+    return 0
+
+
+def cmd_extract_text(args: argparse.Namespace) -> int:
+    # Text is keyed by content hash, so rows from before hashing need one first
+    file_manager.backfill_hashes(workers=args.workers or 8)
+    print(f"indexed the text of {pdf_text.backfill(workers=args.workers)} PDF(s)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Manage the CV archive without the GUI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("import", help="import one PDF")
+    p.add_argument("file")
+    p.add_argument("--company", required=True)
+    p.add_argument("--role", default="")
+    p.add_argument("--date", required=True, metavar="YYYY-MM-DD")
+    p.add_argument("--notes", default="")
+    p.add_argument("--dedup", choices=file_manager.DEDUP_POLICIES, default=file_manager.DEFAULT_DEDUP_POLICY)
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("bulk-import", help="import every PDF in files/directories",
+                       description="Files named YYYY-MM-DD__company__role__vN.pdf keep their own "
+                                   "metadata; the options apply to everything else.")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--company")
+    p.add_argument("--role", default="")
+    p.add_argument("--date", metavar="YYYY-MM-DD")
+    p.add_argument("--notes", default="")
+    p.add_argument("--dedup", choices=file_manager.DEDUP_POLICIES, default=file_manager.DEFAULT_DEDUP_POLICY)
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--batch-size", type=int, default=200)
+    p.add_argument("--no-recursive", action="store_true")
+    p.add_argument("-q", "--quiet", action="store_true", help="no per-file progress")
+    p.set_defaults(func=cmd_bulk_import)
+
+    p = sub.add_parser("import-manifest", help="import records listed in a CSV/JSONL manifest",
+                       description="Columns: company, role, date (YYYY-MM-DD), notes, pdf. "
+                                   "Relative PDF paths are resolved against the manifest's directory.")
+    p.add_argument("manifest")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="default: from the file suffix")
+    p.add_argument("--dry-run", action="store_true", help="validate only; report rejects and throughput")
+    p.add_argument("--dedup", choices=file_manager.DEDUP_POLICIES, default=file_manager.DEFAULT_DEDUP_POLICY)
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--batch-size", type=int, default=500)
+    p.add_argument("-q", "--quiet", action="store_true", help="no per-batch progress")
+    p.set_defaults(func=cmd_import_manifest)
+
+    p = sub.add_parser("list", aliases=["search"], help="list applications")
+    _add_filters(p)
+    p.add_argument("--limit", type=int)
+    p.add_argument("--offset", type=int, default=0)
+    p.add_argument("--json", action="store_true", help="one JSON object per line")
+    p.add_argument("--count", action="store_true", help="print only the number of matches")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("export", help="write applications as CSV, JSON lines or the columnar format")
+    _add_filters(p)
+    p.add_argument("--format", choices=("csv", "jsonl", "columnar"), default="csv")
+    p.add_argument("-o", "--output", help="file to write (default: stdout)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("verify", help="check the archive against the database")
+    p.add_argument("--json", action="store_true", help="print the report and repair plan as JSON")
+    p.add_argument("--repair", action="store_true", help="apply the safe steps of the repair plan")
+    p.add_argument("--drop-missing", action="store_true",
+                   help="with --repair, also delete rows whose file cannot be restored")
+    p.add_argument("--workers", type=int)
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser("delete", help="delete applications and their files")
+    p.add_argument("ids", nargs="+", type=int)
+    p.set_defaults(func=cmd_delete)
+
+    p = sub.add_parser("backfill-hashes", help="hash archived PDFs imported before hashing existed")
+    p.add_argument("--workers", type=int, default=8)
+    p.set_defaults(func=cmd_backfill_hashes)
+
+    p = sub.add_parser("extract-text", help="index the text of archived PDFs for search (resumable)")
+    p.add_argument("--workers", type=int, default=None, help="extraction processes (default: one per CPU)")
+    p.set_defaults(func=cmd_extract_text)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    database.init_db()
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        # Imports index their text in the background; finish it before exiting
+        pdf_text.wait_idle()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+# app/core/bulk_import.py
+from __future__ import annotations
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from app.core import database, file_manager, pdf_text
+
+# progress(done, total, path) is called after every file, from the calling thread.
+ProgressCallback = Callable[[int, int, Path], None]
+
+
+@dataclass
+class ImportItem:
+    """
+    One PDF to import and the metadata it will be stored under.
+    """
+    src: Path
+    company: str
+    role: str
+    date: str  # "YYYY-MM-DD"
+    notes: str = ""
+
+
+@dataclass
+class ImportFailure:
+    """
+    A file that could not be imported, and why.
+    """
+    path: Path
+    error: str
+
+
+@dataclass
+class BulkImportResult:
+    imported: int = 0
+    linked: int = 0   # duplicates recorded against an already-archived file
+    skipped: int = 0  # duplicates not imported at all
+    failures: List[ImportFailure] = field(default_factory=list)
+    cancelled: bool = False
+
+
+def collect_pdfs(sources: Iterable[Union[str, Path]], recursive: bool = True) -> List[Path]:
+    """
+    Expand files and directories into a sorted, de-duplicated list of PDFs.
+    """
+    found = set()
+    for source in sources:
+        path = Path(source).expanduser().resolve()
+        if path.is_dir():
+            pattern = "**/*" if recursive else "*"
+            found.update(p for p in path.glob(pattern) if p.is_file() and p.suffix.lower() == ".pdf")
+        elif path.is_file():
+            found.add(path)
+    return sorted(found)
+
+
+def plan_imports(
+    paths: Iterable[Path],
+    defaults: Dict[str, str],
+) -> tuple[List[ImportItem], List[ImportFailure]]:
+    """
+    Work out the metadata for each file. Files already named
+    "YYYY-MM-DD__company__role__vN.pdf" keep their own metadata; everything
+    else uses `defaults` (keys: company, role, date, notes).
+    """
+    items: List[ImportItem] = []
+    failures: List[ImportFailure] = []
+    for path in paths:
+        parsed = file_manager.parse_filename(path.name)
+        meta = dict(defaults)
+        if parsed:
+            meta.update(company=parsed["company"], role=parsed["role"], date=parsed["date"])
+        if not meta.get("company") or not meta.get("date"):
+            failures.append(ImportFailure(path, "No company/date: name does not follow the archive convention"))
+            continue
+        items.append(ImportItem(path, meta["company"], meta.get("role", ""), meta["date"], meta.get("notes", "")))
+    return items, failures
+
+
+def bulk_import(
+    items: List[ImportItem],
+    batch_size: int = 200,
+    workers: int = 4,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    dedup: str = file_manager.DEFAULT_DEDUP_POLICY,
+) -> BulkImportResult:
+    """
+    Copy PDFs into the archive on a thread pool and insert their rows with
+    executemany, one transaction per batch; that transaction also allocates
+    every row's version, after which the copies get their versioned names.
+    The text of each batch's new files is then queued for the background
+    indexer (see pdf_text.index_later()).
+    Every file is hashed first and
+    `dedup` (see file_manager.DEDUP_POLICIES) decides what happens to content
+    that is already archived, including duplicates within this import.
+    A file that fails to copy is reported and skipped; if a batch insert fails,
+    that batch's copies are removed again so the archive and the DB stay in step.
+    Setting `cancel` stops after the files already in flight.
+    """
+    if dedup not in file_manager.DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy: {dedup}")
+    result = BulkImportResult()
+    total = len(items)
+    done = 0
+    # sha256 -> archived path for files stored during this run, so later
+    # copies of the same content can be linked without another lookup.
+    staged = _StagedHashes()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for start in range(0, total, batch_size):
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            batch = items[start:start + batch_size]
+            futures = {
+                pool.submit(_stage_item, item, dedup, staged, cancel): item
+                for item in batch
+            }
+            copied: List[tuple[ImportItem, Path, str, bool]] = []
+            linked: List[tuple[ImportItem, Path, str]] = []
+            repeats: List[tuple[ImportItem, str]] = []
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    staged_item = future.result()
+                except Exception as e:
+                    result.failures.append(ImportFailure(item.src, str(e)))
+                else:
+                    if staged_item is None:
+                        pass
+                    elif staged_item[0] == "skipped":
+                        result.skipped += 1
+                    elif staged_item[0] == "linked":
+                        linked.append((item, staged_item[1], staged_item[2]))
+                    elif staged_item[0] == "repeat":
+                        repeats.append((item, staged_item[2]))
+                    else:
+                        copied.append((item, staged_item[1], staged_item[2], staged_item[3]))
+                done += 1
+                if progress is not None:
+                    progress(done, total, item.src)
+
+            if copied:
+                published = _publish_batch(copied, staged, result)
+                pdf_text.index_later(published)
+
+            # Content seen earlier in this import: the first copy has been
+            # published by now, so link to it (or give up if it failed).
+            for item, sha in repeats:
+                path = staged.path(sha)
+                if dedup == "skip":
+                    result.skipped += 1
+                elif path is not None:
+                    linked.append((item, path, sha))
+                else:
+                    result.failures.append(ImportFailure(item.src, "Duplicate of a file that failed to import"))
+
+            if linked:
+                try:
+                    database.insert_applications(
+                        (item.company, item.role, item.date, item.notes, str(path), sha)
+                        for item, path, sha in linked
+                    )
+                except Exception as e:
+                    for item, path, sha in linked:
+                        result.failures.append(ImportFailure(item.src, f"Database insert failed: {e}"))
+                else:
+                    result.linked += len(linked)
+
+    if cancel is not None and cancel.is_set():
+        result.cancelled = True
+    return result
+
+
+def _publish_batch(
+    copied: List[tuple[ImportItem, Path, str, bool]],
+    staged: "_StagedHashes",
+    result: BulkImportResult,
+) -> List[tuple[str, str]]:
+    """
+    Insert a batch of staged files in one transaction, which also allocates
+    their versions and journals the publishes, then move each to its
+    versioned archive name. Returns (sha256, path) of the files published.
+    """
+    try:
+        rows = file_manager.record_staged(
+            [
+                (
+                    item.company, item.role, item.date, item.notes, sha,
+                    file_manager.archive_path_prefix(item.company, item.role, item.date),
+                )
+                for item, _, sha, _ in copied
+            ],
+            [(path, is_blob) for _, path, _, is_blob in copied],
+        )
+    except Exception as e:
+        for item, path, sha, is_blob in copied:
+            file_manager.discard_staged(path, is_blob, sha)
+            staged.forget(sha)
+            result.failures.append(ImportFailure(item.src, f"Database insert failed: {e}"))
+        return []
+
+    published = []
+    for row, (item, path, sha, is_blob) in zip(rows, copied):
+        try:
+            final = file_manager.finish_publish(row, path, is_blob)
+        except Exception as e:
+            file_manager.abandon_publish(row, path, is_blob)
+            staged.forget(sha)
+            result.failures.append(ImportFailure(item.src, str(e)))
+        else:
+            staged.stored(sha, Path(final))
+            published.append((sha, final))
+            result.imported += 1
+    return published
+
+
+class _StagedHashes:
+    """
+    Thread-safe map of content hashes archived so far in one bulk import.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._paths: Dict[str, Optional[Path]] = {}
+
+    def claim(self, sha: str) -> bool:
+        """
+        Returns True if the caller is the first to see this hash and should store it.
+        """
+        with self._lock:
+            if sha in self._paths:
+                return False
+            self._paths[sha] = None
+            return True
+
+    def path(self, sha: str) -> Optional[Path]:
+        with self._lock:
+            return self._paths.get(sha)
+
+    def stored(self, sha: str, path: Path) -> None:
+        with self._lock:
+            self._paths[sha] = path
+
+    def forget(self, sha: str) -> None:
+        with self._lock:
+            self._paths.pop(sha, None)
+
+
+def _stage_item(
+    item: ImportItem,
+    dedup: str,
+    staged: _StagedHashes,
+    cancel: Optional[threading.Event],
+) -> tuple[str, Optional[Path], str, bool] | None:
+    """
+    Hash one file and, unless it is a duplicate to skip or link, stage it in
+    the archive. Returns (action, path, sha256, is_blob), or None if the import
+    was cancelled first. action is "imported" (path is the staged file),
+    "linked" (path is the existing archive file), "skipped", or "repeat" for
+    content already claimed by an earlier file in this import.
+    """
+    if cancel is not None and cancel.is_set():
+        return None
+    sha, existing = file_manager.find_duplicate(item.src)
+    if existing is not None:
+        if dedup == "skip":
+            return "skipped", None, sha, False
+        if dedup == "link" and Path(existing["file_path"]).exists():
+            return "linked", Path(existing["file_path"]), sha, False
+    elif dedup != "new_version" and not staged.claim(sha):
+        return "repeat", None, sha, False
+
+    path, is_blob = file_manager.stage_file(item.src, sha)
+    return "imported", path, sha, is_blob
@@ -1,9 +1,19 @@
 # app/core/database.py
 from __future__ import annotations
+import atexit
+import itertools
 import os
+import re
 import sqlite3
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Dict, Any
+from typing import Callable, Iterable, Iterator, List, Dict, Any
 
 APP_NAME = "CV Manager"
 
@@ -14,13 +24,22 @@ ARCHIVE_ROOT_DIR = Path(
     os.getenv("CVM_ARCHIVE_DIR", "/Users/umang/Documents/Resumes")
 ).expanduser()
 
+# (DATABASE_BASE_DIR, database file) once the directory has been created
+_resolved_db_path: tuple[Path, Path] | None = None
+
 def db_path() -> Path:
     """
     Full path to the SQLite database file, kept alongside the code.
-    Ensures the parent directory exists.
+    The parent directory is created the first time the path is resolved;
+    later calls only compare against the cached value, so opening a
+    per-thread connection costs no filesystem calls.
     """
-    DATABASE_BASE_DIR.mkdir(parents=True, exist_ok=True)
-    return DATABASE_BASE_DIR / "app.db"
+    global _resolved_db_path
+    base = DATABASE_BASE_DIR
+    if _resolved_db_path is None or _resolved_db_path[0] != base:
+        base.mkdir(parents=True, exist_ok=True)
+        _resolved_db_path = (base, base / "app.db")
+    return _resolved_db_path[1]
 
 def archive_root() -> Path:
     """
@@ -30,15 +49,388 @@ def archive_root() -> Path:
     base.mkdir(parents=True, exist_ok=True)
     return base
 
-def _connect() -> sqlite3.Connection:
+@dataclass(frozen=True)
+class StorageProfile:
     """
-    Opens a connection with safe defaults.
+    SQLite tuning knobs. journal_mode is persistent and applied by init_db();
+    everything else is per-connection and applied when a connection opens.
     """
-    conn = sqlite3.connect(db_path())
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"         # NORMAL is durable enough under WAL
+    cache_size_kib: int = 16 * 1024     # page cache per connection
+    mmap_size: int = 128 * 1024 * 1024  # 0 disables memory-mapped I/O
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000         # wait for the writer instead of failing
+    wal_autocheckpoint: int = 1000      # pages; checkpoint once the WAL passes this
+    journal_size_limit: int = 64 * 1024 * 1024  # truncate the WAL back to this after a checkpoint
+
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    # Readers never block the writer and vice versa.
+    "wal": StorageProfile(),
+    # Plain rollback journal, for databases on network filesystems where WAL
+    # shared memory is unavailable.
+    "compat": StorageProfile(journal_mode="DELETE", synchronous="FULL", mmap_size=0),
+}
+
+_storage_profile = STORAGE_PROFILES.get(os.getenv("CVM_DB_PROFILE", "wal").lower(), STORAGE_PROFILES["wal"])
+
+
+def storage_profile() -> StorageProfile:
+    """
+    The storage profile new connections are configured with.
+    """
+    return _storage_profile
+
+
+def _connection_pragmas(profile: StorageProfile) -> List[str]:
+    """
+    Per-connection PRAGMAs for a storage profile.
+    """
+    return [
+        "PRAGMA foreign_keys = ON;",
+        f"PRAGMA busy_timeout = {int(profile.busy_timeout_ms)};",
+        f"PRAGMA synchronous = {profile.synchronous};",
+        f"PRAGMA cache_size = {-int(profile.cache_size_kib)};",
+        f"PRAGMA mmap_size = {int(profile.mmap_size)};",
+        f"PRAGMA temp_store = {profile.temp_store};",
+        f"PRAGMA wal_autocheckpoint = {int(profile.wal_autocheckpoint)};",
+        f"PRAGMA journal_size_limit = {int(profile.journal_size_limit)};",
+    ]
+
+_local = threading.local()
+# Every open connection, keyed by a token that is never reused (thread idents are)
+_connections: Dict[int, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+_connection_tokens = itertools.count()
+# Bumped by close_connections() so every thread notices its handle is stale.
+_generation = 0
+
+
+def _open_connection(path: Path) -> sqlite3.Connection:
+    """
+    Opens a new connection to `path` and applies the storage profile's
+    per-connection PRAGMAs.
+    """
+    # check_same_thread is off so close_connections() can close every
+    # connection at shutdown, and a thread's finalizer can close its own
+    # wherever it runs; each connection is still only used by the thread
+    # that opened it.
+    conn = sqlite3.connect(path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
+    for pragma in _connection_pragmas(_storage_profile):
+        conn.execute(pragma)
     return conn
 
+
+class _ThreadHandle:
+    """
+    Kept only in the opening thread's threading.local. When the thread exits
+    its locals are dropped, and the finalizer attached to this object closes
+    the thread's connection. Works for threads threading.enumerate() never
+    lists, such as QThreadPool workers.
+    """
+    __slots__ = ("__weakref__",)
+
+
+def _release_connection(token: int) -> None:
+    """
+    Closes the connection registered under `token`, unless close_connections()
+    already has.
+    """
+    with _connections_lock:
+        conn = _connections.pop(token, None)
+    if conn is not None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+def _connect() -> sqlite3.Connection:
+    """
+    Returns this thread's connection, opening it on first use.
+    Connections are reused for the lifetime of the thread (or until
+    close_connections() is called), so PRAGMAs are only applied once.
+    """
+    path = db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == os.getpid():
+        if _local.path == path and _local.generation == _generation:
+            return conn
+        # The database location changed underneath us; drop the stale handle.
+        _close_thread_connection()
+    elif getattr(_local, "release", None) is not None and _local.pid != os.getpid():
+        # Inherited across fork: the handle belongs to the parent, leave it be
+        _local.release.detach()
+
+    conn = _open_connection(path)
+    token = next(_connection_tokens)
+    with _connections_lock:
+        _connections[token] = conn
+    _local.conn = conn
+    _local.path = path
+    _local.pid = os.getpid()
+    _local.generation = _generation
+    _local.handle = _ThreadHandle()
+    _local.release = weakref.finalize(_local.handle, _release_connection, token)
+    return conn
+
+
+def _close_thread_connection() -> None:
+    """
+    Closes the calling thread's connection, if any.
+    """
+    if getattr(_local, "conn", None) is None:
+        return
+    _local.conn = None
+    _local.release()
+
+
+def checkpoint(mode: str = "PASSIVE") -> tuple[int, int, int]:
+    """
+    Copies WAL frames back into the database file. PASSIVE never blocks
+    readers or the writer; TRUNCATE also resets the -wal file to zero bytes.
+    Returns SQLite's (busy, wal_pages, checkpointed_pages) triple.
+    """
+    mode = mode.upper()
+    if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+        raise ValueError(f"Unknown checkpoint mode: {mode}")
+    row = _connect().execute(f"PRAGMA wal_checkpoint({mode});").fetchone()
+    return tuple(row)
+
+
+class QueryCancelled(Exception):
+    """
+    Raised inside a cancellable() block when the query was abandoned.
+    """
+
+
+@contextmanager
+def cancellable(is_cancelled: Callable[[], bool], check_every: int = 1000) -> Iterator[None]:
+    """
+    Lets another thread abandon the queries this thread runs inside the block.
+    SQLite polls `is_cancelled` every `check_every` VM instructions and aborts
+    the running statement once it returns True; the block then raises
+    QueryCancelled.
+    """
+    conn = _connect()
+    conn.set_progress_handler(lambda: 1 if is_cancelled() else 0, check_every)
+    try:
+        yield
+    except sqlite3.OperationalError as e:
+        if "interrupted" in str(e) and is_cancelled():
+            raise QueryCancelled() from e
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+    if is_cancelled():
+        raise QueryCancelled()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Runs the block in one write transaction on this thread's connection.
+    BEGIN IMMEDIATE takes the write lock up front so concurrent writers
+    wait on busy_timeout instead of failing mid-transaction.
+    Commits on success and rolls back on any exception.
+    """
+    conn = _connect()
+    if getattr(_local, "tx_depth", 0):
+        # Already inside a transaction; let the outermost block commit.
+        _local.tx_depth += 1
+        try:
+            yield conn
+        finally:
+            _local.tx_depth -= 1
+        return
+    changes = conn.total_changes
+    conn.execute("BEGIN IMMEDIATE;")
+    _local.tx_depth = 1
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        _local.tx_depth = 0
+        if conn.total_changes != changes:
+            _bump_data_version()
+
+
+@contextmanager
+def _session() -> Iterator[sqlite3.Connection]:
+    """
+    Connection for a single statement or short unit of work. Commits (or rolls
+    back) on exit like `with conn:`, except inside a transaction() block,
+    where the outermost transaction decides.
+    """
+    conn = _connect()
+    if getattr(_local, "tx_depth", 0):
+        yield conn
+        return
+    changes = conn.total_changes
+    try:
+        with conn:
+            yield conn
+    finally:
+        if conn.total_changes != changes:
+            _bump_data_version()
+
+
+def close_connections() -> None:
+    """
+    Closes every open connection. Safe to call more than once; threads
+    transparently reopen a connection on their next call.
+    Registered with atexit so the database is closed cleanly at shutdown;
+    under WAL the log is checkpointed and truncated first.
+    """
+    global _generation
+    with _connections_lock:
+        conns = list(_connections.values())
+        _connections.clear()
+        _generation += 1
+    if conns and _storage_profile.journal_mode.upper() == "WAL":
+        try:
+            conns[0].execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        except sqlite3.Error:
+            pass
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _local.conn = None
+    _reset_query_cache()
+
+
+atexit.register(close_connections)
+
+# --- query result cache ----------------------------------------------------------
+#
+# Results of the list/count queries are kept, keyed by their normalised
+# arguments, together with the data version they were read at. Every write
+# made through transaction() or _session() bumps _data_version once it ends,
+# which empties the cache; writes from other processes (the CLI while the GUI
+# runs) show up in PRAGMA data_version on a connection reserved for watching.
+# An entry is only used while both numbers still match. List queries are
+# cached as immutable row tuples and turned into fresh Application records on
+# every call, so a caller editing its result never changes the cache.
+
+QUERY_CACHE_SIZE = int(os.getenv("CVM_QUERY_CACHE_SIZE", "64"))
+# Upper bound on rows held across all entries; a larger result is not cached
+QUERY_CACHE_ROWS = int(os.getenv("CVM_QUERY_CACHE_ROWS", "20000"))
+
+_data_version = 0
+# key -> (version token, result, rows held)
+_query_cache: "OrderedDict[tuple, tuple[tuple[int, int], Any, int]]" = OrderedDict()
+_query_cache_rows = 0
+_cache_lock = threading.Lock()
+# Connection that never writes, so its PRAGMA data_version moves on every
+# commit made by any other connection, in this process or another.
+_watch_conn: sqlite3.Connection | None = None
+_watch_key: tuple | None = None
+
+def _drop_cached() -> None:
+    # Called with _cache_lock held
+    global _query_cache_rows
+    _query_cache.clear()
+    _query_cache_rows = 0
+
+def _bump_data_version() -> None:
+    global _data_version
+    with _cache_lock:
+        _data_version += 1
+        _drop_cached()
+
+def _reset_query_cache() -> None:
+    global _watch_conn, _watch_key
+    with _cache_lock:
+        _drop_cached()
+        if _watch_conn is not None:
+            try:
+                _watch_conn.close()
+            except sqlite3.Error:
+                pass
+        _watch_conn = None
+        _watch_key = None
+
+def data_version() -> tuple[int, int]:
+    """
+    Returns a token that changes whenever the database has been written to:
+    (writes made by this process, SQLite's data_version as seen by a
+    connection that only watches).
+    """
+    global _watch_conn, _watch_key
+    key = (db_path(), os.getpid(), _generation)
+    with _cache_lock:
+        if _watch_conn is None or _watch_key != key:
+            if _watch_conn is not None:
+                try:
+                    _watch_conn.close()
+                except sqlite3.Error:
+                    pass
+            _watch_conn = sqlite3.connect(key[0], check_same_thread=False)
+            _watch_key = key
+            _drop_cached()
+        return _data_version, _watch_conn.execute("PRAGMA data_version;").fetchone()[0]
+
+def _cached(key: tuple, compute: Callable[[], Any], rows: Callable[[Any], int] = lambda result: 1) -> Any:
+    """
+    Returns compute()'s result for `key`, from the cache while the data
+    version is unchanged. The result must be immutable, since every caller
+    gets the same object. `rows` says how many rows a result holds, for the
+    QUERY_CACHE_ROWS budget. Reads inside a transaction() may see
+    uncommitted rows, so they bypass the cache.
+    """
+    global _query_cache_rows
+    if QUERY_CACHE_SIZE <= 0 or getattr(_local, "tx_depth", 0):
+        return compute()
+    # Taken before the query runs: a write that commits meanwhile changes
+    # the version, so a result that may predate it is never served again.
+    version = data_version()
+    with _cache_lock:
+        hit = _query_cache.get(key)
+        if hit is not None and hit[0] == version:
+            _query_cache.move_to_end(key)
+            return hit[1]
+    result = compute()
+    size = rows(result)
+    if size > QUERY_CACHE_ROWS:
+        return result
+    with _cache_lock:
+        old = _query_cache.pop(key, None)
+        if old is not None:
+            _query_cache_rows -= old[2]
+        _query_cache[key] = (version, result, size)
+        _query_cache_rows += size
+        while len(_query_cache) > QUERY_CACHE_SIZE or _query_cache_rows > QUERY_CACHE_ROWS:
+            _query_cache_rows -= _query_cache.popitem(last=False)[1][2]
+    return result
+
+def _cached_applications(key: tuple, sql: str, params: Iterable[Any]) -> List["Application"]:
+    """
+    Runs a list query through the query cache, which keeps the column names
+    and plain row tuples. Each call builds new Application records from them.
+    """
+    def query() -> tuple[tuple[str, ...], tuple[tuple, ...]]:
+        with _session() as conn:
+            cur = conn.execute(sql, params)
+            return tuple(d[0] for d in cur.description), tuple(tuple(row) for row in cur.fetchall())
+
+    names, rows = _cached(key, query, rows=lambda result: len(result[1]))
+    return [Application._from_values(names, row) for row in rows]
+
+def clear_query_cache() -> None:
+    """
+    Drops every cached query result.
+    """
+    with _cache_lock:
+        _drop_cached()
+
 SCHEMA_STATEMENTS: Iterable[str] = [
     """
     CREATE TABLE IF NOT EXISTS applications (
@@ -48,25 +440,232 @@ SCHEMA_STATEMENTS: Iterable[str] = [
         date_applied TEXT NOT NULL,     -- ISO format YYYY-MM-DD
         notes        TEXT,
         file_path    TEXT NOT NULL,     -- absolute path to archived PDF
-        created_at   TEXT DEFAULT (datetime('now'))
+        created_at   TEXT DEFAULT (datetime('now')),
+        sha256       TEXT,              -- content hash of the PDF
+        version      INTEGER            -- per (company, role, date_applied); NULL for linked rows
     );
     """,
     "CREATE INDEX IF NOT EXISTS idx_company_role ON applications(company, role);",
     "CREATE INDEX IF NOT EXISTS idx_date_applied ON applications(date_applied);",
+    # Write-ahead journal of file operations. An entry is committed in the same
+    # transaction as the row change it belongs to, before the file is touched,
+    # and removed once the file operation has finished; init_db() replays
+    # whatever is left after a crash.
+    """
+    CREATE TABLE IF NOT EXISTS file_ops (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        op          TEXT NOT NULL,      -- publish | move | delete
+        app_id      INTEGER,
+        src         TEXT NOT NULL,      -- file the operation starts from
+        dst         TEXT,               -- file it produces (NULL for delete)
+        sha256      TEXT,
+        keep_source INTEGER NOT NULL DEFAULT 0,  -- publish from a blob: link it, don't move it
+        created_at  TEXT DEFAULT (datetime('now')),
+        owner_pid   INTEGER             -- process carrying the operation out
+    );
+    """,
+    # Integrity scanner's stat cache: a file whose size, mtime and inode are
+    # unchanged since the last scan is not hashed again.
+    """
+    CREATE TABLE IF NOT EXISTS file_stats (
+        path        TEXT PRIMARY KEY,
+        size        INTEGER NOT NULL,
+        mtime_ns    INTEGER NOT NULL,
+        inode       INTEGER NOT NULL,
+        sha256      TEXT NOT NULL,
+        checked_at  TEXT DEFAULT (datetime('now'))
+    );
+    """,
+    # Text extracted from archived PDFs, one row per distinct content hash,
+    # so linked duplicates and re-imports of the same file share it.
+    """
+    CREATE TABLE IF NOT EXISTS pdf_text (
+        id           INTEGER PRIMARY KEY,
+        sha256       TEXT NOT NULL UNIQUE,
+        content      TEXT NOT NULL,     -- empty if nothing could be extracted
+        extracted_at TEXT DEFAULT (datetime('now'))
+    );
+    """,
+]
+
+# Columns added after the first release: (table, column, declaration).
+# init_db() adds any that an existing database is missing.
+COLUMN_MIGRATIONS: Iterable[tuple[str, str, str]] = [
+    ("applications", "sha256", "TEXT"),
+    ("applications", "version", "INTEGER"),
+    ("file_ops", "owner_pid", "INTEGER"),
+]
+
+# Indexes over migrated columns; created once the columns exist.
+MIGRATED_INDEX_STATEMENTS: Iterable[str] = [
+    "CREATE INDEX IF NOT EXISTS idx_sha256 ON applications(sha256);",
+    "CREATE INDEX IF NOT EXISTS idx_file_path ON applications(file_path);",
+    # Also serves next_version(): MAX(version) is a single index seek.
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_version
+    ON applications(company, role, date_applied, version);
+    """,
+]
+
+def _migrate_columns(conn: sqlite3.Connection) -> set:
+    """
+    Adds columns from COLUMN_MIGRATIONS that are missing from older databases.
+    Returns the (table, column) pairs that were added.
+    """
+    added = set()
+    for table, column, decl in COLUMN_MIGRATIONS:
+        existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table});")}
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl};")
+            added.add((table, column))
+    return added
+
+_VERSION_SUFFIX_RE = re.compile(r"__v(\d+)\.pdf$")
+
+def _backfill_versions(conn: sqlite3.Connection) -> None:
+    """
+    Recovers version numbers for rows created before the version column from
+    their "...__vN.pdf" file names. Rows that would clash with the unique
+    index (e.g. linked duplicates) keep a NULL version.
+    """
+    rows = conn.execute("SELECT id, file_path FROM applications WHERE version IS NULL;").fetchall()
+    updates = []
+    for row in rows:
+        match = _VERSION_SUFFIX_RE.search(row["file_path"])
+        if match:
+            updates.append((int(match.group(1)), row["id"]))
+    conn.executemany("UPDATE OR IGNORE applications SET version = ? WHERE id = ?;", updates)
+
+# Full-text index over the searchable columns. It is an external-content table,
+# so the text lives only in `applications`; the triggers keep the index in sync.
+FTS_STATEMENTS: Iterable[str] = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        company, role, notes,
+        content='applications',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    );
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(rowid, company, role, notes)
+        VALUES (new.id, new.company, new.role, new.notes);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, company, role, notes)
+        VALUES ('delete', old.id, old.company, old.role, old.notes);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE OF company, role, notes ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, company, role, notes)
+        VALUES ('delete', old.id, old.company, old.role, old.notes);
+        INSERT INTO applications_fts(rowid, company, role, notes)
+        VALUES (new.id, new.company, new.role, new.notes);
+    END;
+    """,
+    # PDF contents, external-content over pdf_text in the same way.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS pdf_text_fts USING fts5(
+        content,
+        content='pdf_text',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    );
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pdf_text_fts_ai AFTER INSERT ON pdf_text BEGIN
+        INSERT INTO pdf_text_fts(rowid, content) VALUES (new.id, new.content);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pdf_text_fts_ad AFTER DELETE ON pdf_text BEGIN
+        INSERT INTO pdf_text_fts(pdf_text_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS pdf_text_fts_au AFTER UPDATE OF content ON pdf_text BEGIN
+        INSERT INTO pdf_text_fts(pdf_text_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        INSERT INTO pdf_text_fts(rowid, content) VALUES (new.id, new.content);
+    END;
+    """,
 ]
 
-def init_db() -> Path:
+# Full-text tables, each backfilled from its content table when first created.
+_FTS_TABLES = ("applications_fts", "pdf_text_fts")
+
+# bm25 column weights: a hit in company outranks role, which outranks notes.
+_FTS_WEIGHTS = "10.0, 5.0, 1.0"
+
+# Set by init_db(); False when this SQLite build lacks FTS5.
+_fts_enabled = False
+
+def _setup_fts(conn: sqlite3.Connection) -> bool:
+    """
+    Creates the FTS5 indexes and their triggers. The first time an index is
+    created on an existing database it is backfilled from its content table.
+    Returns False if FTS5 is not compiled into SQLite.
+    """
+    existed = {
+        row["name"] for row in conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(_FTS_TABLES))});",
+            _FTS_TABLES,
+        )
+    }
+    try:
+        for stmt in FTS_STATEMENTS:
+            conn.execute(stmt)
+    except sqlite3.OperationalError as e:
+        if "fts5" not in str(e).lower():
+            raise
+        return False
+    for table in _FTS_TABLES:
+        if table not in existed:
+            conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild');")
+    return True
+
+def fts_available() -> bool:
     """
-    Ensures the database file and schema exist. Returns the DB path.
+    True once init_db() has set up the full-text index.
+    """
+    return _fts_enabled
+
+def init_db(profile: StorageProfile | None = None) -> Path:
+    """
+    Ensures the database file and schema exist and applies the storage
+    profile (WAL by default). Returns the DB path.
     Call this once on app startup.
     """
+    global _storage_profile, _fts_enabled
+    if profile is not None and profile != _storage_profile:
+        _storage_profile = profile
+        # Existing connections were tuned for the old profile.
+        close_connections()
     p = db_path()
-    with _connect() as conn:
+    conn = _connect()
+    conn.execute(f"PRAGMA journal_mode = {_storage_profile.journal_mode};")
+    with conn:
         for stmt in SCHEMA_STATEMENTS:
             conn.execute(stmt)
+        added = _migrate_columns(conn)
+        for stmt in MIGRATED_INDEX_STATEMENTS:
+            conn.execute(stmt)
+        if ("applications", "version") in added:
+            _backfill_versions(conn)
+        _fts_enabled = _setup_fts(conn)
         conn.commit()
+    _bump_data_version()
     # Also ensure archive root exists early, so later code can rely on it.
     _ = archive_root()
+    # Finish file operations a crash interrupted. Imported here because
+    # file_manager itself depends on this module.
+    from app.core import file_manager
+    file_manager.recover_pending_operations()
     return p
 
 def insert_application(
@@ -75,21 +674,424 @@ def insert_application(
     date_applied: str,   # "YYYY-MM-DD"
     notes: str,
     file_path: str,      # absolute path to the archived PDF
+    sha256: str | None = None,
 ) -> int:
     """
     Inserts a row and returns the new application id.
     """
-    with _connect() as conn:
+    with _session() as conn:
         cur = conn.execute(
             """
-            INSERT INTO applications (company, role, date_applied, notes, file_path)
-            VALUES (?, ?, ?, ?, ?);
+            INSERT INTO applications (company, role, date_applied, notes, file_path, sha256)
+            VALUES (?, ?, ?, ?, ?, ?);
             """,
-            (company, role, date_applied, notes, file_path),
+            (company, role, date_applied, notes, file_path, sha256),
+        )
+        return int(cur.lastrowid)
+
+def insert_applications(rows: Iterable[tuple]) -> int:
+    """
+    Inserts many (company, role, date_applied, notes, file_path, sha256) rows
+    in one transaction with executemany. Returns the number of rows inserted.
+    """
+    with transaction() as conn:
+        cur = conn.executemany(
+            """
+            INSERT INTO applications (company, role, date_applied, notes, file_path, sha256)
+            VALUES (?, ?, ?, ?, ?, ?);
+            """,
+            rows,
+        )
+        return cur.rowcount
+
+def next_version(company: str, role: str, date_applied: str) -> int:
+    """
+    Returns the next free version for a company/role/date, from idx_version.
+    Only advisory outside a transaction; insert_versioned_applications()
+    allocates atomically.
+    """
+    with _session() as conn:
+        return int(conn.execute(
+            """
+            SELECT COALESCE(MAX(version), 0) + 1 FROM applications
+            WHERE company = ? AND role IS ? AND date_applied = ?;
+            """,
+            (company, role, date_applied),
+        ).fetchone()[0])
+
+def insert_versioned_applications(rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+    """
+    Inserts many (company, role, date_applied, notes, sha256, path_prefix) rows
+    in one transaction, allocating each row the next version for its
+    company/role/date and storing file_path = path_prefix + version + ".pdf".
+    The write lock is held from the version lookup to the commit, so parallel
+    imports (threads or processes) can never be handed the same version.
+    Returns {"id", "version", "file_path"} dicts in input order.
+    """
+    with transaction() as conn:
+        last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM applications;").fetchone()[0]
+        conn.executemany(
+            """
+            INSERT INTO applications (company, role, date_applied, notes, sha256, version, file_path)
+            SELECT ?1, ?2, ?3, ?4, ?5, v, ?6 || v || '.pdf'
+            FROM (
+                SELECT COALESCE(MAX(version), 0) + 1 AS v FROM applications
+                WHERE company = ?1 AND role IS ?2 AND date_applied = ?3
+            );
+            """,
+            rows,
+        )
+        # AUTOINCREMENT ids only grow, and we hold the write lock, so the new
+        # rows are exactly those above last_id, in insertion order.
+        inserted = conn.execute(
+            "SELECT id, version, file_path FROM applications WHERE id > ? ORDER BY id;",
+            (last_id,),
+        ).fetchall()
+        return [dict(row) for row in inserted]
+
+def set_file_path(app_id: int, file_path: str) -> None:
+    """
+    Points an application at a different archived file.
+    """
+    with _session() as conn:
+        conn.execute("UPDATE applications SET file_path = ? WHERE id = ?;", (file_path, app_id))
+
+def journal_add(
+    op: str,
+    app_id: int | None,
+    src: str,
+    dst: str | None = None,
+    sha256: str | None = None,
+    keep_source: bool = False,
+) -> int:
+    """
+    Records an intended file operation and returns its journal id. Call it
+    inside the transaction that makes the matching row change. The entry is
+    owned by the calling process, so recovery in another one leaves it be
+    while this process runs.
+    """
+    with _session() as conn:
+        cur = conn.execute(
+            """
+            INSERT INTO file_ops (op, app_id, src, dst, sha256, keep_source, owner_pid)
+            VALUES (?, ?, ?, ?, ?, ?, ?);
+            """,
+            (op, app_id, src, dst, sha256, int(keep_source), os.getpid()),
         )
-        conn.commit()
         return int(cur.lastrowid)
 
+def journal_pending() -> List[Dict[str, Any]]:
+    """
+    Returns unfinished file operations, oldest first.
+    """
+    with _session() as conn:
+        return [dict(row) for row in conn.execute("SELECT * FROM file_ops ORDER BY id;")]
+
+def journal_done(op_ids: Iterable[int]) -> None:
+    """
+    Removes finished file operations from the journal.
+    """
+    with _session() as conn:
+        conn.executemany("DELETE FROM file_ops WHERE id = ?;", ((int(i),) for i in op_ids))
+
+def find_by_hash(sha256: str) -> Dict[str, Any] | None:
+    """
+    Returns the oldest application whose PDF has this content hash, or None.
+    An index lookup on idx_sha256.
+    """
+    with _session() as conn:
+        row = conn.execute(
+            "SELECT * FROM applications WHERE sha256 = ? ORDER BY id LIMIT 1;", (sha256,)
+        ).fetchone()
+        return dict(row) if row else None
+
+def count_file_references(file_path: str) -> int:
+    """
+    Returns how many applications point at this archived file.
+    """
+    with _session() as conn:
+        return int(conn.execute(
+            "SELECT COUNT(*) FROM applications WHERE file_path = ?;", (file_path,)
+        ).fetchone()[0])
+
+def count_hash_references(sha256: str) -> int:
+    """
+    Returns how many applications reference this content hash.
+    """
+    with _session() as conn:
+        return int(conn.execute(
+            "SELECT COUNT(*) FROM applications WHERE sha256 = ?;", (sha256,)
+        ).fetchone()[0])
+
+def fetch_unhashed(after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+    """
+    Returns up to `limit` (id, file_path) rows with id > after_id that have no
+    content hash yet, in id order.
+    """
+    with _session() as conn:
+        rows = conn.execute(
+            "SELECT id, file_path FROM applications WHERE sha256 IS NULL AND id > ? ORDER BY id LIMIT ?;",
+            (int(after_id), int(limit)),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+def set_hashes(pairs: Iterable[tuple[str, int]]) -> None:
+    """
+    Stores content hashes for many applications: (sha256, app_id) pairs.
+    """
+    with transaction() as conn:
+        conn.executemany("UPDATE applications SET sha256 = ? WHERE id = ?;", pairs)
+
+def fetch_unextracted(after: str = "", limit: int = 200) -> List[Dict[str, Any]]:
+    """
+    Returns up to `limit` (sha256, file_path) rows, one per content hash
+    greater than `after`, whose text has not been extracted yet, in hash order.
+    """
+    with _session() as conn:
+        rows = conn.execute(
+            """
+            SELECT sha256, MIN(file_path) AS file_path FROM applications
+            WHERE sha256 > ? AND sha256 NOT IN (SELECT sha256 FROM pdf_text)
+            GROUP BY sha256 ORDER BY sha256 LIMIT ?;
+            """,
+            (after, int(limit)),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+def extracted_hashes(hashes: Iterable[str]) -> set:
+    """
+    Returns which of these content hashes already have extracted text.
+    """
+    hashes = list(hashes)
+    found = set()
+    with _session() as conn:
+        for i in range(0, len(hashes), _IN_CHUNK):
+            chunk = hashes[i:i + _IN_CHUNK]
+            found.update(
+                row[0] for row in conn.execute(
+                    f"SELECT sha256 FROM pdf_text WHERE sha256 IN ({', '.join('?' * len(chunk))});", chunk
+                )
+            )
+    return found
+
+def save_pdf_texts(pairs: Iterable[tuple[str, str]]) -> None:
+    """
+    Stores extracted PDF text: (sha256, text) pairs. The FTS triggers index it.
+    """
+    with transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO pdf_text (sha256, content) VALUES (?, ?)
+            ON CONFLICT(sha256) DO UPDATE SET content = excluded.content, extracted_at = datetime('now');
+            """,
+            pairs,
+        )
+
+def get_pdf_text(sha256: str) -> str | None:
+    """
+    Returns the extracted text for a content hash, or None if not extracted.
+    """
+    with _session() as conn:
+        row = conn.execute("SELECT content FROM pdf_text WHERE sha256 = ?;", (sha256,)).fetchone()
+        return row[0] if row else None
+
+def forget_pdf_text(sha256: str | None) -> None:
+    """
+    Drops the extracted text for a content hash once no application uses it.
+    """
+    if not sha256:
+        return
+    with transaction() as conn:
+        conn.execute(
+            """
+            DELETE FROM pdf_text WHERE sha256 = ?
+            AND NOT EXISTS (SELECT 1 FROM applications WHERE sha256 = ?);
+            """,
+            (sha256, sha256),
+        )
+
+def fetch_file_index() -> List[Dict[str, Any]]:
+    """
+    Returns (id, file_path, sha256) for every application, in id order.
+    """
+    with _session() as conn:
+        return [dict(row) for row in conn.execute("SELECT id, file_path, sha256 FROM applications ORDER BY id;")]
+
+def fetch_file_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the integrity scanner's stat cache as {path: row}.
+    """
+    with _session() as conn:
+        return {row["path"]: dict(row) for row in conn.execute("SELECT * FROM file_stats;")}
+
+def save_file_stats(rows: Iterable[tuple]) -> None:
+    """
+    Upserts stat cache entries: (path, size, mtime_ns, inode, sha256) tuples.
+    """
+    with transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO file_stats (path, size, mtime_ns, inode, sha256) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size = excluded.size, mtime_ns = excluded.mtime_ns, inode = excluded.inode,
+                sha256 = excluded.sha256, checked_at = datetime('now');
+            """,
+            rows,
+        )
+
+def forget_file_stats(paths: Iterable[str]) -> None:
+    """
+    Drops stat cache entries for files that no longer exist.
+    """
+    with transaction() as conn:
+        conn.executemany("DELETE FROM file_stats WHERE path = ?;", ((p,) for p in paths))
+
+# Notes longer than this are read in full only when a caller asks for them.
+NOTES_PREVIEW_CHARS = 80
+
+# What list queries select instead of *: notes cut to a preview, plus the
+# full length so Application knows whether the preview is all there is.
+_LIST_COLUMNS = (
+    "id, company, role, date_applied, "
+    f"substr(notes, 1, {NOTES_PREVIEW_CHARS}) AS notes, length(notes) AS notes_length, "
+    "file_path, created_at, sha256, version"
+)
+
+class Application(MutableMapping):
+    """
+    One application row. Fields are attributes in __slots__ rather than a
+    dict per row, and company, role and date are interned, so a long result
+    list shares one string per distinct value; together that makes a row
+    several times smaller than dict(row); the content hash is held as raw
+    bytes and converted back on access. It still reads and writes like
+    the dicts this module used to return (app["company"], app.get("sha256"),
+    app.update(...), dict(app)).
+    Rows from list queries carry only a preview of long notes; reading
+    `notes` fetches the rest once. Columns outside the table (e.g. "rank")
+    are kept in a small side dict.
+    """
+    __slots__ = (
+        "id", "company", "role", "date_applied", "_notes", "_notes_complete",
+        "file_path", "created_at", "_sha", "version", "_extra",
+    )
+
+    FIELDS = ("id", "company", "role", "date_applied", "notes", "file_path", "created_at", "sha256", "version")
+    # Few distinct values each, repeated across many rows
+    _INTERNED = frozenset(("company", "role", "date_applied", "created_at"))
+
+    def __init__(self, **values: Any):
+        self._extra = None
+        self._notes = None
+        self._notes_complete = True
+        self._sha = None
+        for name in ("id", "company", "role", "date_applied", "file_path", "created_at", "version"):
+            setattr(self, name, None)
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def from_rows(cls, cursor: sqlite3.Cursor, rows: Iterable[Any]) -> List["Application"]:
+        """Builds records for rows fetched from `cursor`, looking column names up once."""
+        names = [d[0] for d in cursor.description]
+        return [cls._from_values(names, row) for row in rows]
+
+    @classmethod
+    def _from_values(cls, names: List[str], values: Iterable[Any]) -> "Application":
+        app = cls.__new__(cls)
+        app._extra = None
+        app._notes = None
+        app._notes_complete = True
+        app.created_at = app._sha = app.version = None
+        notes_length = None
+        for name, value in zip(names, values):
+            if name in cls._INTERNED:
+                setattr(app, name, sys.intern(value) if isinstance(value, str) else value)
+            elif name == "notes":
+                app._notes = value
+            elif name == "notes_length":
+                notes_length = value
+            elif name in cls.FIELDS:
+                setattr(app, name, value)
+            else:
+                if app._extra is None:
+                    app._extra = {}
+                app._extra[name] = value
+        if notes_length is not None and notes_length > NOTES_PREVIEW_CHARS:
+            app._notes_complete = False
+        return app
+
+    @property
+    def notes(self) -> str | None:
+        if not self._notes_complete:
+            self._notes = get_notes(self.id)
+            self._notes_complete = True
+        return self._notes
+
+    @notes.setter
+    def notes(self, value: str | None) -> None:
+        self._notes = value
+        self._notes_complete = True
+
+    @property
+    def sha256(self) -> str | None:
+        sha = self._sha
+        return sha.hex() if isinstance(sha, bytes) else sha
+
+    @sha256.setter
+    def sha256(self, value: str | None) -> None:
+        # Held as 32 raw bytes rather than 64 hex characters
+        try:
+            self._sha = bytes.fromhex(value) if value else value
+        except ValueError:
+            self._sha = value
+
+    @property
+    def notes_preview(self) -> str | None:
+        """The notes as loaded, without fetching the rest: enough for a table cell."""
+        return self._notes
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Application fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.FIELDS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELDS or bool(self._extra and key in self._extra)
+
+    def __repr__(self) -> str:
+        return f"Application(id={self.id!r}, company={self.company!r}, role={self.role!r}, date_applied={self.date_applied!r})"
+
+def get_notes(app_id: int) -> str | None:
+    """
+    Returns the full notes of one application.
+    """
+    with _session() as conn:
+        row = conn.execute("SELECT notes FROM applications WHERE id = ?;", (app_id,)).fetchone()
+        return row[0] if row else None
+
 # Whitelist allowed ORDER BYs to avoid SQL injection if this ever becomes user-controlled.
 _ALLOWED_ORDER_BYS = {
     "date_applied DESC, id DESC",
@@ -99,29 +1101,367 @@ _ALLOWED_ORDER_BYS = {
     "created_at DESC",
 }
 
-def fetch_all_applications(order_by: str = "date_applied DESC, id DESC") -> List[Dict[str, Any]]:
+def fetch_all_applications(order_by: str = "date_applied DESC, id DESC") -> List[Application]:
     """
-    Returns all applications as a list of dicts.
+    Returns all applications as Application records.
     """
     if order_by not in _ALLOWED_ORDER_BYS:
         order_by = "date_applied DESC, id DESC"
-    with _connect() as conn:
-        rows = conn.execute(f"SELECT * FROM applications ORDER BY {order_by};").fetchall()
-        return [dict(row) for row in rows]
 
-def get_application_by_id(app_id: int) -> Dict[str, Any] | None:
+    sql = f"SELECT {_LIST_COLUMNS} FROM applications ORDER BY {order_by};"
+    return _cached_applications(("all", order_by), sql, ())
+
+def _like_pattern(term: str) -> str:
+    """
+    Wraps a search term for a substring LIKE, escaping LIKE wildcards.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def fts_query(text: str, mode: str = "prefix") -> str | None:
+    """
+    Turns free text into a safe FTS5 MATCH expression.
+      prefix - every word must match the start of a token ("acm eng" finds "Acme Engineer")
+      phrase - the words must appear consecutively
+      all    - every word must match a whole token
+    Returns None if the text has no searchable words.
+    """
+    tokens = _FTS_TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    # Quote every token so user input can never be parsed as FTS5 syntax.
+    quoted = ['"' + t.replace('"', '""') + '"' for t in tokens]
+    if mode == "prefix":
+        return " ".join(q + "*" for q in quoted)
+    if mode == "phrase":
+        return '"' + " ".join(t.replace('"', '""') for t in tokens) + '"'
+    if mode == "all":
+        return " ".join(quoted)
+    raise ValueError(f"Unknown full-text mode: {mode}")
+
+def _filter_clause(
+    search: str | None,
+    min_date: str | None,
+    fulltext: bool = False,
+) -> tuple[str, List[Any]]:
+    """
+    Builds the WHERE clause shared by search_applications() and count_applications().
+    The date bound is a range predicate on idx_date_applied. The search term is
+    always a case-insensitive (LIKE is NOCASE for ASCII) substring match on
+    company, role and notes. With fulltext=True (and FTS5 available) rows whose
+    words start with the search words, in any field or in the text of the
+    archived PDF, match as well; so a full-text search finds everything the
+    substring search does, and more.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    if min_date:
+        clauses.append("date_applied >= ?")
+        params.append(min_date)
+    term = (search or "").strip()
+    if term:
+        pattern = _like_pattern(term)
+        match = fts_query(term) if fulltext and _fts_enabled else None
+        substring = "company LIKE ? ESCAPE '\\' OR role LIKE ? ESCAPE '\\' OR notes LIKE ? ESCAPE '\\'"
+        if match:
+            clauses.append(
+                f"({substring}"
+                " OR id IN (SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?)"
+                " OR sha256 IN (SELECT t.sha256 FROM pdf_text_fts JOIN pdf_text t ON t.id = pdf_text_fts.rowid"
+                " WHERE pdf_text_fts MATCH ?))"
+            )
+            params.extend([pattern, pattern, pattern, match, match])
+        else:
+            clauses.append(f"({substring})")
+            params.extend([pattern, pattern, pattern])
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+def _filter_key(search: str | None, min_date: str | None, fulltext: bool) -> tuple:
+    """
+    The part of a query cache key that identifies its filters, normalised
+    the way _filter_clause() reads them.
+    """
+    term = (search or "").strip()
+    return term, min_date or None, bool(fulltext and term)
+
+def search_applications(
+    search: str | None = None,
+    min_date: str | None = None,   # "YYYY-MM-DD", inclusive
+    order_by: str = "date_applied DESC, id DESC",
+    limit: int | None = None,
+    offset: int = 0,
+    fulltext: bool = False,
+) -> List[Application]:
+    """
+    Returns applications matching the search term and minimum date, filtered,
+    sorted and paged in SQL. Repeated calls are answered from the query cache
+    until the data changes.
+    """
+    if order_by not in _ALLOWED_ORDER_BYS:
+        order_by = "date_applied DESC, id DESC"
+    where, params = _filter_clause(search, min_date, fulltext)
+    sql = f"SELECT {_LIST_COLUMNS} FROM applications {where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([int(limit), int(offset)])
+
+    key = ("search", _filter_key(search, min_date, fulltext), order_by, limit, offset)
+    return _cached_applications(key, sql + ";", params)
+
+def count_applications(
+    search: str | None = None,
+    min_date: str | None = None,
+    fulltext: bool = False,
+) -> int:
+    """
+    Returns how many applications match the same filters as search_applications().
+    """
+    where, params = _filter_clause(search, min_date, fulltext)
+
+    def query() -> int:
+        with _session() as conn:
+            return int(conn.execute(f"SELECT COUNT(*) FROM applications {where};", params).fetchone()[0])
+
+    return _cached(("count", _filter_key(search, min_date, fulltext)), query)
+
+def iter_applications(
+    search: str | None = None,
+    min_date: str | None = None,
+    order_by: str = "date_applied DESC, id DESC",
+    fulltext: bool = False,
+    batch_size: int = 500,
+    limit: int | None = None,
+    offset: int = 0,
+) -> Iterator[Application]:
+    """
+    Yields the applications search_applications() would return, reading them
+    from one cursor `batch_size` rows at a time, so memory use does not grow
+    with the number of rows. Notes are read in full, for exports and other
+    callers that need every row's notes without a query per row. The whole
+    iteration sees a single snapshot of the table. Exhaust or close the
+    generator before writing on this thread.
+    """
+    if order_by not in _ALLOWED_ORDER_BYS:
+        order_by = "date_applied DESC, id DESC"
+    where, params = _filter_clause(search, min_date, fulltext)
+    sql = f"SELECT * FROM applications {where} ORDER BY {order_by}"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([int(limit), int(offset)])
+    with _session() as conn:
+        cur = conn.execute(sql + ";", params)
+        try:
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from Application.from_rows(cur, rows)
+        finally:
+            cur.close()
+
+# Seek keys for each allowed ordering: (column, "ASC" | "DESC"). id is
+# appended where the ordering alone is not unique, so every row has exactly
+# one position and a page boundary can never split or repeat a tie. The key
+# columns are all NOT NULL (created_at always has its default).
+_KEYSET_ORDERS: Dict[str, List[tuple[str, str]]] = {
+    "date_applied DESC, id DESC": [("date_applied", "DESC"), ("id", "DESC")],
+    "date_applied ASC, id ASC": [("date_applied", "ASC"), ("id", "ASC")],
+    "company ASC, date_applied DESC": [("company", "ASC"), ("date_applied", "DESC"), ("id", "DESC")],
+    "company DESC, date_applied DESC": [("company", "DESC"), ("date_applied", "DESC"), ("id", "DESC")],
+    "created_at DESC": [("created_at", "DESC"), ("id", "DESC")],
+}
+
+def page_cursor(row: Dict[str, Any], order_by: str = "date_applied DESC, id DESC") -> tuple:
+    """
+    Returns the keyset cursor for a row: pass it as `after` to fetch_page()
+    to continue right after that row in the same ordering.
+    """
+    keys = _KEYSET_ORDERS.get(order_by, _KEYSET_ORDERS["date_applied DESC, id DESC"])
+    return tuple(row[column] for column, _ in keys)
+
+def _keyset_query(
+    search: str | None,
+    min_date: str | None,
+    order_by: str,
+    fulltext: bool,
+    after: tuple | None,
+    limit: int,
+) -> tuple[str, List[Any]]:
+    """
+    Builds SELECT ... WHERE <filters> AND <seek predicate> ORDER BY <keys> LIMIT ?.
+    A uniform direction uses a row-value comparison, e.g.
+    (date_applied, id) < (?, ?), which SQLite answers with a single index
+    seek; mixed directions expand to the equivalent OR chain.
+    """
+    keys = _KEYSET_ORDERS.get(order_by, _KEYSET_ORDERS["date_applied DESC, id DESC"])
+    where, params = _filter_clause(search, min_date, fulltext)
+    if after is not None:
+        if len(after) != len(keys):
+            raise ValueError(f"Cursor has {len(after)} values, ordering needs {len(keys)}")
+        directions = {direction for _, direction in keys}
+        if len(directions) == 1:
+            op = "<" if directions == {"DESC"} else ">"
+            columns = ", ".join(column for column, _ in keys)
+            seek = f"({columns}) {op} ({', '.join('?' * len(keys))})"
+            seek_params = list(after)
+        else:
+            alternatives = []
+            seek_params = []
+            for i, (column, direction) in enumerate(keys):
+                terms = [f"{c} = ?" for c, _ in keys[:i]]
+                terms.append(f"{column} {'<' if direction == 'DESC' else '>'} ?")
+                alternatives.append("(" + " AND ".join(terms) + ")")
+                seek_params.extend(after[:i + 1])
+            seek = "(" + " OR ".join(alternatives) + ")"
+        where = f"{where} AND {seek}" if where else f"WHERE {seek}"
+        params.extend(seek_params)
+    order = ", ".join(f"{column} {direction}" for column, direction in keys)
+    params.append(int(limit))
+    return f"SELECT {_LIST_COLUMNS} FROM applications {where} ORDER BY {order} LIMIT ?;", params
+
+def fetch_page(
+    search: str | None = None,
+    min_date: str | None = None,
+    order_by: str = "date_applied DESC, id DESC",
+    limit: int = 200,
+    after: tuple | None = None,
+    fulltext: bool = False,
+) -> tuple[List[Application], tuple | None]:
+    """
+    Returns one page of the applications search_applications() would return,
+    starting after the row whose cursor is `after` (None for the first page),
+    and the cursor of the next page, or None if this was the last one.
+    Unlike LIMIT/OFFSET, a page deep into the results costs the same as the
+    first: the query seeks straight to the cursor instead of reading and
+    discarding every earlier row.
+    """
+    sql, params = _keyset_query(search, min_date, order_by, fulltext, after, limit)
+    if order_by not in _KEYSET_ORDERS:
+        order_by = "date_applied DESC, id DESC"
+    key = ("page", _filter_key(search, min_date, fulltext), order_by, limit, after)
+    rows = _cached_applications(key, sql, params)
+    next_after = page_cursor(rows[-1], order_by) if len(rows) == limit else None
+    return rows, next_after
+
+def iter_pages(
+    search: str | None = None,
+    min_date: str | None = None,
+    order_by: str = "date_applied DESC, id DESC",
+    fulltext: bool = False,
+    page_size: int = 500,
+    after: tuple | None = None,
+) -> Iterator[Application]:
+    """
+    Yields the matching applications lazily, reading them with one keyset
+    query per `page_size` rows. Memory stays flat and every page costs the
+    same however deep it is. Unlike iter_applications() no read is held open
+    between pages, so the caller may write to the database while iterating;
+    rows changed meanwhile are seen (or not) according to their new keys.
+    """
+    while True:
+        sql, params = _keyset_query(search, min_date, order_by, fulltext, after, page_size)
+        with _session() as conn:
+            cur = conn.execute(sql, params)
+            try:
+                rows = Application.from_rows(cur, cur.fetchmany(page_size))
+            finally:
+                cur.close()
+        yield from rows
+        if len(rows) < page_size:
+            return
+        after = page_cursor(rows[-1], order_by)
+
+def fulltext_search(
+    text: str,
+    mode: str = "prefix",
+    min_date: str | None = None,
+    limit: int = 50,
+) -> List[Application]:
+    """
+    Returns applications matching `text` in company, role or notes, best
+    match first (bm25, weighted towards company and role). Each row carries
+    its score in a "rank" key (lower is better).
+    Falls back to search_applications() when FTS5 is unavailable.
+    """
+    match = fts_query(text, mode)
+    if match is None:
+        return []
+    if not _fts_enabled:
+        return search_applications(search=text, min_date=min_date, limit=limit)
+    sql = f"""
+        SELECT a.*, bm25(applications_fts, {_FTS_WEIGHTS}) AS rank
+        FROM applications_fts
+        JOIN applications a ON a.id = applications_fts.rowid
+        WHERE applications_fts MATCH ?
+    """
+    params: List[Any] = [match]
+    if min_date:
+        sql += " AND a.date_applied >= ?"
+        params.append(min_date)
+    sql += " ORDER BY rank LIMIT ?;"
+    params.append(int(limit))
+    with _session() as conn:
+        cur = conn.execute(sql, params)
+        return Application.from_rows(cur, cur.fetchall())
+
+def get_application_by_id(app_id: int) -> Application | None:
     """
     Returns a single application by ID, or None if not found.
     """
-    with _connect() as conn:
-        row = conn.execute("SELECT * FROM applications WHERE id = ?;", (app_id,)).fetchone()
-        return dict(row) if row else None
+    with _session() as conn:
+        cur = conn.execute("SELECT * FROM applications WHERE id = ?;", (app_id,))
+        rows = Application.from_rows(cur, cur.fetchall())
+        return rows[0] if rows else None
     
+# Stay well under SQLite's bound-parameter limit in IN (...) lists.
+_IN_CHUNK = 500
+
+def get_applications_by_ids(app_ids: Iterable[int]) -> Dict[int, Application]:
+    """
+    Returns {id: application} for the ids that exist, via primary-key lookups.
+    """
+    ids = list(dict.fromkeys(int(i) for i in app_ids))
+    found: Dict[int, Application] = {}
+    with _session() as conn:
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            cur = conn.execute(f"SELECT * FROM applications WHERE id IN ({marks});", chunk)
+            for app in Application.from_rows(cur, cur.fetchall()):
+                found[app.id] = app
+    return found
+
+def retag_application(
+    app_id: int,
+    company: str,
+    role: str,
+    date_applied: str,
+    notes: str,
+    file_path: str,
+    version: int | None,
+) -> None:
+    """
+    Like update_application(), but also sets the version. Both change in one
+    statement so the row never transiently collides on idx_version.
+    """
+    with _session() as conn:
+        conn.execute(
+            """
+            UPDATE applications
+            SET company = ?, role = ?, date_applied = ?, notes = ?, file_path = ?, version = ?
+            WHERE id = ?;
+            """,
+            (company, role, date_applied, notes, file_path, version, app_id),
+        )
+
 def update_application(app_id: int, company: str, role: str, date_applied: str, notes: str, file_path: str) -> None:
     """
     Updates an application row.
     """
-    with _connect() as conn:
+    with _session() as conn:
         conn.execute(
             """
             UPDATE applications
@@ -130,13 +1470,19 @@ def update_application(app_id: int, company: str, role: str, date_applied: str,
             """,
             (company, role, date_applied, notes, file_path, app_id),
         )
-        conn.commit()
 
 def delete_application(app_id: int) -> None:
     """
     Deletes an application row by id.
     """
-    with _connect() as conn:
+    with _session() as conn:
         conn.execute("DELETE FROM applications WHERE id = ?;", (app_id,))
-        conn.commit()
+
+def delete_applications(app_ids: Iterable[int]) -> int:
+    """
+    Deletes many application rows in one transaction. Returns how many were deleted.
+    """
+    with transaction() as conn:
+        cur = conn.executemany("DELETE FROM applications WHERE id = ?;", ((int(i),) for i in app_ids))
+        return cur.rowcount
 
@@ -0,0 +1,263 @@
+# app/core/export.py
+from __future__ import annotations
+import csv
+import io
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.core import database
+
+# (column, type) in export order; type is "int" or "str"
+EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "int"),
+    ("company", "str"),
+    ("role", "str"),
+    ("date_applied", "str"),
+    ("notes", "str"),
+    ("file_path", "str"),
+    ("sha256", "str"),
+    ("version", "int"),
+    ("created_at", "str"),
+]
+
+EXPORT_FORMATS = ("csv", "jsonl", "columnar")
+
+# File suffix for each format, used by the GUI's save dialog
+FORMAT_SUFFIXES = {"csv": ".csv", "jsonl": ".jsonl", "columnar": ".cvcol"}
+
+# Called with the number of rows written so far, every ROW_GROUP_SIZE rows.
+ExportProgress = Callable[[int], None]
+
+ROW_GROUP_SIZE = 4096
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is stopped through its cancel event."""
+
+
+def export_applications(
+    dest: Union[str, Path, BinaryIO],
+    fmt: str = "csv",
+    search: Optional[str] = None,
+    min_date: Optional[str] = None,
+    order_by: str = "date_applied DESC, id DESC",
+    fulltext: bool = True,
+    progress: Optional[ExportProgress] = None,
+    cancel: Optional[threading.Event] = None,
+) -> int:
+    """
+    Write the applications matching the UI's filters to `dest` (a path, or a
+    binary file object) as CSV, JSON Lines or the columnar format. Rows are
+    streamed from one SQLite cursor, so memory use is bounded by a row group
+    however many rows there are. A path is written to a temporary file and
+    renamed into place, so a failed or cancelled export leaves nothing
+    behind. Returns the number of rows written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    rows = database.iter_applications(
+        search=search, min_date=min_date, order_by=order_by, fulltext=fulltext,
+        batch_size=ROW_GROUP_SIZE,
+    )
+    rows = _checked(rows, progress, cancel)
+    writer = {"csv": write_csv, "jsonl": write_jsonl, "columnar": write_columnar}[fmt]
+
+    try:
+        if not isinstance(dest, (str, Path)):
+            return writer(rows, dest)
+        dest = Path(dest)
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                count = writer(rows, out)
+            os.replace(tmp, dest)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return count
+    finally:
+        rows.close()
+
+
+def _checked(
+    rows: Iterator[Dict[str, Any]],
+    progress: Optional[ExportProgress],
+    cancel: Optional[threading.Event],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Pass rows through, reporting progress and honouring cancellation once
+    per row group.
+    """
+    count = 0
+    try:
+        for row in rows:
+            yield row
+            count += 1
+            if count % ROW_GROUP_SIZE == 0:
+                if cancel is not None and cancel.is_set():
+                    raise ExportCancelled("Export cancelled")
+                if progress is not None:
+                    progress(count)
+        if progress is not None:
+            progress(count)
+    finally:
+        rows.close()
+
+
+def write_csv(rows: Iterable[Dict[str, Any]], out: BinaryIO) -> int:
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(text)
+    names = [name for name, _ in EXPORT_COLUMNS]
+    writer.writerow(names)
+    count = 0
+    for row in rows:
+        writer.writerow([row[name] for name in names])
+        count += 1
+    text.flush()
+    text.detach()
+    return count
+
+
+def write_jsonl(rows: Iterable[Dict[str, Any]], out: BinaryIO) -> int:
+    names = [name for name, _ in EXPORT_COLUMNS]
+    count = 0
+    for row in rows:
+        out.write(json.dumps({name: row[name] for name in names}, ensure_ascii=False).encode("utf-8") + b"\n")
+        count += 1
+    return count
+
+
+# --- columnar format -----------------------------------------------------------
+#
+#   MAGIC
+#   row group*     one per ROW_GROUP_SIZE rows; each column in turn as
+#                  uint32 length + zlib(null bitmap + values)
+#                    int column: int64 per row (0 where null)
+#                    str column: uint32 offsets (rows + 1) + UTF-8 bytes
+#   footer         JSON: {"columns": [[name, type]...], "rows": n,
+#                         "row_groups": [{"offset": o, "rows": n}...]}
+#   uint32 footer length, MAGIC
+#
+# Integers are little-endian. Readers seek to the footer first, so a column
+# can be read without decoding the others.
+
+COLUMNAR_MAGIC = b"CVMCOL1\n"
+_U32 = struct.Struct("<I")
+_SWAP = sys.byteorder != "little"
+
+
+def _encode_column(values: List[Any], kind: str) -> bytes:
+    nulls = bytearray((len(values) + 7) // 8)
+    for i, value in enumerate(values):
+        if value is None:
+            nulls[i // 8] |= 1 << (i % 8)
+    if kind == "int":
+        body = array("q", (0 if v is None else int(v) for v in values))
+        if _SWAP:
+            body.byteswap()
+        payload = body.tobytes()
+    else:
+        encoded = [b"" if v is None else str(v).encode("utf-8") for v in values]
+        offsets = array("I", [0])
+        total = 0
+        for item in encoded:
+            total += len(item)
+            offsets.append(total)
+        if _SWAP:
+            offsets.byteswap()
+        payload = offsets.tobytes() + b"".join(encoded)
+    return zlib.compress(bytes(nulls) + payload, 6)
+
+
+def _decode_column(blob: bytes, kind: str, count: int) -> List[Any]:
+    data = zlib.decompress(blob)
+    nulls = data[:(count + 7) // 8]
+    data = data[(count + 7) // 8:]
+    if kind == "int":
+        values = array("q")
+        values.frombytes(data[:8 * count])
+        if _SWAP:
+            values.byteswap()
+        out: List[Any] = list(values)
+    else:
+        offsets = array("I")
+        offsets.frombytes(data[:4 * (count + 1)])
+        if _SWAP:
+            offsets.byteswap()
+        text = data[4 * (count + 1):]
+        out = [text[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+    for i in range(count):
+        if nulls[i // 8] & (1 << (i % 8)):
+            out[i] = None
+    return out
+
+
+def write_columnar(rows: Iterable[Dict[str, Any]], out: BinaryIO) -> int:
+    out.write(COLUMNAR_MAGIC)
+    offset = len(COLUMNAR_MAGIC)
+    groups = []
+    total = 0
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal offset
+        groups.append({"offset": offset, "rows": len(batch)})
+        for name, kind in EXPORT_COLUMNS:
+            chunk = _encode_column([row[name] for row in batch], kind)
+            out.write(_U32.pack(len(chunk)))
+            out.write(chunk)
+            offset += _U32.size + len(chunk)
+        batch.clear()
+
+    for row in rows:
+        batch.append(row)
+        total += 1
+        if len(batch) == ROW_GROUP_SIZE:
+            flush()
+    if batch:
+        flush()
+
+    footer = json.dumps({"columns": EXPORT_COLUMNS, "rows": total, "row_groups": groups}).encode("utf-8")
+    out.write(footer)
+    out.write(_U32.pack(len(footer)))
+    out.write(COLUMNAR_MAGIC)
+    return total
+
+
+def read_columnar(path: Union[str, Path], columns: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of a columnar export as dicts, one row group in memory at
+    a time. `columns` limits decoding to those columns.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar export")
+        f.seek(-(len(COLUMNAR_MAGIC) + _U32.size), os.SEEK_END)
+        (footer_len,) = _U32.unpack(f.read(_U32.size))
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is truncated")
+        f.seek(-(len(COLUMNAR_MAGIC) + _U32.size + footer_len), os.SEEK_END)
+        footer = json.loads(f.read(footer_len))
+        schema = [tuple(c) for c in footer["columns"]]
+        wanted = set(columns) if columns is not None else {name for name, _ in schema}
+
+        for group in footer["row_groups"]:
+            f.seek(group["offset"])
+            decoded = {}
+            for name, kind in schema:
+                (length,) = _U32.unpack(f.read(_U32.size))
+                if name in wanted:
+                    decoded[name] = _decode_column(f.read(length), kind, group["rows"])
+                else:
+                    f.seek(length, os.SEEK_CUR)
+            names = list(decoded)
+            for values in zip(*(decoded[n] for n in names)):
+                yield dict(zip(names, values))
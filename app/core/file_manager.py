@@ -4,11 +4,15 @@ import re
 import os
 import shutil
 import hashlib
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
 
 from app.core.database import archive_root
-from app.core import database
+from app.core import database, pdf_text
 
 
 def slugify(s: str) -> str:
@@ -35,18 +39,10 @@ def company_dir(company: str) -> Path:
 def next_version(company: str, role: str, date_str: str) -> int:
     """
     Determine the next available version number for a given company/role/date.
+    Versions are recorded in the database, so this is an index lookup rather
+    than a scan of the company directory.
     """
-    d = company_dir(company)
-    pattern = f"{date_str}__{slugify(company)}__{slugify(role)}__v"
-    existing = [p.name for p in d.glob("*.pdf") if p.name.startswith(pattern)]
-    if not existing:
-        return 1
-    versions = []
-    for name in existing:
-        match = re.search(r"__v(\\d+)\\.pdf$", name)
-        if match:
-            versions.append(int(match.group(1)))
-    return max(versions, default=0) + 1
+    return database.next_version(company, role, date_str)
 
 
 def make_filename(date_str: str, company: str, role: str, version: int) -> str:
@@ -56,33 +52,182 @@ def make_filename(date_str: str, company: str, role: str, version: int) -> str:
     return f"{date_str}__{slugify(company)}__{slugify(role)}__v{version}.pdf"
 
 
-def copy_to_archive(
-    src: Union[str, Path],
-    company: str,
-    role: str,
-    date_str: str,
-) -> Path:
+def archive_path_prefix(company: str, role: str, date_str: str) -> str:
+    """
+    Archive path up to the version number: appending f"{version}.pdf" gives
+    the same path as company_dir() / make_filename().
+    """
+    return str(company_dir(company) / f"{date_str}__{slugify(company)}__{slugify(role)}__v")
+
+
+_FILENAME_RE = re.compile(
+    r"^(?P<date>\d{4}-\d{2}-\d{2})__(?P<company>[a-z0-9]+(?:_[a-z0-9]+)*)__(?P<role>(?:[a-z0-9]+(?:_[a-z0-9]+)*)?)__v(?P<version>\d+)\.pdf$"
+)
+
+
+def parse_filename(name: str) -> Dict[str, Union[str, int]] | None:
     """
-    Copy a source PDF to the archive folder with standardized filename + versioning.
-    Returns the destination Path.
+    Inverse of make_filename(): pull date, company, role and version out of a
+    "YYYY-MM-DD__company__role__vN.pdf" name. Slugs come back with underscores
+    turned into spaces. Returns None if the name does not follow the convention.
+    """
+    match = _FILENAME_RE.match(Path(name).name.lower())
+    if not match:
+        return None
+    return {
+        "date": match.group("date"),
+        "company": match.group("company").replace("_", " "),
+        "role": match.group("role").replace("_", " "),
+        "version": int(match.group("version")),
+    }
+
+
+# How archived PDFs are stored:
+#   copy - every application gets its own full copy of the PDF (the original layout)
+#   blob - content is stored once under .blobs/, keyed by its SHA-256, and the
+#          human-readable archive names are hardlinks (or symlinks) to it
+STORAGE_MODES = ("copy", "blob")
+STORAGE_MODE = os.getenv("CVM_STORAGE_MODE", "copy")
+
+BLOB_DIR_NAME = ".blobs"
+
+
+def blob_path(sha256: str) -> Path:
+    """
+    Location of a blob in the content-addressed store, sharded two levels
+    deep so no directory grows too large: .blobs/ab/cd/abcd....pdf
+    """
+    return archive_root() / BLOB_DIR_NAME / sha256[:2] / sha256[2:4] / f"{sha256}.pdf"
+
+
+def store_blob(src: Union[str, Path], sha256: str) -> Path:
+    """
+    Add a file to the blob store unless its content is already there.
+    The copy is written to a temporary name and renamed into place, so a
+    blob is either complete or absent.
+    """
+    blob = blob_path(sha256)
+    if blob.exists():
+        return blob
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=blob.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, blob)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return blob
+
+
+STAGING_DIR_NAME = ".staging"
+
+
+def stage_file(src: Union[str, Path], sha256: str | None = None) -> Tuple[Path, bool]:
+    """
+    Put a PDF's bytes into the archive before its final name is known.
+    In copy mode this is a private copy under .staging/; in blob mode it is
+    the blob itself. Returns (staged path, is_blob). publish() then gives it
+    its versioned name.
     """
     src = Path(src).expanduser().resolve()
     if not src.exists() or not src.is_file():
         raise FileNotFoundError(f"Source file does not exist: {src}")
     if src.suffix.lower() != ".pdf":
         raise ValueError("Only PDF files are allowed")
+    if STORAGE_MODE == "blob":
+        return store_blob(src, sha256 or compute_hash(src)), True
+    staging = archive_root() / STAGING_DIR_NAME
+    staging.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=staging, suffix=".pdf")
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return Path(tmp), False
+
 
-    version = next_version(company, role, date_str)
-    fname = make_filename(date_str, company, role, version)
-    dest = company_dir(company) / fname
+def _link_no_clobber(source: Path, dest: Path, keep_source: bool) -> None:
+    """
+    Create `dest` from `source` without ever overwriting an existing file
+    (raises FileExistsError instead). Prefers a hardlink; blobs fall back to
+    an absolute symlink and then a copy, staged files to an exclusive rename.
+    """
+    try:
+        os.link(source, dest)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    if keep_source:
+        try:
+            os.symlink(source.resolve(), dest)
+            return
+        except FileExistsError:
+            raise
+        except OSError:
+            pass
+    # No links on this filesystem: claim the name exclusively, then fill it.
+    fd = os.open(dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    os.close(fd)
+    try:
+        if keep_source:
+            shutil.copy2(source, dest)
+        else:
+            os.replace(source, dest)
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
 
+
+def publish(source: Path, dest: Path, keep_source: bool = False) -> Path:
+    """
+    Give a staged file (or blob, with keep_source=True) its archive name.
+    An existing file at `dest` is never overwritten; a _dupN suffix is added
+    instead, and the path actually used is returned.
+    """
+    candidate = dest
     counter = 1
-    while dest.exists():
-        dest = dest.with_name(dest.stem + f"_dup{counter}" + dest.suffix)
-        counter += 1
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            _link_no_clobber(source, candidate, keep_source)
+            break
+        except FileExistsError:
+            candidate = dest.with_name(dest.stem + f"_dup{counter}" + dest.suffix)
+            counter += 1
+    if not keep_source:
+        source.unlink(missing_ok=True)
+    return candidate
+
 
-    shutil.copy2(src, dest)
-    return dest
+def discard_staged(staged: Path, is_blob: bool, sha256: str | None = None) -> None:
+    """
+    Throw away a staged file that will not be published.
+    """
+    if is_blob:
+        release_blob(sha256)
+    else:
+        staged.unlink(missing_ok=True)
+
+
+def release_blob(sha256: str | None) -> bool:
+    """
+    Remove a blob once no application references its hash any more.
+    Returns True if the blob was deleted.
+    """
+    if not sha256 or database.count_hash_references(sha256) > 0:
+        return False
+    blob = blob_path(sha256)
+    try:
+        blob.unlink()
+    except FileNotFoundError:
+        return False
+    return True
 
 
 def compute_hash(path: Union[str, Path]) -> str:
@@ -92,56 +237,488 @@ def compute_hash(path: Union[str, Path]) -> str:
     path = Path(path)
     h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
 
-def rename_file(app_id: int, company: str, role: str, date_str: str) -> str:
+
+# What to do when an imported PDF's content is already in the archive:
+#   skip        - import nothing, return the existing application
+#   link        - add a new application that points at the existing file
+#   new_version - store another copy under a new version, as before hashing existed
+DEDUP_POLICIES = ("skip", "link", "new_version")
+DEFAULT_DEDUP_POLICY = os.getenv("CVM_DEDUP_POLICY", "link")
+
+
+def find_duplicate(src: Union[str, Path]) -> Tuple[str, Optional[dict]]:
+    """
+    Hash a file and look the hash up in the archive.
+    Returns (sha256, existing application or None).
+    """
+    sha = compute_hash(src)
+    return sha, database.find_by_hash(sha)
+
+
+def import_pdf(
+    src: Union[str, Path],
+    company: str,
+    role: str,
+    date_str: str,
+    notes: str = "",
+    dedup: str = DEFAULT_DEDUP_POLICY,
+    sha256: str | None = None,
+) -> Tuple[int, str]:
+    """
+    Archive a PDF and record it, applying the dedup policy if its content
+    is already archived. Pass `sha256` when the file was already hashed
+    (e.g. by find_duplicate()) so it is not read twice.
+    Returns (application id, action) where action is "imported", "linked" or "skipped".
+    """
+    if dedup not in DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy: {dedup}")
+    if sha256:
+        sha, existing = sha256, database.find_by_hash(sha256)
+    else:
+        sha, existing = find_duplicate(Path(src).expanduser())
+
+    if existing and dedup == "skip":
+        return existing["id"], "skipped"
+    if existing and dedup == "link" and Path(existing["file_path"]).exists():
+        app_id = database.insert_application(
+            company, role, date_str, notes, existing["file_path"], sha256=sha
+        )
+        return app_id, "linked"
+
+    return _import_new(src, company, role, date_str, notes, sha), "imported"
+
+
+def _import_new(
+    src: Union[str, Path],
+    company: str,
+    role: str,
+    date_str: str,
+    notes: str,
+    sha: str,
+) -> int:
+    """
+    Stage the file, allocate its version and row in one transaction, then
+    publish it under its versioned name and queue its text for indexing.
+    """
+    staged, is_blob = stage_file(src, sha)
+    try:
+        row = record_staged(
+            [(company, role, date_str, notes, sha, archive_path_prefix(company, role, date_str))],
+            [(staged, is_blob)],
+        )[0]
+    except BaseException:
+        discard_staged(staged, is_blob, sha)
+        raise
+    try:
+        path = finish_publish(row, staged, is_blob)
+    except BaseException:
+        abandon_publish(row, staged, is_blob)
+        raise
+    pdf_text.index_later([(sha, path)])
+    return row["id"]
+
+
+def record_staged(rows: list, staged: list) -> list:
+    """
+    Insert rows for staged files (see database.insert_versioned_applications)
+    and journal their publish operations in the same transaction.
+    `staged` holds a (path, is_blob) pair per row. Each returned row carries
+    the "op_id" that finish_publish() clears.
+    """
+    with database.transaction():
+        inserted = database.insert_versioned_applications(rows)
+        for row, (path, is_blob), spec in zip(inserted, staged, rows):
+            row["sha256"] = spec[4]
+            row["op_id"] = database.journal_add(
+                "publish", row["id"], str(path), row["file_path"], sha256=spec[4], keep_source=is_blob
+            )
+    return inserted
+
+
+def finish_publish(row: dict, staged: Path, is_blob: bool) -> str:
+    """
+    Move a staged file to the path its new row was given. If that name is
+    unexpectedly taken (e.g. by a file from before versions were tracked)
+    the file gets a _dupN name and the row is updated to match.
+    """
+    path = publish(staged, Path(row["file_path"]), keep_source=is_blob)
+    with database.transaction():
+        if str(path) != row["file_path"]:
+            database.set_file_path(row["id"], str(path))
+        if row.get("op_id"):
+            database.journal_done([row["op_id"]])
+    return str(path)
+
+
+def abandon_publish(row: dict, staged: Path, is_blob: bool) -> None:
+    """
+    Undo record_staged() for a file that could not be published.
+    """
+    with database.transaction():
+        database.delete_application(row["id"])
+        if row.get("op_id"):
+            database.journal_done([row["op_id"]])
+    discard_staged(staged, is_blob, row.get("sha256"))
+
+
+def backfill_hashes(
+    workers: int = 8,
+    batch_size: int = 500,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Hash archived PDFs that predate the sha256 column, in parallel.
+    hashlib releases the GIL while hashing and file reads release it while
+    waiting on the disk, so threads keep every core busy without process
+    start-up costs. Rows whose file is missing are skipped.
+    Returns the number of rows hashed.
+    """
+    hashed = 0
+    after_id = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while True:
+            rows = database.fetch_unhashed(after_id=after_id, limit=batch_size)
+            if not rows:
+                break
+            after_id = rows[-1]["id"]
+            hashes = pool.map(hash_or_none, [r["file_path"] for r in rows])
+            pairs = [(sha, r["id"]) for sha, r in zip(hashes, rows) if sha]
+            if pairs:
+                database.set_hashes(pairs)
+            hashed += len(pairs)
+            if progress is not None:
+                progress(hashed)
+    return hashed
+
+
+def hash_or_none(path: str) -> Optional[str]:
+    """
+    compute_hash(), or None for a file that cannot be read.
+    """
+    try:
+        return compute_hash(path)
+    except OSError:
+        return None
+
+def rename_file(
+    app_id: int,
+    company: str,
+    role: str,
+    date_str: str,
+    notes: str | None = None,
+) -> str:
     """
     Renames the archived PDF when metadata changes.
     Looks up the current file path from DB, renames it,
     and updates the DB with the new path.
+    `notes` replaces the stored notes unless it is None.
     """
-    # 1. Get the current record
-    apps = database.fetch_all_applications(order_by="id ASC")
-    app = next((a for a in apps if a["id"] == app_id), None)
-    if not app:
-        raise FileNotFoundError(f"No application found with id {app_id}")
+    return rename_many([(app_id, company, role, date_str, notes)])[app_id]
+
 
-    old_path = Path(app["file_path"])
-    if not old_path.exists():
-        raise FileNotFoundError(f"File not found at {old_path}")
+def rename_many(changes: Iterable[Tuple[int, str, str, str, Optional[str]]]) -> Dict[int, str]:
+    """
+    Apply metadata changes to many applications at once:
+    (app_id, company, role, date_str, notes-or-None) tuples.
+    Rows are fetched by primary key and all updated in one transaction. Each
+    file moves to its standard name, with a newly allocated version if its
+    company/role/date changed; files shared by linked duplicates stay put.
+    The moves are journaled in the same transaction as the row updates, so a
+    crash part-way is finished at the next startup. Any other failure puts
+    the rows and the files moved so far back. Returns {app_id: new file path}.
+    """
+    changes = list(changes)
+    apps = database.get_applications_by_ids(c[0] for c in changes)
+    for app_id, *_ in changes:
+        app = apps.get(app_id)
+        if not app:
+            raise FileNotFoundError(f"No application found with id {app_id}")
+        if not Path(app["file_path"]).exists():
+            raise FileNotFoundError(f"File not found at {app['file_path']}")
 
-    # 2. Build new filename
-    safe_company = "".join(c for c in company if c.isalnum() or c in (" ", "_", "-")).strip().replace(" ", "_")
-    safe_role = "".join(c for c in role if c.isalnum() or c in (" ", "_", "-")).strip().replace(" ", "_")
-    new_name = f"{date_str}_{safe_company}_{safe_role}.pdf"
-    new_path = old_path.parent / new_name
+    # 1. Update every row and journal every move in one transaction; once it
+    #    commits, recover_pending_operations() can finish the moves after a crash.
+    moves: list = []  # (journal id, old path, new path)
+    new_paths: Dict[int, str] = {}
+    with database.transaction():
+        for app_id, company, role, date_str, notes in changes:
+            app = apps[app_id]
+            old_path = Path(app["file_path"])
+            same_key = (app["company"], app["role"], app["date_applied"]) == (company, role, date_str)
+            if same_key and app["version"] is not None:
+                version = app["version"]
+            else:
+                # Allocated inside the transaction, so it sees earlier renames in this batch
+                version = database.next_version(company, role, date_str)
 
-    # 3. Rename/move file
-    shutil.move(str(old_path), str(new_path))
+            target = company_dir(company) / make_filename(date_str, company, role, version)
+            if database.count_file_references(str(old_path)) > 1 or _is_name_for(old_path, target):
+                # Shared with a linked duplicate, or already named for this
+                # key and version (a notes-only edit): leave the file alone
+                new_path = old_path
+            else:
+                new_path = _free_name(target, taken={m[2] for m in moves})
+                op_id = database.journal_add("move", app_id, str(old_path), str(new_path))
+                moves.append((op_id, old_path, new_path))
 
-    # 4. Update DB
-    database.update_application(app_id, company, role, date_str, app["notes"], str(new_path))
+            database.retag_application(
+                app_id, company, role, date_str,
+                app["notes"] if notes is None else notes,
+                str(new_path), version,
+            )
+            new_paths[app_id] = str(new_path)
+
+    # 2. Move the files. On failure, put back the files and rows already changed.
+    done: list = []
+    try:
+        for op_id, old_path, new_path in moves:
+            _move_no_clobber(old_path, new_path)
+            done.append((old_path, new_path))
+    except BaseException:
+        for old_path, new_path in reversed(done):
+            try:
+                os.replace(new_path, old_path)
+            except OSError as e:
+                print(f"Warning: could not move {new_path} back to {old_path}: {e}")
+        with database.transaction():
+            for app in apps.values():
+                database.retag_application(
+                    app["id"], app["company"], app["role"], app["date_applied"],
+                    app["notes"], app["file_path"], app["version"],
+                )
+            database.journal_done(m[0] for m in moves)
+        raise
+
+    # 3. Everything is in place; retire the journal entries.
+    database.journal_done(m[0] for m in moves)
+    return new_paths
+
+
+def _is_name_for(path: Path, target: Path) -> bool:
+    """
+    True if `path` is `target` or one of the _dupN names _free_name() gives it.
+    """
+    if path == target:
+        return True
+    if path.parent != target.parent or path.suffix != target.suffix:
+        return False
+    return re.fullmatch(re.escape(target.stem) + r"_dup\d+", path.stem) is not None
+
+
+def _free_name(target: Path, taken: set = frozenset()) -> Path:
+    """
+    First of target, target_dup1, target_dup2, ... that does not exist yet.
+    """
+    candidate = target
+    counter = 1
+    while candidate.exists() or candidate in taken:
+        candidate = target.with_name(target.stem + f"_dup{counter}" + target.suffix)
+        counter += 1
+    return candidate
+
+
+def _move_no_clobber(src: Path, dst: Path) -> None:
+    """
+    Move a file within the archive. os.replace is a single atomic rename on
+    the same filesystem; the existence check keeps it from replacing a file
+    that appeared since the move was planned.
+    """
+    if dst.exists():
+        raise FileExistsError(f"Refusing to overwrite {dst}")
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(src, dst)
 
-    return str(new_path)
 
 def delete_application_and_file(app_id: int) -> None:
     """
     Deletes the PDF file and the DB record for an application.
     """
-    # Fetch current record
-    apps = database.fetch_all_applications(order_by="id ASC")
-    app = next((a for a in apps if a["id"] == app_id), None)
-    if not app:
-        raise FileNotFoundError(f"No application found with id {app_id}")
+    delete_many([app_id])
 
-    file_path = Path(app["file_path"])
-    if file_path.exists():
+
+def delete_many(app_ids: Iterable[int]) -> int:
+    """
+    Delete many applications and their PDFs. The rows go first, in one
+    transaction that also journals the file removals; then each file is
+    removed unless another row still uses it (linked duplicates), and blobs
+    are released once unreferenced.
+    Returns the number of applications deleted.
+    """
+    app_ids = list(app_ids)
+    apps = database.get_applications_by_ids(app_ids)
+    for app_id in app_ids:
+        if app_id not in apps:
+            raise FileNotFoundError(f"No application found with id {app_id}")
+
+    # Delete DB rows and journal the file removals in one transaction
+    with database.transaction():
+        deleted = database.delete_applications(app_ids)
+        op_ids = [
+            database.journal_add("delete", app["id"], app["file_path"], sha256=app.get("sha256"))
+            for app in apps.values()
+        ]
+
+    for app in apps.values():
+        _remove_unreferenced(app["file_path"], app.get("sha256"))
+    database.journal_done(op_ids)
+    return deleted
+
+
+def _remove_unreferenced(file_path: str, sha256: str | None) -> None:
+    """
+    Delete an archived file unless another row still uses it (linked
+    duplicates), and release its blob once unreferenced.
+    """
+    path = Path(file_path)
+    if path.exists() and database.count_file_references(file_path) == 0:
         try:
-            file_path.unlink()
+            path.unlink()
         except Exception as e:
-            print(f"Warning: could not delete file {file_path}: {e}")
+            print(f"Warning: could not delete file {path}: {e}")
+
+    # Drop the content itself once nothing references it
+    release_blob(sha256)
+    database.forget_pdf_text(sha256)
+
+
+# Staged files and journal entries younger than this may belong to an import
+# running in another process, so startup recovery leaves them alone.
+STAGING_GRACE_SECONDS = 3600
+
+
+def recover_pending_operations() -> Dict[str, int]:
+    """
+    Finish file operations that were journaled but interrupted, e.g. by a
+    crash. The database change behind every entry has already committed, so
+    each one is rolled forward. Entries owned by another process that is
+    still running are left to it. Cost is proportional to the number of
+    pending entries, not the size of the archive. Entries that still fail are
+    kept for the next start. Returns a count of entries replayed per operation.
+    """
+    counts: Dict[str, int] = {}
+    pending = database.journal_pending()
+    for entry in pending:
+        if _owned_elsewhere(entry):
+            continue
+        try:
+            _replay(entry)
+        except OSError as e:
+            print(f"Warning: could not replay {entry['op']} of {entry['src']}: {e}")
+            continue
+        database.journal_done([entry["id"]])
+        counts[entry["op"]] = counts.get(entry["op"], 0) + 1
+    _clean_staging(keep={e["src"] for e in pending if e["op"] == "publish"})
+    return counts
+
+
+def _owned_elsewhere(entry: dict) -> bool:
+    """
+    True if a journal entry belongs to another process that is still running.
+    Recovery runs before this process starts any file operation, so its own
+    entries are always stale. An owner older than STAGING_GRACE_SECONDS is
+    taken to be gone and its pid reused.
+    """
+    pid = entry.get("owner_pid")
+    if not pid or pid == os.getpid():
+        return False
+    try:
+        created = datetime.strptime(entry["created_at"], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return False
+    if time.time() - created.timestamp() > STAGING_GRACE_SECONDS:
+        return False
+    return _pid_alive(pid)
+
+
+def _pid_alive(pid: int) -> bool:
+    """
+    Whether a process with this id is running.
+    """
+    if os.name == "nt":
+        # os.kill() on Windows terminates the process; ask for its exit code instead
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED: exists, not ours
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _replay(entry: dict) -> None:
+    """
+    Roll one journaled file operation forward.
+    """
+    src = Path(entry["src"])
+    dst = Path(entry["dst"]) if entry["dst"] else None
+    if entry["op"] == "delete":
+        _remove_unreferenced(entry["src"], entry["sha256"])
+    elif entry["op"] == "move":
+        if src.exists() and not dst.exists():
+            _move_no_clobber(src, dst)
+        elif src.exists() and dst.exists() and os.path.samefile(src, dst):
+            src.unlink()
+    elif entry["op"] == "publish":
+        keep_source = bool(entry["keep_source"])
+        if dst.exists() and _is_published_copy(dst, src, entry["sha256"]):
+            # Published, but the staged copy was not removed yet
+            if not keep_source:
+                src.unlink(missing_ok=True)
+        elif src.exists():
+            # Not published yet, or its name was taken by an unrelated file:
+            # publish() then picks a _dupN name
+            path = publish(src, dst, keep_source=keep_source)
+            if path != dst:
+                database.set_file_path(entry["app_id"], str(path))
+        elif entry["app_id"] is not None:
+            # Neither the staged file nor the archive copy survived
+            print(f"Warning: dropping application {entry['app_id']}: its file was lost")
+            database.delete_application(entry["app_id"])
+    else:
+        raise OSError(f"Unknown journal operation {entry['op']}")
+
+
+def _is_published_copy(dst: Path, src: Path, sha256: Optional[str]) -> bool:
+    """
+    True if `dst` holds what publishing `src` produces: the same file, or
+    one with the same size and content hash.
+    """
+    if src.exists():
+        if os.path.samefile(src, dst):
+            return True
+        if src.stat().st_size != dst.stat().st_size:
+            return False
+        sha256 = sha256 or compute_hash(src)
+    return sha256 is not None and compute_hash(dst) == sha256
 
-    # Delete DB row
-    database.delete_application(app_id)
\ No newline at end of file
+
+def _clean_staging(keep: set) -> None:
+    """
+    Remove staged copies left behind by imports that never recorded a row.
+    """
+    staging = archive_root() / STAGING_DIR_NAME
+    if not staging.is_dir():
+        return
+    cutoff = time.time() - STAGING_GRACE_SECONDS
+    for path in staging.iterdir():
+        try:
+            # copy2 preserves the source mtime; ctime reflects when the copy was made
+            if str(path) not in keep and path.stat().st_ctime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,138 @@
+# app/core/inbox.py
+from __future__ import annotations
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from app.core import bulk_import, file_manager
+
+# Directory watched for new CVs; unset means no inbox.
+INBOX_DIR = os.getenv("CVM_INBOX_DIR", "")
+# A file must keep the same size and mtime this long before it is imported,
+# so half-written files are left alone.
+SETTLE_SECONDS = float(os.getenv("CVM_INBOX_SETTLE_SECONDS", "2"))
+
+# Processed files are moved into these subdirectories of the inbox.
+IMPORTED_DIR_NAME = "imported"
+FAILED_DIR_NAME = "failed"
+
+
+@dataclass
+class _Seen:
+    size: int
+    mtime_ns: int
+    stable_since: float
+
+
+class InboxWatcher:
+    """
+    Polls an inbox directory and imports PDFs named by the archive convention
+    ("YYYY-MM-DD__company__role__vN.pdf"), taking company, role and date from
+    the name. Files are imported in batches through bulk_import once they
+    have stopped changing, then moved to imported/ or failed/ so they are
+    never picked up twice.
+
+    Polling only stats the top level of the inbox, and the stat results are
+    kept between polls, so it stays cheap on large or network directories.
+    The Qt adaptor in app.ui.inbox_watcher calls poll() when the OS reports
+    a change; run() polls on a timer where no such notification exists.
+    """
+
+    def __init__(
+        self,
+        inbox: Union[str, Path],
+        settle_seconds: float = SETTLE_SECONDS,
+        batch_size: int = 50,
+        dedup: str = file_manager.DEFAULT_DEDUP_POLICY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.inbox = Path(inbox).expanduser()
+        self.settle_seconds = settle_seconds
+        self.batch_size = batch_size
+        self.dedup = dedup
+        self.clock = clock
+        self._seen: Dict[str, _Seen] = {}
+
+    def poll(self) -> List[Path]:
+        """
+        Stat the inbox and return the PDFs that have been stable for at least
+        settle_seconds, oldest first.
+        """
+        now = self.clock()
+        current: Dict[str, _Seen] = {}
+        ready = []
+        try:
+            entries = list(os.scandir(self.inbox))
+        except FileNotFoundError:
+            self._seen = {}
+            return []
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.lower().endswith(".pdf"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            previous = self._seen.get(entry.path)
+            if previous and (previous.size, previous.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                seen = previous
+            else:
+                seen = _Seen(st.st_size, st.st_mtime_ns, now)
+            current[entry.path] = seen
+            if st.st_size > 0 and now - seen.stable_since >= self.settle_seconds:
+                ready.append((st.st_mtime_ns, Path(entry.path)))
+        self._seen = current
+        return [path for _, path in sorted(ready)]
+
+    def ingest(self, paths: List[Path]) -> bulk_import.BulkImportResult:
+        """
+        Import files returned by poll() and move each one out of the inbox.
+        Files whose name does not carry the metadata go to failed/. Runs to
+        completion: a cancelled batch could not tell which files made it in.
+        """
+        items, failures = bulk_import.plan_imports(paths, {})
+        result = bulk_import.bulk_import(items, batch_size=self.batch_size, dedup=self.dedup)
+        result.failures = failures + result.failures
+
+        failed = {f.path for f in result.failures}
+        for path in paths:
+            self._move(path, FAILED_DIR_NAME if path in failed else IMPORTED_DIR_NAME)
+        return result
+
+    def _move(self, path: Path, subdir: str) -> None:
+        target_dir = self.inbox / subdir
+        target_dir.mkdir(exist_ok=True)
+        target = target_dir / path.name
+        counter = 1
+        while target.exists():
+            target = target_dir / f"{path.stem}_{counter}{path.suffix}"
+            counter += 1
+        try:
+            shutil.move(str(path), str(target))
+        except OSError as e:
+            print(f"Warning: could not move {path} to {target_dir}: {e}")
+        self._seen.pop(str(path), None)
+
+    def run(
+        self,
+        stop: threading.Event,
+        interval: float = 1.0,
+        on_result: Optional[Callable[[bulk_import.BulkImportResult], None]] = None,
+    ) -> None:
+        """
+        Poll every `interval` seconds until `stop` is set, importing whatever
+        is ready. For headless use; the GUI uses app.ui.inbox_watcher.
+        """
+        while not stop.is_set():
+            ready = self.poll()
+            if ready:
+                result = self.ingest(ready)
+                if on_result is not None:
+                    on_result(result)
+            stop.wait(interval)
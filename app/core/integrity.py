@@ -0,0 +1,317 @@
+# app/core/integrity.py
+from __future__ import annotations
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.database import archive_root
+from app.core import database, file_manager
+
+# Files the scanner itself maintains: never orphans.
+_PRIVATE_DIRS = (file_manager.BLOB_DIR_NAME, file_manager.STAGING_DIR_NAME)
+
+
+@dataclass
+class IntegrityReport:
+    """
+    Result of scan(). Every list holds plain dicts/strings so the report can
+    be written out as JSON with to_dict().
+    """
+    scanned: int = 0  # files stat'ed
+    hashed: int = 0   # files whose content was read, i.e. not served from the stat cache
+    missing: List[Dict[str, Any]] = field(default_factory=list)     # rows whose file is gone
+    drifted: List[Dict[str, Any]] = field(default_factory=list)     # rows whose file no longer matches its hash
+    unhashed: List[Dict[str, Any]] = field(default_factory=list)    # rows without a recorded hash
+    unreadable: List[Dict[str, Any]] = field(default_factory=list)  # files that exist but could not be hashed
+    orphans: List[Dict[str, Any]] = field(default_factory=list)     # archive PDFs no row points at
+    orphan_blobs: List[str] = field(default_factory=list)           # blobs no row references
+    stale_staging: List[str] = field(default_factory=list)          # staged copies no import will publish
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.drifted or self.unreadable or self.orphans
+                    or self.orphan_blobs or self.stale_staging)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), ok=self.ok)
+
+
+@dataclass
+class RepairAction:
+    """
+    One step of a repair plan.
+      restore       - put a copy of the row's content (from `source`) back at `path`
+      drop_row      - delete the row of a missing file nothing else can restore
+      rehash        - record the file's actual hash on the row
+      adopt         - add a row for an orphan named by make_filename()
+      remove_orphan - delete an orphan whose content is archived elsewhere
+      review        - orphan that needs a human; never applied
+      remove_blob   - delete an unreferenced blob
+      remove_staging- delete a leftover staged copy
+    """
+    action: str
+    path: str
+    app_id: Optional[int] = None
+    source: Optional[str] = None
+    sha256: Optional[str] = None
+    reason: str = ""
+
+
+# drop_row loses the row for good and review needs a person.
+SAFE_ACTIONS = ("restore", "rehash", "adopt", "remove_orphan", "remove_blob", "remove_staging")
+
+
+def _walk(root: Path, skip: Iterable[str] = ()) -> Iterable[Tuple[str, os.stat_result]]:
+    """
+    Yield (path, stat) for every PDF under root, following links to blobs.
+    Top-level directories named in `skip` are left out.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath == str(root):
+            dirnames[:] = [d for d in dirnames if d not in skip]
+        for name in filenames:
+            if not name.lower().endswith(".pdf"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                yield path, os.stat(path)
+            except OSError:
+                # Dangling symlink: its row shows up as missing
+                continue
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _hash_files(
+    paths: List[str],
+    workers: Optional[int],
+    progress: Optional[Callable[[int, int], None]],
+) -> Dict[str, Optional[str]]:
+    """
+    Hash files on a thread pool, like file_manager.backfill_hashes(): hashlib
+    releases the GIL while hashing, so threads use every core.
+    Returns {path: sha256 or None if unreadable}.
+    """
+    hashes: Dict[str, Optional[str]] = {}
+    total = len(paths)
+    if workers == 1:
+        results = map(file_manager.hash_or_none, paths)
+        pool = None
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+        results = pool.map(file_manager.hash_or_none, paths)
+    try:
+        for done, (path, sha) in enumerate(zip(paths, results), 1):
+            hashes[path] = sha
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return hashes
+
+
+def scan(
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> IntegrityReport:
+    """
+    Check every application's file against the archive and the archive
+    against the database. Files whose size, mtime and inode match the stat
+    cache keep their cached hash; only new or changed files are hashed, on a
+    thread pool of `workers` (default: one per CPU). `progress(done, total)`
+    reports hashing.
+    """
+    report = IntegrityReport()
+    root = archive_root()
+    rows = database.fetch_file_index()
+    cache = database.fetch_file_stats()
+
+    # Stat everything under the archive in one walk, then anything rows
+    # point at outside it.
+    on_disk: Dict[str, os.stat_result] = dict(_walk(root, skip=_PRIVATE_DIRS))
+    blobs: Dict[str, os.stat_result] = dict(_walk(root / file_manager.BLOB_DIR_NAME))
+    for row in rows:
+        path = row["file_path"]
+        if path not in on_disk:
+            try:
+                on_disk[path] = os.stat(path)
+            except OSError:
+                pass
+    report.scanned = len(on_disk) + len(blobs)
+
+    # Hash what the cache cannot vouch for
+    referenced = {row["file_path"] for row in rows}
+    to_hash = [
+        path for path, st in on_disk.items()
+        if path not in cache or _stat_key(st) != (cache[path]["size"], cache[path]["mtime_ns"], cache[path]["inode"])
+    ]
+    fresh = _hash_files(to_hash, workers, progress)
+    report.hashed = len(fresh)
+    actual = {path: cache[path]["sha256"] for path in on_disk if path not in fresh}
+    actual.update(fresh)
+
+    database.save_file_stats(
+        (path, *_stat_key(on_disk[path]), sha) for path, sha in fresh.items() if sha
+    )
+    database.forget_file_stats(path for path in cache if path not in on_disk)
+
+    for path, sha in fresh.items():
+        if sha is None:
+            report.unreadable.append({"path": path, "error": "could not be read"})
+
+    for row in rows:
+        path = row["file_path"]
+        if path not in on_disk:
+            report.missing.append({"id": row["id"], "file_path": path, "sha256": row["sha256"]})
+            continue
+        sha = actual.get(path)
+        if sha is None:
+            continue
+        if row["sha256"] is None:
+            report.unhashed.append({"id": row["id"], "file_path": path, "actual": sha})
+        elif row["sha256"] != sha:
+            report.drifted.append({"id": row["id"], "file_path": path, "expected": row["sha256"], "actual": sha})
+
+    for path in on_disk:
+        if path not in referenced and actual.get(path):
+            report.orphans.append({"path": path, "sha256": actual[path]})
+
+    known_hashes = {row["sha256"] for row in rows if row["sha256"]}
+    report.orphan_blobs = sorted(
+        path for path in blobs if Path(path).stem not in known_hashes
+    )
+
+    report.stale_staging = _stale_staging(root)
+    return report
+
+
+def _stale_staging(root: Path) -> List[str]:
+    """
+    Staged copies that no pending journal entry will publish and that are
+    too old to belong to an import still running.
+    """
+    staging = root / file_manager.STAGING_DIR_NAME
+    if not staging.is_dir():
+        return []
+    pending = {e["src"] for e in database.journal_pending() if e["op"] == "publish"}
+    cutoff = time.time() - file_manager.STAGING_GRACE_SECONDS
+    stale = []
+    for entry in os.scandir(staging):
+        try:
+            if entry.path not in pending and entry.stat().st_ctime < cutoff:
+                stale.append(entry.path)
+        except OSError:
+            continue
+    return sorted(stale)
+
+
+def repair_plan(report: IntegrityReport) -> List[RepairAction]:
+    """
+    Work out how to fix what scan() found. Nothing is changed; pass the plan
+    (or the parts of it you agree with) to apply_repairs().
+    """
+    plan: List[RepairAction] = []
+
+    # Where each piece of content can still be found
+    sources: Dict[str, str] = {}
+    for row in report.unhashed + report.drifted:
+        sources.setdefault(row["actual"], row["file_path"])
+    orphan_by_hash = {o["sha256"]: o["path"] for o in report.orphans}
+    present = set(sources)
+
+    used_orphans = set()
+    for row in report.missing:
+        sha = row["sha256"]
+        source = None
+        if sha:
+            blob = file_manager.blob_path(sha)
+            source = orphan_by_hash.get(sha) or sources.get(sha) or (str(blob) if blob.exists() else None)
+        if source is None:
+            # Content not seen this scan; a healthy row may still have it
+            existing = database.find_by_hash(sha) if sha else None
+            if existing and existing["id"] != row["id"] and Path(existing["file_path"]).exists():
+                source = existing["file_path"]
+        if source is not None:
+            plan.append(RepairAction("restore", row["file_path"], row["id"], source, sha, "file missing; content found elsewhere"))
+            if orphan_by_hash.get(sha) == source:
+                # The orphan is moved into place, so later rows copy from here
+                used_orphans.add(orphan_by_hash.pop(sha))
+            sources[sha] = row["file_path"]
+        else:
+            plan.append(RepairAction("drop_row", row["file_path"], row["id"], sha256=sha, reason="file missing; no copy of its content"))
+
+    for row in report.drifted:
+        plan.append(RepairAction("rehash", row["file_path"], row["id"], sha256=row["actual"], reason="content changed since import"))
+    for row in report.unhashed:
+        plan.append(RepairAction("rehash", row["file_path"], row["id"], sha256=row["actual"], reason="no hash recorded"))
+
+    for orphan in report.orphans:
+        path, sha = orphan["path"], orphan["sha256"]
+        if path in used_orphans:
+            continue
+        if sha in present or database.find_by_hash(sha) is not None:
+            plan.append(RepairAction("remove_orphan", path, sha256=sha, reason="content already archived"))
+        elif file_manager.parse_filename(Path(path).name):
+            plan.append(RepairAction("adopt", path, sha256=sha, reason="archive file name carries its metadata"))
+        else:
+            plan.append(RepairAction("review", path, sha256=sha, reason="unknown file in the archive"))
+
+    for path in report.orphan_blobs:
+        plan.append(RepairAction("remove_blob", path, sha256=Path(path).stem, reason="no application references this content"))
+    for path in report.stale_staging:
+        plan.append(RepairAction("remove_staging", path, reason="left over from an interrupted import"))
+    return plan
+
+
+def apply_repairs(plan: Iterable[RepairAction], actions: Iterable[str] = SAFE_ACTIONS) -> Dict[str, int]:
+    """
+    Carry out the steps of a repair plan whose action is in `actions`.
+    Steps that fail are reported and skipped. Returns a count per action.
+    """
+    actions = set(actions)
+    counts: Dict[str, int] = {}
+    for step in plan:
+        if step.action not in actions or step.action == "review":
+            continue
+        try:
+            _apply(step)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: could not {step.action} {step.path}: {e}")
+            continue
+        counts[step.action] = counts.get(step.action, 0) + 1
+    return counts
+
+
+def _apply(step: RepairAction) -> None:
+    path = Path(step.path)
+    if step.action == "restore":
+        source = Path(step.source)
+        # Orphans are moved into place; anything still in use is linked or copied
+        in_use = database.count_file_references(str(source)) > 0
+        keep_source = in_use or source.is_relative_to(archive_root() / file_manager.BLOB_DIR_NAME)
+        final = file_manager.publish(source, path, keep_source=keep_source)
+        if final != path:
+            database.set_file_path(step.app_id, str(final))
+    elif step.action == "drop_row":
+        database.delete_application(step.app_id)
+    elif step.action == "rehash":
+        database.set_hashes([(step.sha256, step.app_id)])
+    elif step.action == "adopt":
+        meta = file_manager.parse_filename(path.name)
+        with database.transaction():
+            app_id = database.insert_application(meta["company"], meta["role"], meta["date"], "", str(path), step.sha256)
+            try:
+                database.retag_application(app_id, meta["company"], meta["role"], meta["date"], "", str(path), meta["version"])
+            except sqlite3.IntegrityError:
+                pass  # version already taken; the row keeps a NULL version like a linked duplicate
+    elif step.action in ("remove_orphan", "remove_blob", "remove_staging"):
+        path.unlink(missing_ok=True)
+    else:
+        raise ValueError(f"Unknown repair action: {step.action}")
@@ -0,0 +1,182 @@
+# app/core/manifest.py
+from __future__ import annotations
+import csv
+import datetime
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from app.core import bulk_import, file_manager
+
+# Accepted column names for each field, first match wins
+FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "company": ("company",),
+    "role": ("role", "title"),
+    "date": ("date", "date_applied"),
+    "notes": ("notes",),
+    "pdf": ("pdf", "file", "path", "file_path"),
+}
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# progress(rows read, rows accepted) after every batch
+ManifestProgress = Callable[[int, int], None]
+
+
+@dataclass
+class ManifestRejection:
+    """
+    A manifest record that was not imported. `line` is the 1-based line of
+    the record in the file (for CSV, the header is line 1).
+    """
+    line: int
+    error: str
+
+
+@dataclass
+class ManifestResult:
+    rows: int = 0
+    accepted: int = 0
+    rejected: List[ManifestRejection] = field(default_factory=list)
+    imported: int = 0
+    linked: int = 0
+    skipped: int = 0
+    cancelled: bool = False
+    dry_run: bool = False
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def read_manifest(path: Union[str, Path], fmt: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Yield (line number, record) from a CSV or JSON Lines manifest, one record
+    at a time. The format follows the file suffix unless `fmt` is given.
+    """
+    path = Path(path)
+    fmt = fmt or ("jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv")
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        elif fmt == "jsonl":
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    record = {"__error__": f"Invalid JSON: {e.msg}"}
+                yield line_no, record if isinstance(record, dict) else {"__error__": "Not a JSON object"}
+        else:
+            raise ValueError(f"Unknown manifest format: {fmt}")
+
+
+def _field(record: Dict[str, Any], name: str) -> str:
+    for key in FIELD_ALIASES[name]:
+        value = record.get(key)
+        if value not in (None, ""):
+            return str(value).strip()
+    return ""
+
+
+def parse_record(record: Dict[str, Any], base_dir: Path) -> bulk_import.ImportItem:
+    """
+    Turn one manifest record into an ImportItem, or raise ValueError saying
+    why it is rejected. Relative PDF paths are resolved against base_dir.
+    """
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    company = _field(record, "company")
+    if not company:
+        raise ValueError("Missing company")
+    date = _field(record, "date")
+    if not _DATE_RE.match(date):
+        raise ValueError(f"Date must be YYYY-MM-DD, got {date!r}")
+    try:
+        datetime.date.fromisoformat(date)
+    except ValueError:
+        raise ValueError(f"Not a calendar date: {date}") from None
+    pdf = _field(record, "pdf")
+    if not pdf:
+        raise ValueError("Missing PDF path")
+    src = Path(pdf).expanduser()
+    if not src.is_absolute():
+        src = base_dir / src
+    if src.suffix.lower() != ".pdf":
+        raise ValueError(f"Not a PDF: {src}")
+    if not src.is_file():
+        raise ValueError(f"PDF not found: {src}")
+    return bulk_import.ImportItem(src, company, _field(record, "role"), date, _field(record, "notes"))
+
+
+def import_manifest(
+    path: Union[str, Path],
+    fmt: Optional[str] = None,
+    batch_size: int = 500,
+    workers: int = 4,
+    dry_run: bool = False,
+    dedup: str = file_manager.DEFAULT_DEDUP_POLICY,
+    progress: Optional[ManifestProgress] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ManifestResult:
+    """
+    Import a manifest of (company, role, date, notes, pdf) records. Records
+    are read, validated and imported `batch_size` at a time: each batch goes
+    through bulk_import, which copies the PDFs into the archive and inserts
+    the rows with executemany in one transaction. Memory use depends on the
+    batch size, not the manifest size.
+    With dry_run=True every record is validated but nothing is written; the
+    result still reports the rows that would be rejected and the throughput.
+    """
+    path = Path(path)
+    result = ManifestResult(dry_run=dry_run)
+    started = time.perf_counter()
+    records = read_manifest(path, fmt)
+    base_dir = path.parent
+    try:
+        while True:
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            items: List[bulk_import.ImportItem] = []
+            lines: Dict[Path, int] = {}
+            for line, record in batch:
+                result.rows += 1
+                try:
+                    item = parse_record(record, base_dir)
+                except ValueError as e:
+                    result.rejected.append(ManifestRejection(line, str(e)))
+                    continue
+                items.append(item)
+                lines.setdefault(item.src, line)
+
+            if items and not dry_run:
+                imported = bulk_import.bulk_import(
+                    items, batch_size=batch_size, workers=workers, dedup=dedup
+                )
+                result.imported += imported.imported
+                result.linked += imported.linked
+                result.skipped += imported.skipped
+                for failure in imported.failures:
+                    result.rejected.append(ManifestRejection(lines.get(failure.path, 0), failure.error))
+                result.accepted += len(items) - len(imported.failures)
+            else:
+                result.accepted += len(items)
+            if progress is not None:
+                progress(result.rows, result.accepted)
+    finally:
+        records.close()
+    result.seconds = time.perf_counter() - started
+    return result
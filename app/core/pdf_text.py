@@ -0,0 +1,362 @@
+# app/core/pdf_text.py
+from __future__ import annotations
+import multiprocessing
+import os
+import queue
+import re
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from app.core import database
+
+# Text kept per document; enough for any CV, bounded for odd files
+MAX_TEXT_CHARS = 200_000
+
+# Below this many files, extracting in-process beats a round trip to the pool.
+PROCESS_POOL_MIN_FILES = 8
+
+# Most files the background indexer takes off its queue at once
+INDEX_BATCH_SIZE = 50
+
+_STREAM_RE = re.compile(rb"stream\r?\n")
+_OBJ_RE = re.compile(rb"\d+\s+\d+\s+obj\b")
+# Streams that never hold page text
+_SKIP_MARKERS = (b"/Image", b"/XRef", b"/ObjStm", b"/Length1", b"/Length2", b"/FontFile", b"/Metadata", b"/EmbeddedFile")
+# Filters we cannot undo without dependencies
+_UNSUPPORTED_FILTERS = (b"/DCTDecode", b"/JPXDecode", b"/CCITTFaxDecode", b"/JBIG2Decode", b"/LZWDecode", b"/RunLengthDecode")
+
+_WHITESPACE = b" \t\r\n\f\x00"
+_DELIMITERS = b"()<>[]{}/%"
+_ESCAPES = {ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\f"}
+
+
+def _content_streams(data: bytes) -> Iterable[bytes]:
+    """
+    Yield the decoded bytes of every stream in the file that may contain page
+    content: unfiltered or FlateDecode, and not an image, font or xref stream.
+    """
+    for match in _STREAM_RE.finditer(data):
+        start = match.end()
+        end = data.find(b"endstream", start)
+        if end < 0:
+            break
+        head_start = max(0, match.start() - 2048)
+        objs = list(_OBJ_RE.finditer(data, head_start, match.start()))
+        header = data[objs[-1].end() if objs else head_start:match.start()]
+        if any(marker in header for marker in _SKIP_MARKERS):
+            continue
+        if any(f in header for f in _UNSUPPORTED_FILTERS):
+            continue
+        raw = data[start:end]
+        if b"/FlateDecode" in header or b"/Fl " in header or b"/Fl]" in header:
+            try:
+                # decompressobj tolerates the trailing EOL before endstream
+                raw = zlib.decompressobj().decompress(raw)
+            except zlib.error:
+                continue
+        elif b"/Filter" in header:
+            continue
+        if b"BT" in raw:
+            yield raw
+
+
+def _literal_string(data: bytes, i: int) -> Tuple[bytes, int]:
+    """Parse a (literal string) starting after its opening paren."""
+    out = bytearray()
+    depth = 1
+    n = len(data)
+    while i < n:
+        c = data[i]
+        if c == 0x5C:  # backslash
+            i += 1
+            if i >= n:
+                break
+            c = data[i]
+            if c in _ESCAPES:
+                out += _ESCAPES[c]
+            elif 0x30 <= c <= 0x37:
+                digits = data[i:i + 3]
+                j = 0
+                while j < len(digits) and 0x30 <= digits[j] <= 0x37:
+                    j += 1
+                out.append(int(digits[:j], 8) & 0xFF)
+                i += j - 1
+            elif c == 0x0D:
+                if data[i + 1:i + 2] == b"\n":
+                    i += 1
+            elif c != 0x0A:
+                out.append(c)
+        elif c == 0x28:
+            depth += 1
+            out.append(c)
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+            out.append(c)
+        else:
+            out.append(c)
+        i += 1
+    return bytes(out), i
+
+
+def _hex_string(data: bytes, i: int) -> Tuple[bytes, int]:
+    """Parse a <hex string> starting after its opening bracket."""
+    end = data.find(b">", i)
+    if end < 0:
+        end = len(data)
+    digits = re.sub(rb"[^0-9A-Fa-f]", b"", data[i:end])
+    if len(digits) % 2:
+        digits += b"0"
+    return bytes.fromhex(digits.decode("ascii")), end + 1
+
+
+def _decode(raw: bytes) -> str:
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", errors="ignore")
+    return raw.decode("latin-1")
+
+
+def _content_text(stream: bytes) -> str:
+    """
+    Collect the text shown by Tj, TJ, ' and " operators in a content stream,
+    with line breaks where the text position moves to a new line.
+    """
+    parts: List[str] = []
+    operands: list = []
+    array: Optional[list] = None
+    i = 0
+    n = len(stream)
+    while i < n:
+        c = stream[i]
+        if c in _WHITESPACE:
+            i += 1
+        elif c == 0x25:  # % comment
+            eol = stream.find(b"\n", i)
+            i = n if eol < 0 else eol + 1
+        elif c == 0x28:
+            value, i = _literal_string(stream, i + 1)
+            (array if array is not None else operands).append(value)
+        elif c == 0x3C:
+            if stream[i + 1:i + 2] == b"<":
+                i += 2
+            else:
+                value, i = _hex_string(stream, i + 1)
+                (array if array is not None else operands).append(value)
+        elif c == 0x3E:
+            i += 1
+        elif c == 0x5B:
+            array = []
+            i += 1
+        elif c == 0x5D:
+            operands.append(array or [])
+            array = None
+            i += 1
+        else:
+            j = i + 1
+            while j < n and stream[j] not in _WHITESPACE and stream[j] not in _DELIMITERS:
+                j += 1
+            token = stream[i:j]
+            i = j
+            if c == 0x2F or c in b"+-.0123456789":
+                if c != 0x2F:
+                    try:
+                        (array if array is not None else operands).append(float(token))
+                    except ValueError:
+                        pass
+                else:
+                    operands.append(token)
+                continue
+            op = token
+            if op == b"Tj" and operands and isinstance(operands[-1], bytes):
+                parts.append(_decode(operands[-1]))
+            elif op in (b"'", b'"') and operands and isinstance(operands[-1], bytes):
+                parts.append("\n" + _decode(operands[-1]))
+            elif op == b"TJ" and operands and isinstance(operands[-1], list):
+                for item in operands[-1]:
+                    if isinstance(item, bytes):
+                        parts.append(_decode(item))
+                    elif item < -250:
+                        # A large negative kern is how many generators write a space
+                        parts.append(" ")
+            elif op in (b"Td", b"TD") and len(operands) >= 2:
+                parts.append("\n" if operands[-1] else " ")
+            elif op in (b"T*", b"ET"):
+                parts.append("\n")
+            elif op == b"Tm":
+                parts.append("\n")
+            elif op == b"ID":
+                # Inline image data runs until EI
+                end = stream.find(b"EI", i)
+                i = n if end < 0 else end + 2
+            operands = []
+    return "".join(parts)
+
+
+def extract_text(path: Union[str, Path]) -> str:
+    """
+    Extract the text of a PDF without third-party libraries. Handles the
+    common case of unfiltered or FlateDecode content streams with text in
+    single-byte or UTF-16 strings; fonts that need a ToUnicode map to decode
+    come out as noise or not at all. Returns whitespace-normalised text.
+    """
+    data = Path(path).read_bytes()
+    chunks = []
+    size = 0
+    for stream in _content_streams(data):
+        text = _content_text(stream)
+        chunks.append(text)
+        size += len(text)
+        if size >= MAX_TEXT_CHARS:
+            break
+    text = "".join(chunks)
+    text = "".join(ch if ch.isprintable() or ch == "\n" else " " for ch in text)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)[:MAX_TEXT_CHARS]
+
+
+def _extract_or_empty(path: str) -> str:
+    # Module-level so the process pool can pickle it. A PDF that cannot be
+    # read or parsed is recorded with no text, so it is not retried forever.
+    try:
+        return extract_text(path)
+    except Exception:
+        return ""
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+_indexer: Optional[threading.Thread] = None
+
+
+def _shared_pool(workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    The process pool every extraction shares, started on first use and sized
+    by that caller's `workers`. Its processes come from a forkserver (spawn
+    where there is none), never a fork of this process: a fork of the
+    multi-threaded GUI can inherit a lock another thread holds and hang.
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next extraction starts a fresh one."""
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def index_files(pairs: Iterable[Tuple[str, str]], workers: Optional[int] = None) -> int:
+    """
+    Extract and store the text of (sha256, path) pairs whose content has not
+    been indexed yet, on the shared process pool when there are enough of
+    them. Blocks until done; returns the number of documents indexed.
+    """
+    pending = {}
+    for sha, path in pairs:
+        if sha and sha not in pending:
+            pending[sha] = path
+    if not pending:
+        return 0
+    done = database.extracted_hashes(pending)
+    todo = [(sha, path) for sha, path in pending.items() if sha not in done]
+    if not todo:
+        return 0
+    paths = [path for _, path in todo]
+    if workers == 1 or len(todo) < PROCESS_POOL_MIN_FILES:
+        texts = list(map(_extract_or_empty, paths))
+    else:
+        pool = _shared_pool(workers)
+        try:
+            texts = list(pool.map(_extract_or_empty, paths, chunksize=4))
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            raise
+    database.save_pdf_texts((sha, text) for (sha, _), text in zip(todo, texts))
+    return len(todo)
+
+
+def index_quietly(pairs: Iterable[Tuple[str, str]], workers: Optional[int] = None) -> None:
+    """
+    index_files() for import paths: a failure to index never fails the
+    import, and backfill() will pick the files up later.
+    """
+    try:
+        index_files(pairs, workers)
+    except Exception as e:
+        print(f"Warning: could not index PDF text: {e}")
+
+
+def index_later(pairs: Iterable[Tuple[str, str]]) -> None:
+    """
+    Queue (sha256, path) pairs for indexing on a background thread and
+    return at once, so an import never waits for extraction. Files still
+    queued when the process exits are left to backfill().
+    """
+    global _indexer
+    for pair in pairs:
+        _queue.put(pair)
+    with _lock:
+        if _indexer is None or not _indexer.is_alive():
+            _indexer = threading.Thread(target=_index_queued, name="pdf-text-indexer", daemon=True)
+            _indexer.start()
+
+
+def _index_queued() -> None:
+    # Body of the background indexer: takes whatever has queued up, up to
+    # INDEX_BATCH_SIZE files, and indexes it as one batch.
+    while True:
+        batch = [_queue.get()]
+        while len(batch) < INDEX_BATCH_SIZE:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            index_quietly(batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def wait_idle() -> None:
+    """
+    Block until every file queued by index_later() has been indexed.
+    """
+    _queue.join()
+
+
+def backfill(
+    workers: Optional[int] = None,
+    batch_size: int = 200,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Index every archived PDF whose content has no extracted text yet.
+    Work is committed a batch at a time, so an interrupted backfill resumes
+    where it stopped. Returns the number of documents indexed.
+    """
+    indexed = 0
+    after = ""
+    while True:
+        rows = database.fetch_unextracted(after=after, limit=batch_size)
+        if not rows:
+            break
+        after = rows[-1]["sha256"]
+        existing = [(r["sha256"], r["file_path"]) for r in rows if os.path.exists(r["file_path"])]
+        indexed += index_files(existing, workers)
+        if progress is not None:
+            progress(indexed)
+    return indexed
@@ -0,0 +1,159 @@
+# app/core/thumbnails.py
+from __future__ import annotations
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.core import database
+
+# Upper bound for rendered previews on disk
+MAX_DISK_BYTES = int(float(os.getenv("CVM_THUMBNAIL_CACHE_MB", "64")) * 1024 * 1024)
+# Previews kept decoded-ready in memory (a few hundred KiB each at most)
+MEMORY_ITEMS = 64
+
+THUMBNAIL_DIR_NAME = "thumbnails"
+
+
+def cache_dir() -> Path:
+    """
+    Directory holding rendered previews, next to the database.
+    """
+    return database.DATABASE_BASE_DIR / THUMBNAIL_DIR_NAME
+
+
+class ThumbnailCache:
+    """
+    Rendered previews keyed by (content hash, width), so every copy or
+    version of the same PDF shares one image and an edited file gets a new
+    one. Two tiers: the most recently used images in memory, and PNG files
+    on disk bounded to `max_bytes`, least recently used evicted first.
+    A disk hit bumps the file's mtime, which is the LRU order; the disk
+    total is measured once and then tracked, so a put never rescans.
+    Safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: int = MAX_DISK_BYTES,
+        memory_items: int = MEMORY_ITEMS,
+    ):
+        self.directory = Path(directory) if directory is not None else cache_dir()
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory: OrderedDict[Tuple[str, int], bytes] = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, sha256: str, width: int) -> Path:
+        return self.directory / sha256[:2] / f"{sha256}_{width}.png"
+
+    def _remember(self, key: Tuple[str, int], data: bytes) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def peek(self, sha256: str, width: int) -> Optional[bytes]:
+        """
+        The image if it is in the memory tier, without touching the disk;
+        cheap enough to call from the GUI thread.
+        """
+        with self._lock:
+            data = self._memory.get((sha256, width))
+            if data is not None:
+                self._memory.move_to_end((sha256, width))
+            return data
+
+    def get(self, sha256: str, width: int) -> Optional[bytes]:
+        """
+        The cached PNG for this content and width, or None.
+        """
+        data = self.peek(sha256, width)
+        if data is not None:
+            return data
+        path = self._path(sha256, width)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            self._remember((sha256, width), data)
+        return data
+
+    def put(self, sha256: str, width: int, data: bytes) -> None:
+        """
+        Store a rendered PNG in both tiers, then evict from disk down to
+        max_bytes.
+        """
+        path = self._path(sha256, width)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            old_size = path.stat().st_size
+        except OSError:
+            old_size = 0
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._remember((sha256, width), data)
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size in self._entries().values())
+            else:
+                self._disk_bytes += len(data) - old_size
+            if self._disk_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> Dict[Path, Tuple[int, int]]:
+        """{path: (mtime_ns, size)} of every cached file"""
+        entries = {}
+        if not self.directory.exists():
+            return entries
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for path in shard.glob("*.png"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries[path] = (st.st_mtime_ns, st.st_size)
+        return entries
+
+    def _evict(self) -> None:
+        # Called with the lock held. Trim to 90% so the next few puts don't
+        # each trigger another scan.
+        entries = sorted(self._entries().items(), key=lambda item: item[1][0])
+        total = sum(size for _, (_, size) in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, (_, size) in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+    def disk_usage(self) -> int:
+        """Bytes of previews currently on disk"""
+        with self._lock:
+            return sum(size for _, size in self._entries().values())
+
+    def clear(self) -> None:
+        """Drop every cached preview from memory and disk"""
+        with self._lock:
+            self._memory.clear()
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+            self._disk_bytes = 0
@@ -1,15 +1,75 @@
 # app/main.py
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from app.ui.main_window import MainWindow
-from app.core.database import init_db
+import time
+
+_START = time.perf_counter()
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase took. Enabled with --startup-timing
+    or CVM_STARTUP_TIMING=1; prints the breakdown to stderr once the first
+    search results are on screen. For a per-module view of import time, run
+    with `python -X importtime`.
+    """
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self._last = _START
+        self._marks = []
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._marks.append((phase, now - self._last))
+        self._last = now
+
+    def report(self):
+        if not self.enabled or not self._marks:
+            return
+        total = self._last - _START
+        for phase, seconds in self._marks:
+            print(f"[startup] {phase:<22} {seconds * 1000:8.1f} ms", file=sys.stderr)
+        print(f"[startup] {'total':<22} {total * 1000:8.1f} ms", file=sys.stderr)
+        self._marks = []
+
 
 def main():
+    timing_flag = "--startup-timing"
+    timer = StartupTimer(timing_flag in sys.argv or bool(os.getenv("CVM_STARTUP_TIMING")))
+    argv = [arg for arg in sys.argv if arg != timing_flag]
+
+    # Imported here so the timer can attribute their cost
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    timer.mark("import Qt")
+    from app.core.database import init_db
+    timer.mark("import app.core")
+    from app.ui.main_window import MainWindow
+    timer.mark("import main window")
+
     # Ensure DB exists before UI uses it
     db_file = init_db()
     print(f"[DB] Using database at: {db_file}")
+    timer.mark("init_db")
 
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
+    timer.mark("QApplication")
     window = MainWindow()
+    timer.mark("MainWindow()")
     window.show()
+    timer.mark("show()")
+    if timer.enabled:
+        QTimer.singleShot(0, lambda: timer.mark("event loop started"))
+
+        def first_results(_result):
+            timer.mark("first query")
+            timer.report()
+            window.search_pipeline.results_ready.disconnect(first_results)
+        window.search_pipeline.results_ready.connect(first_results)
     sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
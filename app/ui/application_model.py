@@ -0,0 +1,200 @@
+# app/ui/application_model.py
+from collections import OrderedDict
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from app.core import database
+
+
+# (column key, header label) in display order
+COLUMNS = [
+    ("company", "Company"),
+    ("role", "Role"),
+    ("date_applied", "Date Applied"),
+    ("notes", "Notes"),
+    ("file_path", "File Path"),
+]
+
+
+def query_first_page(search, min_date, page_size):
+    """
+    Run the count and first-page queries for a set of filters.
+    Safe to call from a worker thread; the result is handed to
+    ApplicationTableModel.apply_result() on the GUI thread.
+    The search box always matches substrings of company, role and notes, and
+    also words starting with what was typed, there or in the PDF text.
+    """
+    total = database.count_applications(search=search, min_date=min_date, fulltext=True)
+    first_page, next_after = database.fetch_page(
+        search=search, min_date=min_date, limit=page_size, fulltext=True
+    )
+    return {
+        "search": search,
+        "min_date": min_date,
+        "fulltext": True,
+        "total": total,
+        "first_page": first_page,
+        "next_after": next_after,
+    }
+
+
+class ApplicationTableModel(QAbstractTableModel):
+    """
+    Table model over the applications matching the current filters.
+    Rows are exposed to the view a page at a time through canFetchMore/fetchMore,
+    and row data is read from SQLite in pages when it is first painted. Only the
+    `max_cached_pages` most recently used pages are kept in memory.
+    Pages are read with keyset queries from the cursor where each one starts,
+    learned as the page before it is read, so scrolling deep into a large
+    result costs the same per page as the top. A page whose start is not yet
+    known (the scrollbar was dragged past it) falls back to LIMIT/OFFSET.
+    """
+
+    def __init__(self, page_size=200, max_cached_pages=20, parent=None):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self._search = ""
+        self._min_date = None
+        self._fulltext = True
+        self._total = 0   # rows matching the filters
+        self._loaded = 0  # rows the view currently knows about
+        self._pages = OrderedDict()  # page number -> list of row dicts, in LRU order
+        self._page_starts = {0: None}  # page number -> keyset cursor it starts after
+
+    # --- filters -------------------------------------------------------------
+
+    def set_filters(self, search="", min_date=None):
+        """Re-run the query with new filters and reset the view to the first page"""
+        self.apply_result(query_first_page(search, min_date, self.page_size))
+
+    def apply_result(self, result):
+        """Reset the view to a result produced by query_first_page()"""
+        self.beginResetModel()
+        self._search = result["search"]
+        self._min_date = result["min_date"]
+        self._fulltext = result.get("fulltext", True)
+        self._pages.clear()
+        self._page_starts = {0: None}
+        if result.get("next_after") is not None:
+            self._page_starts[1] = result["next_after"]
+        self._total = result["total"]
+        self._loaded = min(self.page_size, self._total)
+        if result["first_page"]:
+            self._pages[0] = result["first_page"]
+        self.endResetModel()
+
+    def filters(self):
+        """(search, min_date, fulltext) behind the rows currently shown"""
+        return self._search, self._min_date, self._fulltext
+
+    def reload(self):
+        """Re-run the current query, e.g. after rows were added or removed"""
+        self.set_filters(self._search, self._min_date)
+
+    # --- Qt model interface -------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal and 0 <= section < len(COLUMNS):
+            return COLUMNS[section][1]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        app = self.row_at(index.row())
+        if app is None:
+            return None
+        key = COLUMNS[index.column()][0]
+        if role == Qt.ItemDataRole.DisplayRole and key == "notes":
+            # The cell shows a line or two; full notes load only for a tooltip
+            return app.notes_preview or ""
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return app[key] or ""
+        if role == Qt.ItemDataRole.UserRole:
+            return app["id"]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.page_size, self._total - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    # --- row access -----------------------------------------------------------------
+
+    def row_at(self, row):
+        """Return the Application for a view row, reading its page if needed"""
+        if not 0 <= row < self._loaded:
+            return None
+        page_no, offset = divmod(row, self.page_size)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = self._read_page(page_no)
+            self._pages[page_no] = page
+            while len(self._pages) > self.max_cached_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[offset] if offset < len(page) else None
+
+    def _read_page(self, page_no):
+        """Read one page from SQLite, by keyset when its start is known"""
+        if page_no in self._page_starts:
+            page, next_after = database.fetch_page(
+                search=self._search,
+                min_date=self._min_date,
+                limit=self.page_size,
+                after=self._page_starts[page_no],
+                fulltext=self._fulltext,
+            )
+        else:
+            page = database.search_applications(
+                search=self._search,
+                min_date=self._min_date,
+                limit=self.page_size,
+                offset=page_no * self.page_size,
+                fulltext=self._fulltext,
+            )
+            next_after = database.page_cursor(page[-1]) if len(page) == self.page_size else None
+        if next_after is not None:
+            self._page_starts[page_no + 1] = next_after
+        return page
+
+    def app_id(self, row):
+        """Return the application id for a view row"""
+        app = self.row_at(row)
+        return app["id"] if app else None
+
+    def row_for_id(self, app_id):
+        """Return the view row of a cached application, or -1 if not in memory"""
+        for page_no, page in self._pages.items():
+            for offset, app in enumerate(page):
+                if app["id"] == app_id:
+                    return page_no * self.page_size + offset
+        return -1
+
+    def update_row(self, row, values):
+        """Patch a cached row in place after an edit and repaint it"""
+        app = self.row_at(row)
+        if app is None:
+            return
+        app.update(values)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(COLUMNS) - 1)
+        )
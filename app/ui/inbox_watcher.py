@@ -0,0 +1,78 @@
+# app/ui/inbox_watcher.py
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from app.core.inbox import InboxWatcher
+from app.ui.workers import BackgroundJob
+
+
+class InboxMonitor(QObject):
+    """
+    Runs an InboxWatcher inside the GUI. QFileSystemWatcher (inotify and
+    friends) wakes it as soon as the inbox changes; a slow timer keeps polling
+    for filesystems that send no notifications and to re-check files that
+    were still being written. Polling and importing happen on the thread
+    pool, one pass at a time.
+    """
+    imported = Signal(object)  # BulkImportResult
+    failed = Signal(str)
+
+    def __init__(self, inbox, poll_interval_ms=5000, parent=None):
+        super().__init__(parent)
+        self.watcher = InboxWatcher(inbox)
+        self.watcher.inbox.mkdir(parents=True, exist_ok=True)
+        self._job = None
+        self._again = False
+
+        self._fs_watcher = QFileSystemWatcher([str(self.watcher.inbox)], self)
+        self._fs_watcher.directoryChanged.connect(self._schedule_check)
+
+        # Coalesces bursts of change notifications into one pass
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(int(self.watcher.settle_seconds * 1000) + 100)
+        self._settle_timer.timeout.connect(self.check)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self.check)
+
+    def start(self):
+        self._poll_timer.start()
+        self.check()
+
+    def stop(self):
+        self._poll_timer.stop()
+        self._settle_timer.stop()
+
+    def _schedule_check(self, _path=None):
+        # Look now to start the stability clock, and again once it has run out
+        self.check()
+        self._settle_timer.start()
+
+    def check(self):
+        """Poll the inbox and import whatever has finished arriving"""
+        if self._job is not None:
+            self._again = True
+            return
+        watcher = self.watcher
+        job = BackgroundJob(lambda report, cancel: (
+            watcher.ingest(ready) if (ready := watcher.poll()) else None
+        ))
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        self._job = job
+        job.start()
+
+    def _on_finished(self, result):
+        self._job = None
+        if result is not None:
+            self.imported.emit(result)
+            # Files may have settled while this pass was importing
+            self._settle_timer.start()
+        if self._again:
+            self._again = False
+            self.check()
+
+    def _on_failed(self, message):
+        self._job = None
+        self.failed.emit(message)
@@ -2,288 +2,59 @@
 import os
 import subprocess
 import sys
-from PyQt6.QtCore import QDate, Qt, QPropertyAnimation, QRect, QEasingCurve
-from PyQt6.QtGui import QKeySequence, QShortcut, QFont, QPalette, QColor, QIcon
-from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QPushButton, QFrame,
-    QFileDialog, QTableWidget, QTableWidgetItem, QMessageBox,
-    QHeaderView, QHBoxLayout, QLineEdit, QLabel, QDateEdit, QDialog, 
-    QAbstractItemView, QSpacerItem, QSizePolicy, QGraphicsDropShadowEffect
+from PySide6.QtCore import QDate, Qt, QPropertyAnimation, QRect, QEasingCurve, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut, QFont, QPalette, QColor, QIcon
+from PySide6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QFrame,
+    QFileDialog, QMessageBox,
+    QHeaderView, QHBoxLayout, QLabel, QDialog, 
+    QAbstractItemView, QSpacerItem, QSizePolicy,
+    QProgressDialog, QSplitter
 )
-from app.core import file_manager, database
-from app.ui.import_dialog import ImportDialog
+from app.core import file_manager, bulk_import, inbox
+from app.ui.application_model import ApplicationTableModel, query_first_page
+from app.ui.inbox_watcher import InboxMonitor
+from app.ui.preview import PreviewPane
+from app.ui.search_pipeline import SearchPipeline
+from app.ui.theme import apply_theme
+from app.ui.widgets import Card, ModernButton, ModernDateEdit, ModernLineEdit, ModernTable, ShadowFrame
+from app.ui.workers import BackgroundJob
 
 
-class ModernButton(QPushButton):
-    """Custom button with modern macOS styling"""
-    def __init__(self, text, button_type="primary"):
-        super().__init__(text)
-        self.button_type = button_type
-        self._setup_style()
-    
-    def _setup_style(self):
-        if self.button_type == "primary":
-            self.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #4A90E2, stop: 1 #357ABD);
-                    border: 1px solid #2E5A8A;
-                    border-radius: 8px;
-                    color: white;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                    min-height: 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #5BA0F2, stop: 1 #408ACD);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #3A80D2, stop: 1 #2D6AAD);
-                }
-                QPushButton:disabled {
-                    background: #D3D3D3;
-                    border: 1px solid #A9A9A9;
-                    color: #808080;
-                }
-            """)
-        elif self.button_type == "secondary":
-            self.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #F8F8F8, stop: 1 #E8E8E8);
-                    border: 1px solid #C0C0C0;
-                    border-radius: 8px;
-                    color: #333333;
-                    font-weight: 500;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                    min-height: 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #FFFFFF, stop: 1 #F0F0F0);
-                    border: 1px solid #A0A0A0;
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #E0E0E0, stop: 1 #D0D0D0);
-                }
-                QPushButton:disabled {
-                    background: #F5F5F5;
-                    border: 1px solid #D0D0D0;
-                    color: #A0A0A0;
-                }
-            """)
-        elif self.button_type == "danger":
-            self.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #E74C3C, stop: 1 #C0392B);
-                    border: 1px solid #A93226;
-                    border-radius: 8px;
-                    color: white;
-                    font-weight: 600;
-                    font-size: 13px;
-                    padding: 8px 16px;
-                    min-height: 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #F85C4C, stop: 1 #D0493B);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 #D73C2C, stop: 1 #B0291B);
-                }
-            """)
-
-
-class ModernLineEdit(QLineEdit):
-    """Custom line edit with modern styling"""
-    def __init__(self, placeholder=""):
-        super().__init__()
-        self.setPlaceholderText(placeholder)
-        self.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #E0E0E0;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                background-color: white;
-                color: #333333;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4A90E2;
-                background-color: #FAFBFC;
-            }
-            QLineEdit:hover {
-                border: 2px solid #B0B0B0;
-            }
-        """)
-
-
-class ModernDateEdit(QDateEdit):
-    """Custom date edit with modern styling"""
-    def __init__(self):
-        super().__init__()
-        self.setStyleSheet("""
-            QDateEdit {
-                border: 2px solid #E0E0E0;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                background-color: white;
-                color: #333333;
-            }
-            QDateEdit:focus {
-                border: 2px solid #4A90E2;
-                background-color: #FAFBFC;
-            }
-            QDateEdit:hover {
-                border: 2px solid #B0B0B0;
-            }
-            QDateEdit::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #C0C0C0;
-                border-left-style: solid;
-                border-top-right-radius: 6px;
-                border-bottom-right-radius: 6px;
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #F8F8F8, stop: 1 #E8E8E8);
-            }
-            QDateEdit::drop-down:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #FFFFFF, stop: 1 #F0F0F0);
-            }
-            QDateEdit::drop-down:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #E0E0E0, stop: 1 #D0D0D0);
-            }
-            QDateEdit::down-arrow {
-                image: none;
-                border: none;
-                width: 0px;
-                height: 0px;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #666666;
-                margin: 2px;
-            }
-            QCalendarWidget {
-                background-color: white;
-                color: #333333;
-            }
-            QCalendarWidget QWidget {
-                alternate-background-color: #F5F5F5;
-                color: #333333;
-            }
-            QCalendarWidget QWidget#qt_calendar_navigationbar {
-                background-color: #4A7BA7;
-                color: white;
-            }
-            QCalendarWidget QToolButton {
-                color: white;
-                background-color: transparent;
-                font-weight: bold;
-            }
-            QCalendarWidget QAbstractItemView:enabled {
-                color: #333333;
-                background-color: white;
-                selection-background-color: #4A90E2;
-                selection-color: white;
-            }
-            QCalendarWidget QMenu {
-                color: #333333;
-                background-color: white;
-            }
-            QCalendarWidget QSpinBox {
-                color: #333333;
-                background-color: white;
-            }
-            QCalendarWidget QTableView {
-                color: #333333;
-                background-color: white;
-                gridline-color: #E0E0E0;
-            }
-        """)
-
-
-class ModernTable(QTableWidget):
-    """Custom table with modern macOS styling"""
-    def __init__(self):
-        super().__init__()
-        self._setup_style()
-    
-    def _setup_style(self):
-        self.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #E5E5E5;
-                background-color: white;
-                border: 1px solid #D0D0D0;
-                border-radius: 10px;
-                font-size: 13px;
-                color: #333333;
-            }
-            QTableWidget::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #F0F0F0;
-                color: #333333;
-            }
-            QTableWidget::item:selected {
-                background-color: #D6EBFF;
-                color: #1F1F1F;
-            }
-            QTableWidget::item:hover {
-                background-color: #F0F8FF;
-            }
-            QHeaderView::section {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 #FAFAFA, stop: 1 #E8E8E8);
-                border: none;
-                border-right: 1px solid #D0D0D0;
-                border-bottom: 2px solid #C0C0C0;
-                padding: 8px 12px;
-                font-weight: 600;
-                font-size: 12px;
-                color: #404040;
-            }
-            QHeaderView::section:first {
-                border-left: none;
-                border-top-left-radius: 10px;
-            }
-            QHeaderView::section:last {
-                border-right: none;
-                border-top-right-radius: 10px;
-            }
-        """)
+def _import_dialog(parent):
+    """Create an ImportDialog, loading its module on first use to keep it off the startup path"""
+    from app.ui.import_dialog import ImportDialog
+    return ImportDialog(parent)
 
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self._setup_window()
+        self._pending_selection = None
+        # Guards against a second concurrent bulk import; only
+        # _finish_bulk_import() clears it, never a search result
+        self._bulk_job = None
+        self._import_job = None
+        self._export_job = None
+        self.search_pipeline = SearchPipeline(query_first_page, parent=self)
+        self.search_pipeline.results_ready.connect(self._apply_search_result)
+        self.search_pipeline.search_failed.connect(self._show_search_error)
         self._setup_ui()
         self._setup_shortcuts()
-        self.refresh_table()
+        # The first query and the inbox start once the event loop is running,
+        # so the window paints without waiting on the database
+        QTimer.singleShot(0, self.refresh_table)
+        QTimer.singleShot(0, self._start_inbox)
 
     def _setup_window(self):
         """Configure main window properties"""
         self.setWindowTitle("CV Manager")
         self.resize(1000, 700)
         self.setMinimumSize(800, 600)
-        
-        # Apply modern macOS window styling
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #F5F5F7;
-            }
-        """)
+
+        # One application-wide stylesheet; widgets only carry names and properties
+        apply_theme()
 
     def _setup_ui(self):
         """Initialize and layout all UI components"""
@@ -314,13 +85,7 @@ class MainWindow(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         title_label = QLabel("CV Manager")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: 700;
-                color: #1F1F1F;
-            }
-        """)
+        title_label.setObjectName("appTitle")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         
@@ -328,29 +93,19 @@ class MainWindow(QMainWindow):
 
     def _create_buttons_section(self, layout):
         """Create action buttons section"""
-        buttons_frame = QFrame()
-        buttons_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #E0E0E0;
-            }
-        """)
+        buttons_frame = Card()
         buttons_layout = QHBoxLayout(buttons_frame)
         buttons_layout.setContentsMargins(20, 16, 20, 16)
         buttons_layout.setSpacing(12)
 
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 2)
-        buttons_frame.setGraphicsEffect(shadow)
-
         self.import_button = ModernButton("Import CV", "primary")
         self.import_button.clicked.connect(self.import_cv)
         buttons_layout.addWidget(self.import_button)
 
+        self.import_folder_button = ModernButton("Import Folder", "secondary")
+        self.import_folder_button.clicked.connect(self.import_folder)
+        buttons_layout.addWidget(self.import_folder_button)
+
         self.open_button = ModernButton("Open CV", "secondary")
         self.open_button.setEnabled(False)
         self.open_button.clicked.connect(self.open_selected_file)
@@ -361,48 +116,31 @@ class MainWindow(QMainWindow):
         self.edit_button.clicked.connect(self.edit_metadata)
         buttons_layout.addWidget(self.edit_button)
 
+        self.export_button = ModernButton("Export", "secondary")
+        self.export_button.clicked.connect(self.export_applications)
+        buttons_layout.addWidget(self.export_button)
+
         buttons_layout.addStretch()
 
         self.delete_button = ModernButton("Delete Application", "danger")
         self.delete_button.clicked.connect(self.delete_application)
         buttons_layout.addWidget(self.delete_button)
 
-        layout.addWidget(buttons_frame)
+        layout.addWidget(ShadowFrame(buttons_frame))
 
     def _create_filters_section(self, layout):
         """Create search and filter controls"""
-        filter_frame = QFrame()
-        filter_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #E0E0E0;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-                font-weight: 600;
-                font-size: 13px;
-                color: #404040;
-            }
-        """)
+        filter_frame = Card()
         filter_layout = QHBoxLayout(filter_frame)
         filter_layout.setContentsMargins(20, 16, 20, 16)
         filter_layout.setSpacing(16)
 
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 2)
-        filter_frame.setGraphicsEffect(shadow)
-
         # Search section
         search_label = QLabel("Search:")
         filter_layout.addWidget(search_label)
 
         self.search_input = ModernLineEdit("Company, Role, Notes...")
-        self.search_input.textChanged.connect(self.refresh_table)
+        self.search_input.textChanged.connect(self._schedule_search)
         filter_layout.addWidget(self.search_input)
 
         # Date filter section
@@ -415,7 +153,7 @@ class MainWindow(QMainWindow):
         self.date_filter.setSpecialValueText("Any")
         self.date_filter.setDateRange(QDate(1900, 1, 1), QDate(9999, 12, 31))
         self.date_filter.setDate(self.date_filter.minimumDate())
-        self.date_filter.dateChanged.connect(self.refresh_table)
+        self.date_filter.dateChanged.connect(self._schedule_search)
         filter_layout.addWidget(self.date_filter)
 
         filter_layout.addStretch()
@@ -424,23 +162,17 @@ class MainWindow(QMainWindow):
         self.clear_filter_btn.clicked.connect(self.clear_filters)
         filter_layout.addWidget(self.clear_filter_btn)
 
-        layout.addWidget(filter_frame)
+        layout.addWidget(ShadowFrame(filter_frame))
 
     def _create_table_section(self, layout):
         """Create main data table"""
         table_frame = QFrame()
-        table_frame.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border: none;
-            }
-        """)
         table_layout = QVBoxLayout(table_frame)
         table_layout.setContentsMargins(0, 0, 0, 0)
 
         self.table = ModernTable()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Company", "Role", "Date Applied", "Notes", "File Path"])
+        self.model = ApplicationTableModel(parent=self)
+        self.table.setModel(self.model)
         
         # Configure table properties
         header = self.table.horizontalHeader()
@@ -453,7 +185,7 @@ class MainWindow(QMainWindow):
         self.table.setAlternatingRowColors(True)
         self.table.setWordWrap(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         
         # Set minimum row height for better spacing
@@ -461,17 +193,28 @@ class MainWindow(QMainWindow):
         self.table.verticalHeader().hide()
 
         # Connect table events
-        self.table.cellDoubleClicked.connect(self.open_selected_file)
-        self.table.itemSelectionChanged.connect(self._update_buttons)
-
-        # Add shadow effect to table
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 4)
-        self.table.setGraphicsEffect(shadow)
-
-        table_layout.addWidget(self.table)
+        self.table.doubleClicked.connect(self.open_selected_file)
+        self.table.selectionModel().selectionChanged.connect(self._update_buttons)
+        self.table.selectionModel().currentRowChanged.connect(self._update_preview)
+
+        # Once scrolling pauses, render previews for the rows in view so
+        # selecting one shows its preview at once
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(150)
+        self._prefetch_timer.timeout.connect(self._prefetch_previews)
+        self.table.verticalScrollBar().valueChanged.connect(self._prefetch_timer.start)
+
+        self.preview = PreviewPane()
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        # Painted shadow: a graphics effect here would re-render and blur the
+        # whole viewport offscreen on every scroll
+        splitter.addWidget(ShadowFrame(self.table, blur=15, offset=4, alpha=40, radius=10))
+        splitter.addWidget(ShadowFrame(self.preview))
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 0)
+        table_layout.addWidget(splitter)
         layout.addWidget(table_frame)
 
     def _setup_shortcuts(self):
@@ -483,186 +226,421 @@ class MainWindow(QMainWindow):
         backspace_shortcut.activated.connect(self.delete_application)
 
     def refresh_table(self):
-        """Update table data with current filters applied"""
-        apps = database.fetch_all_applications()
+        """Update table data with current filters applied, without debouncing"""
+        self._request_search(immediate=True)
 
-        # Apply search filter
-        search_term = self.search_input.text().strip().lower()
+    def _schedule_search(self):
+        """Debounced refresh used while the user is typing or picking a date"""
+        self._request_search(immediate=False)
 
-        # Apply date filter
+    def _current_filters(self):
+        """Return (search text, min date or None) from the filter controls"""
         date_value = self.date_filter.date()
         min_date = None
         if date_value != self.date_filter.minimumDate():
             min_date = date_value.toString("yyyy-MM-dd")
+        return self.search_input.text().strip(), min_date
+
+    def _request_search(self, immediate):
+        """Queue a background query for the current filters"""
+        search, min_date = self._current_filters()
+
+        # Remember the selection so it survives the reload
+        selected_id = self._selected_app_id()
+        if selected_id is not None:
+            self._pending_selection = selected_id
+
+        # Search (full-text prefix match) and date filtering both happen in SQL,
+        # on a worker thread; a newer request supersedes this one
+        self.search_pipeline.request(
+            search,
+            min_date,
+            self.model.page_size,
+            immediate=immediate,
+        )
 
-        filtered = []
-        for app in apps:
-            # Search term filter
-            if search_term and not (
-                search_term in app["company"].lower()
-                or search_term in (app["role"] or "").lower()
-                or search_term in (app["notes"] or "").lower()
-            ):
-                continue
-
-            # Date filter
-            if min_date and app["date_applied"] < min_date:
-                continue
-
-            filtered.append(app)
-
-        self._populate_table(filtered)
-
-    def _populate_table(self, apps):
-        """Populate table with application data"""
-        self.table.setRowCount(len(apps))
-
-        for row_idx, app in enumerate(apps):
-            company_item = QTableWidgetItem(app["company"])
-            company_item.setData(Qt.ItemDataRole.UserRole, app["id"])
-            self.table.setItem(row_idx, 0, company_item)
-            
-            self.table.setItem(row_idx, 1, QTableWidgetItem(app["role"] or ""))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(app["date_applied"]))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(app["notes"] or ""))
-            self.table.setItem(row_idx, 4, QTableWidgetItem(app["file_path"]))
+    def _apply_search_result(self, result):
+        """Show the result of the most recent search"""
+        self.model.apply_result(result)
+        self._restore_selection(self._pending_selection)
+        self._pending_selection = None
+        self._update_buttons()
+        self._update_preview()
+        self._prefetch_timer.start()
+
+    def _show_search_error(self, message):
+        """Report a failed background search"""
+        QMessageBox.critical(self, "Error", f"Search failed:\n{message}")
+
+    def _selected_app_id(self):
+        """Return the id of the selected application, or None"""
+        row = self._current_row()
+        return self.model.app_id(row) if row >= 0 else None
+
+    def _current_row(self):
+        """Return the selected view row, or -1"""
+        if not self.table.selectionModel().hasSelection():
+            return -1
+        return self.table.currentIndex().row()
+
+    def _selected_rows(self):
+        """Return the selected view rows, in order"""
+        return sorted(index.row() for index in self.table.selectionModel().selectedRows())
+
+    def _restore_selection(self, app_id):
+        """Reselect an application after the model was reset, if it is on the first page"""
+        if app_id is None:
+            return
+        row = self.model.row_for_id(app_id)
+        if row >= 0:
+            self.table.selectRow(row)
 
     def clear_filters(self):
         """Reset all filters to default state"""
+        self.search_input.blockSignals(True)
+        self.date_filter.blockSignals(True)
         self.search_input.clear()
         self.date_filter.setDate(self.date_filter.minimumDate())
+        self.search_input.blockSignals(False)
+        self.date_filter.blockSignals(False)
         self.refresh_table()
 
     def import_cv(self):
         """Handle CV import process"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select CV PDF", "", "PDF Files (*.pdf)"
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select CV PDFs", "", "PDF Files (*.pdf)"
         )
-        if not file_path:
+        if not file_paths:
             return
+        if len(file_paths) > 1:
+            self._start_bulk_import(file_paths)
+            return
+        file_path = file_paths[0]
 
-        dialog = ImportDialog(self)
-        if dialog.exec() == dialog.DialogCode.Accepted:
-            data = dialog.get_data()
-            try:
-                archived_path = file_manager.copy_to_archive(
-                    file_path,
-                    data["company"],
-                    data["role"],
-                    data["date"]
-                )
-                database.insert_application(
-                    data["company"],
-                    data["role"],
-                    data["date"],
-                    data["notes"],
-                    str(archived_path)
-                )
-                self.refresh_table()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to import CV: {e}")
+        dialog = _import_dialog(self)
+        if dialog.exec() != dialog.DialogCode.Accepted:
+            return
+        data = dialog.get_data()
+        # Hash once, off the GUI thread; import_pdf() reuses the hash
+        self._run_import_job(
+            lambda report, cancel: file_manager.find_duplicate(file_path),
+            lambda found: self._continue_import(file_path, data, *found),
+        )
+
+    def _continue_import(self, file_path, data, sha, existing):
+        """Ask about a duplicate if there is one, then import in the background"""
+        dedup = "new_version"
+        if existing:
+            dedup = self._ask_dedup_policy(existing)
+            if dedup is None:
+                return
+        self._run_import_job(
+            lambda report, cancel: file_manager.import_pdf(
+                file_path,
+                data["company"],
+                data["role"],
+                data["date"],
+                data["notes"],
+                dedup=dedup,
+                sha256=sha,
+            ),
+            lambda _result: self.refresh_table(),
+        )
+
+    def _run_import_job(self, fn, on_done):
+        """Run one step of a single-file import on the thread pool"""
+        job = BackgroundJob(fn)
+        job.signals.finished.connect(on_done)
+        job.signals.failed.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"Failed to import CV: {message}")
+        )
+        # Keep the job alive until it reports back
+        self._import_job = job
+        job.start()
+
+    def _ask_dedup_policy(self, existing):
+        """Ask what to do with a PDF whose content is already archived"""
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle("Duplicate CV")
+        box.setText(
+            f"This PDF is identical to the CV already archived for "
+            f"{existing['company']} ({existing['date_applied']})."
+        )
+        link_button = box.addButton("Reuse Existing File", QMessageBox.ButtonRole.AcceptRole)
+        copy_button = box.addButton("Store New Version", QMessageBox.ButtonRole.ActionRole)
+        box.addButton("Skip", QMessageBox.ButtonRole.RejectRole)
+        box.setDefaultButton(link_button)
+        box.exec()
+        clicked = box.clickedButton()
+        if clicked is link_button:
+            return "link"
+        if clicked is copy_button:
+            return "new_version"
+        return None
+
+    def import_folder(self):
+        """Import every PDF under a folder"""
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of CVs")
+        if folder:
+            self._start_bulk_import([folder])
+
+    def _start_bulk_import(self, sources):
+        """Import many PDFs in the background with a cancellable progress dialog"""
+        if self._bulk_job is not None:
+            QMessageBox.information(self, "Import Running", "An import is already in progress.")
+            return
+
+        paths = bulk_import.collect_pdfs(sources)
+        if not paths:
+            QMessageBox.information(self, "Nothing to Import", "No PDF files were found.")
+            return
+
+        # Metadata for files that don't already follow the archive naming convention
+        dialog = _import_dialog(self)
+        dialog.setWindowTitle(f"Import {len(paths)} CVs")
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        items, failures = bulk_import.plan_imports(paths, dialog.get_data())
+
+        progress = QProgressDialog("Importing CVs...", "Cancel", 0, len(items), self)
+        progress.setWindowTitle("Import")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        job = BackgroundJob(lambda report, cancel: bulk_import.bulk_import(
+            items,
+            progress=lambda done, total, path: report(done, total, path.name),
+            cancel=cancel,
+        ))
+        job.signals.progress.connect(
+            lambda done, total, name: (progress.setValue(done), progress.setLabelText(f"Importing {name}"))
+        )
+        progress.canceled.connect(job.cancel.set)
+        job.signals.finished.connect(
+            lambda result: self._finish_bulk_import(progress, result, failures)
+        )
+        job.signals.failed.connect(
+            lambda message: self._finish_bulk_import(progress, None, failures, message)
+        )
+        self._bulk_job = job
+        job.start()
+
+    def _finish_bulk_import(self, progress, result, failures, error=None):
+        """Close the progress dialog and summarize a bulk import"""
+        self._bulk_job = None
+        progress.close()
+        self.refresh_table()
+        if error:
+            QMessageBox.critical(self, "Error", f"Import failed:\n{error}")
+            return
+
+        failures = failures + result.failures
+        summary = f"Imported {result.imported} CV(s)."
+        if result.linked:
+            summary += f" {result.linked} duplicate(s) reuse an existing file."
+        if result.skipped:
+            summary += f" {result.skipped} duplicate(s) skipped."
+        if result.cancelled:
+            summary += " The import was cancelled."
+        if failures:
+            details = "\n".join(f"{f.path.name}: {f.error}" for f in failures[:20])
+            if len(failures) > 20:
+                details += f"\n... and {len(failures) - 20} more"
+            QMessageBox.warning(self, "Import Finished", f"{summary}\n\n{len(failures)} file(s) failed:\n{details}")
+        else:
+            QMessageBox.information(self, "Import Finished", summary)
+
+    def export_applications(self):
+        """Export the applications matching the current filters, off the GUI thread"""
+        from app.core import export
+
+        if self._export_job is not None:
+            QMessageBox.information(self, "Export Running", "An export is already in progress.")
+            return
+        filters = {
+            "CSV (*.csv)": "csv",
+            "JSON Lines (*.jsonl)": "jsonl",
+            "Columnar (*.cvcol)": "columnar",
+        }
+        path, chosen = QFileDialog.getSaveFileName(
+            self, "Export Applications", "applications.csv", ";;".join(filters)
+        )
+        if not path:
+            return
+        fmt = filters.get(chosen, "csv")
+        if not os.path.splitext(path)[1]:
+            path += export.FORMAT_SUFFIXES[fmt]
+        # The model's filters, not the controls': export exactly what the table shows
+        search, min_date, fulltext = self.model.filters()
+
+        progress = QProgressDialog("Exporting applications...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Export")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        job = BackgroundJob(lambda report, cancel: export.export_applications(
+            path, fmt, search=search, min_date=min_date, fulltext=fulltext,
+            progress=lambda count: report(count, 0, f"Exported {count} rows"),
+            cancel=cancel,
+        ))
+        job.signals.progress.connect(lambda done, total, message: progress.setLabelText(message))
+        progress.canceled.connect(job.cancel.set)
+        job.signals.finished.connect(lambda count: self._finish_export(progress, path, count))
+        job.signals.failed.connect(lambda message: self._finish_export(progress, path, None, message))
+        self._export_job = job
+        job.start()
+
+    def _finish_export(self, progress, path, count, error=None):
+        """Close the export progress dialog and report the outcome"""
+        self._export_job = None
+        progress.close()
+        if error:
+            QMessageBox.warning(self, "Export", f"Export did not complete:\n{error}")
+        else:
+            self.statusBar().showMessage(f"Exported {count} application(s) to {path}", 10000)
+
+    def _start_inbox(self):
+        """Auto-import CVs dropped into the inbox directory, if one is configured"""
+        self.inbox_monitor = None
+        if not inbox.INBOX_DIR:
+            return
+        self.inbox_monitor = InboxMonitor(inbox.INBOX_DIR, parent=self)
+        self.inbox_monitor.imported.connect(self._on_inbox_imported)
+        self.inbox_monitor.failed.connect(
+            lambda message: self.statusBar().showMessage(f"Inbox import failed: {message}")
+        )
+        self.inbox_monitor.start()
+
+    def _on_inbox_imported(self, result):
+        """Show new rows from the inbox without interrupting the user"""
+        self.refresh_table()
+        message = f"Inbox: imported {result.imported + result.linked} CV(s)"
+        if result.failures:
+            message += f", {len(result.failures)} moved to '{inbox.FAILED_DIR_NAME}'"
+        self.statusBar().showMessage(message, 10000)
 
     def _update_buttons(self):
         """Update button states based on table selection"""
-        has_selection = bool(self.table.selectedItems())
+        has_selection = self.table.selectionModel().hasSelection()
         self.open_button.setEnabled(has_selection)
         self.edit_button.setEnabled(has_selection)
 
-    def open_selected_file(self):
-        """Open the selected CV file in default application"""
-        selected = self.table.currentRow()
-        if selected < 0:
+    def _update_preview(self, *_):
+        """Show the current row in the preview pane"""
+        row = self._current_row()
+        self.preview.show_application(self.model.row_at(row) if row >= 0 else None)
+
+    def _prefetch_previews(self):
+        """Queue preview renders for the rows currently in view"""
+        viewport = self.table.viewport()
+        first = self.table.rowAt(0)
+        if first < 0:
             return
+        last = self.table.rowAt(viewport.height() - 1)
+        if last < 0:
+            last = self.model.rowCount() - 1
+        self.preview.prefetch(self.model.row_at(row) for row in range(first, last + 1))
 
-        file_path_item = self.table.item(selected, 4)
-        if not file_path_item:
+    def open_selected_file(self):
+        """Open the selected CV file in default application"""
+        app = self.model.row_at(self.table.currentIndex().row())
+        if not app:
             return
 
-        file_path = file_path_item.text()
+        file_path = app["file_path"]
         if not os.path.exists(file_path):
             QMessageBox.warning(
                 self, "File Missing", f"The file does not exist:\n{file_path}"
             )
             return
 
+        # Launch the viewer and return at once; waiting on it would freeze the window
         try:
             if os.name == "nt":  # Windows
                 os.startfile(file_path)
-            elif sys.platform == "darwin":  # macOS
-                subprocess.run(["open", file_path])
-            else:  # Linux/Unix
-                subprocess.run(["xdg-open", file_path])
+            else:
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen(
+                    [opener, file_path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not open file:\n{e}")
     
     def edit_metadata(self):
-        """Edit metadata for selected application"""
-        row = self.table.currentRow()
-        if row < 0:
+        """Edit metadata for the selected application, or retag several at once"""
+        rows = self._selected_rows()
+        row = self._current_row()
+        if row not in rows and rows:
+            row = rows[0]
+        app = self.model.row_at(row)
+        if not app:
             QMessageBox.warning(self, "No Selection", "Please select a row to edit.")
             return
 
-        # Get application ID and current data
-        company_item = self.table.item(row, 0)
-        app_id = company_item.data(Qt.ItemDataRole.UserRole)
-
-        role = self.table.item(row, 1).text()
-        date_applied = self.table.item(row, 2).text()
-        notes = self.table.item(row, 3).text()
-
         # Show edit dialog with current values
-        dlg = ImportDialog(self)
-        dlg.company_input.setText(company_item.text())
-        dlg.role_input.setText(role)
-        dlg.date_input.setDate(QDate.fromString(date_applied, "yyyy-MM-dd"))
-        dlg.notes_input.setPlainText(notes)
-
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            data = dlg.get_data()
-            try:
-                new_path = file_manager.rename_file(
-                    app_id,
-                    data["company"],
-                    data["role"],
-                    data["date"],
-                )
-
-                # Update table immediately
-                self.table.item(row, 0).setText(data["company"])
-                self.table.item(row, 1).setText(data["role"])
-                self.table.item(row, 2).setText(data["date"])
-                self.table.item(row, 3).setText(data["notes"])
-                self.table.item(row, 4).setText(new_path)
+        dlg = _import_dialog(self)
+        dlg.company_input.setText(app["company"])
+        dlg.role_input.setText(app["role"] or "")
+        dlg.date_input.setDate(QDate.fromString(app["date_applied"], "yyyy-MM-dd"))
+        if len(rows) > 1:
+            # Retag: company/role/date apply to every row; notes are kept unless typed
+            dlg.setWindowTitle(f"Retag {len(rows)} Applications")
+        else:
+            dlg.notes_input.setPlainText(app["notes"] or "")
+
+        if dlg.exec() != QDialog.DialogCode.Accepted:
+            return
+        data = dlg.get_data()
+        notes = data["notes"] if len(rows) == 1 or data["notes"] else None
+        try:
+            new_paths = file_manager.rename_many(
+                (self.model.app_id(r), data["company"], data["role"], data["date"], notes)
+                for r in rows
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not update metadata:\n{e}")
+            return
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not update metadata:\n{e}")
+        if len(rows) == 1:
+            # Update table immediately
+            self.model.update_row(row, {
+                "company": data["company"],
+                "role": data["role"],
+                "date_applied": data["date"],
+                "notes": data["notes"],
+                "file_path": new_paths[app["id"]],
+            })
+        else:
+            self.refresh_table()
 
     def delete_application(self):
-        """Delete selected application after confirmation"""
-        selected = self.table.selectedItems()
-        if not selected:
-            return
-
-        row = self.table.currentRow()
-        if row < 0:
+        """Delete the selected applications after confirmation"""
+        rows = self._selected_rows()
+        if not rows:
             return
 
         # Confirmation dialog
+        if len(rows) == 1:
+            question = "Are you sure you want to delete this application?"
+        else:
+            question = f"Are you sure you want to delete these {len(rows)} applications?"
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
-            "Are you sure you want to delete this application?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            item = self.table.item(row, 0)
-            if item:
-                app_id = item.data(Qt.ItemDataRole.UserRole)
-                if app_id:
-                    try:
-                        file_manager.delete_application_and_file(app_id)
-                        self.refresh_table()
-                    except Exception as e:
-                        QMessageBox.critical(self, "Error", f"Failed to delete application: {e}")
\ No newline at end of file
+            app_ids = [app_id for app_id in (self.model.app_id(r) for r in rows) if app_id]
+            try:
+                file_manager.delete_many(app_ids)
+                self.refresh_table()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to delete application: {e}")
@@ -0,0 +1,167 @@
+# app/ui/preview.py
+import os
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QLabel, QSizePolicy, QVBoxLayout
+
+from app.core.thumbnails import ThumbnailCache
+from app.ui.widgets import Card
+
+# Preview width in device-independent pixels
+PREVIEW_WIDTH = 240
+
+
+def render_first_page(path, width):
+    """Render page one of a PDF to PNG bytes `width` pixels wide, with QtPdf"""
+    # Imported here so QtPdf loads on the first preview, not at startup
+    from PySide6.QtPdf import QPdfDocument
+
+    document = QPdfDocument()
+    try:
+        if document.load(path) != QPdfDocument.Error.None_ or document.pageCount() < 1:
+            raise ValueError("Could not read PDF")
+        page = document.pagePointSize(0)
+        height = max(1, round(width * page.height() / page.width())) if page.width() > 0 else round(width * 1.414)
+        image = document.render(0, QSize(width, height))
+        if image.isNull():
+            raise ValueError("Could not render PDF")
+        # Flatten onto white: PDF pages are transparent where nothing is drawn
+        flat = QImage(image.size(), QImage.Format.Format_RGB32)
+        flat.fill(Qt.GlobalColor.white)
+        painter = QPainter(flat)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        flat.save(buffer, "PNG")
+        buffer.close()
+        return bytes(data)
+    finally:
+        document.close()
+
+
+class _RenderSignals(QObject):
+    done = Signal(str, object)  # request key, PNG bytes or None
+
+
+class _RenderJob(QRunnable):
+    """Looks a preview up in the disk cache, rendering and storing it on a miss"""
+    def __init__(self, key, path, sha256, width, cache):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.sha256 = sha256
+        self.width = width
+        self.cache = cache
+        self.signals = _RenderSignals()
+
+    def run(self):
+        data = None
+        try:
+            if self.sha256:
+                data = self.cache.get(self.sha256, self.width)
+            if data is None:
+                data = render_first_page(self.path, self.width)
+                if self.sha256:
+                    self.cache.put(self.sha256, self.width, data)
+        except Exception:
+            data = None
+        self.signals.done.emit(self.key, data)
+
+
+class PreviewPane(Card):
+    """
+    Shows the first page of the selected CV. Images come from a
+    ThumbnailCache: a memory hit is shown straight away, anything else is
+    loaded from disk or rendered with QtPdf on a small thread pool of its
+    own, so previews never queue behind searches or wait on the GUI thread.
+    """
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or ThumbnailCache()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._jobs = {}
+        self._current = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        self.image_label = QLabel()
+        self.image_label.setObjectName("previewImage")
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setMinimumSize(PREVIEW_WIDTH, round(PREVIEW_WIDTH * 1.414))
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+        layout.addWidget(self.image_label)
+        self.caption = QLabel()
+        self.caption.setWordWrap(True)
+        self.caption.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.caption)
+        layout.addStretch()
+        self.show_application(None)
+
+    def _width(self):
+        """Render width in device pixels, so previews stay sharp on HiDPI screens"""
+        return round(PREVIEW_WIDTH * self.devicePixelRatioF())
+
+    @staticmethod
+    def _key(app, width):
+        return f"{app.get('sha256') or app['file_path']}:{width}"
+
+    def show_application(self, app):
+        """Show the preview for an application dict, or a placeholder for None"""
+        if app is None:
+            self._current = None
+            self.image_label.clear()
+            self.image_label.setText("No CV selected")
+            self.caption.clear()
+            return
+        width = self._width()
+        self._current = self._key(app, width)
+        self.caption.setText(os.path.basename(app["file_path"]))
+        data = self.cache.peek(app["sha256"], width) if app.get("sha256") else None
+        if data is not None:
+            self._show_image(data)
+            return
+        self.image_label.clear()
+        self.image_label.setText("Loading preview…")
+        self._request(app, width)
+
+    def prefetch(self, apps):
+        """Warm the cache for rows the user is likely to select next"""
+        width = self._width()
+        for app in apps:
+            if app and app.get("sha256") and self.cache.peek(app["sha256"], width) is None:
+                self._request(app, width)
+
+    def _request(self, app, width):
+        """Queue a render unless one for the same content is already running"""
+        key = self._key(app, width)
+        if key in self._jobs:
+            return
+        if not os.path.exists(app["file_path"]):
+            if key == self._current:
+                self.image_label.setText("File missing")
+            return
+        job = _RenderJob(key, app["file_path"], app.get("sha256"), width, self.cache)
+        job.signals.done.connect(self._on_rendered)
+        self._jobs[key] = job
+        self._pool.start(job)
+
+    def _on_rendered(self, key, data):
+        """Show a finished render if it is still the one wanted"""
+        self._jobs.pop(key, None)
+        if key != self._current:
+            return
+        if data is None:
+            self.image_label.setText("No preview available")
+        else:
+            self._show_image(data)
+
+    def _show_image(self, data):
+        """Display PNG bytes at the preview size"""
+        pixmap = QPixmap()
+        pixmap.loadFromData(data, "PNG")
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.image_label.setPixmap(pixmap)
@@ -0,0 +1,106 @@
+# app/ui/search_pipeline.py
+import os
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from app.core import database
+
+
+# Quiet period after the last keystroke before a query is started
+SEARCH_DEBOUNCE_MS = int(os.getenv("CVM_SEARCH_DEBOUNCE_MS", "200"))
+
+
+class _TaskSignals(QObject):
+    """Signals a worker uses to report back to the GUI thread"""
+    finished = Signal(int, object)  # generation, result
+    failed = Signal(int, str)       # generation, error message
+
+
+class _SearchTask(QRunnable):
+    """Runs one query on a pool thread; abandons it once it is superseded"""
+    def __init__(self, generation, query, args, is_stale, signals):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.args = args
+        self.is_stale = is_stale
+        self.signals = signals
+
+    def run(self):
+        stale = lambda: self.is_stale(self.generation)
+        if stale():
+            return
+        try:
+            with database.cancellable(stale):
+                result = self.query(*self.args)
+        except database.QueryCancelled:
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, result)
+
+
+class SearchPipeline(QObject):
+    """
+    Debounced, cancellable background queries.
+    Every request() supersedes the previous one: a pending debounce is restarted,
+    a query still running on the pool is interrupted inside SQLite, and only the
+    result of the most recent request is emitted through results_ready.
+    """
+    results_ready = Signal(object)
+    search_failed = Signal(str)
+
+    def __init__(self, query, debounce_ms=SEARCH_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.query = query
+        self._args = ()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._start)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+
+        self._signals = _TaskSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    def set_debounce(self, debounce_ms):
+        """Change the quiet period applied to subsequent requests"""
+        self._timer.setInterval(debounce_ms)
+
+    def request(self, *args, immediate=False):
+        """Schedule a query with these arguments, superseding any earlier one"""
+        with self._lock:
+            self._generation += 1
+        self._args = args
+        if immediate:
+            self._timer.stop()
+            self._start()
+        else:
+            self._timer.start()
+
+    def _is_stale(self, generation):
+        with self._lock:
+            return generation != self._generation
+
+    def _start(self):
+        with self._lock:
+            generation = self._generation
+        self._pool.start(
+            _SearchTask(generation, self.query, self._args, self._is_stale, self._signals)
+        )
+
+    def _on_finished(self, generation, result):
+        if not self._is_stale(generation):
+            self.results_ready.emit(result)
+
+    def _on_failed(self, generation, message):
+        if not self._is_stale(generation):
+            self.search_failed.emit(message)
@@ -0,0 +1,260 @@
+# app/ui/theme.py
+"""
+The application stylesheet. Widgets carry an objectName or a dynamic
+property (see app.ui.widgets) and this one sheet styles them all, so Qt
+parses it once per run instead of once per widget.
+"""
+import os
+
+from PySide6.QtWidgets import QApplication
+
+# "off" drops decorative effects (shadows) for slow machines or remote displays.
+UI_EFFECTS = os.getenv("CVM_UI_EFFECTS", "on").lower() not in ("off", "0", "false", "no")
+
+ACCENT = "#4A90E2"
+TEXT = "#333333"
+WINDOW = "#F5F5F7"
+
+# Gradients shared by buttons and the date drop-down
+_LIGHT_GRADIENT = "qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #F8F8F8, stop: 1 #E8E8E8)"
+_LIGHT_HOVER = "qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #FFFFFF, stop: 1 #F0F0F0)"
+_LIGHT_PRESSED = "qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #E0E0E0, stop: 1 #D0D0D0)"
+
+STYLESHEET = f"""
+QMainWindow, QDialog#importDialog {{
+    background-color: {WINDOW};
+}}
+
+/* --- cards and labels --- */
+QFrame#card {{
+    background-color: white;
+    border-radius: 12px;
+    border: 1px solid #E0E0E0;
+}}
+#card QLabel {{
+    background: transparent;
+    border: none;
+    font-weight: 600;
+    font-size: 13px;
+    color: #404040;
+}}
+QDialog #card QLabel {{
+    font-size: 14px;
+    margin-bottom: 6px;
+}}
+QLabel#appTitle {{
+    font-size: 24px;
+    font-weight: 700;
+    color: #1F1F1F;
+}}
+#card QLabel#dialogTitle {{
+    font-size: 18px;
+    font-weight: 700;
+    color: #1F1F1F;
+    margin-bottom: 12px;
+}}
+
+/* --- buttons: variant = primary | secondary | danger --- */
+QPushButton[variant] {{
+    border-radius: 8px;
+    font-size: 13px;
+    padding: 8px 16px;
+    min-height: 20px;
+}}
+QPushButton[variant][size="large"] {{
+    padding: 12px 24px;
+    min-width: 80px;
+}}
+QPushButton[variant="primary"] {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {ACCENT}, stop: 1 #357ABD);
+    border: 1px solid #2E5A8A;
+    color: white;
+    font-weight: 600;
+}}
+QPushButton[variant="primary"]:hover {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #5BA0F2, stop: 1 #408ACD);
+}}
+QPushButton[variant="primary"]:pressed {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #3A80D2, stop: 1 #2D6AAD);
+}}
+QPushButton[variant="primary"]:disabled {{
+    background: #D3D3D3;
+    border: 1px solid #A9A9A9;
+    color: #808080;
+}}
+QPushButton[variant="secondary"] {{
+    background: {_LIGHT_GRADIENT};
+    border: 1px solid #C0C0C0;
+    color: {TEXT};
+    font-weight: 500;
+}}
+QPushButton[variant="secondary"]:hover {{
+    background: {_LIGHT_HOVER};
+    border: 1px solid #A0A0A0;
+}}
+QPushButton[variant="secondary"]:pressed {{
+    background: {_LIGHT_PRESSED};
+}}
+QPushButton[variant="secondary"]:disabled {{
+    background: #F5F5F5;
+    border: 1px solid #D0D0D0;
+    color: #A0A0A0;
+}}
+QPushButton[variant="danger"] {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #E74C3C, stop: 1 #C0392B);
+    border: 1px solid #A93226;
+    color: white;
+    font-weight: 600;
+}}
+QPushButton[variant="danger"]:hover {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #F85C4C, stop: 1 #D0493B);
+}}
+QPushButton[variant="danger"]:pressed {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #D73C2C, stop: 1 #B0291B);
+}}
+
+/* --- input fields --- */
+QLineEdit[field], QDateEdit[field], QTextEdit[field] {{
+    border: 2px solid #E0E0E0;
+    border-radius: 8px;
+    padding: 8px 12px;
+    font-size: 13px;
+    background-color: white;
+    color: {TEXT};
+}}
+QLineEdit[field][size="large"], QDateEdit[field][size="large"], QTextEdit[field][size="large"] {{
+    padding: 12px 16px;
+    font-size: 14px;
+    min-height: 16px;
+}}
+QTextEdit[field] {{
+    min-height: 60px;
+    max-height: 120px;
+}}
+QLineEdit[field]:focus, QDateEdit[field]:focus, QTextEdit[field]:focus {{
+    border: 2px solid {ACCENT};
+    background-color: #FAFBFC;
+}}
+QLineEdit[field]:hover, QDateEdit[field]:hover, QTextEdit[field]:hover {{
+    border: 2px solid #B0B0B0;
+}}
+QDateEdit[field]::drop-down {{
+    subcontrol-origin: padding;
+    subcontrol-position: top right;
+    width: 20px;
+    border-left: 1px solid #C0C0C0;
+    border-top-right-radius: 6px;
+    border-bottom-right-radius: 6px;
+    background: {_LIGHT_GRADIENT};
+}}
+QDateEdit[field][size="large"]::drop-down {{
+    width: 24px;
+}}
+QDateEdit[field]::drop-down:hover {{
+    background: {_LIGHT_HOVER};
+}}
+QDateEdit[field]::drop-down:pressed {{
+    background: {_LIGHT_PRESSED};
+}}
+QDateEdit[field]::down-arrow {{
+    image: none;
+    border: none;
+    width: 0px;
+    height: 0px;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 6px solid #666666;
+    margin: 2px;
+}}
+
+/* --- calendar pop-up --- */
+QCalendarWidget {{
+    background-color: white;
+    color: {TEXT};
+}}
+QCalendarWidget QWidget {{
+    alternate-background-color: #F5F5F5;
+    color: {TEXT};
+}}
+QCalendarWidget QWidget#qt_calendar_navigationbar {{
+    background-color: #4A7BA7;
+    color: white;
+}}
+QCalendarWidget QToolButton {{
+    color: white;
+    background-color: transparent;
+    font-weight: bold;
+}}
+QCalendarWidget QAbstractItemView:enabled {{
+    color: {TEXT};
+    background-color: white;
+    selection-background-color: {ACCENT};
+    selection-color: white;
+}}
+QCalendarWidget QMenu, QCalendarWidget QSpinBox {{
+    color: {TEXT};
+    background-color: white;
+}}
+QCalendarWidget QTableView {{
+    color: {TEXT};
+    background-color: white;
+    gridline-color: #E0E0E0;
+}}
+
+/* --- applications table --- */
+QTableView#applicationTable {{
+    gridline-color: #E5E5E5;
+    background-color: white;
+    border: 1px solid #D0D0D0;
+    border-radius: 10px;
+    font-size: 13px;
+    color: {TEXT};
+}}
+QTableView#applicationTable::item {{
+    padding: 12px 8px;
+    border-bottom: 1px solid #F0F0F0;
+    color: {TEXT};
+}}
+QTableView#applicationTable::item:selected {{
+    background-color: #D6EBFF;
+    color: #1F1F1F;
+}}
+QTableView#applicationTable::item:hover {{
+    background-color: #F0F8FF;
+}}
+QTableView#applicationTable QHeaderView::section {{
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #FAFAFA, stop: 1 #E8E8E8);
+    border: none;
+    border-right: 1px solid #D0D0D0;
+    border-bottom: 2px solid #C0C0C0;
+    padding: 8px 12px;
+    font-weight: 600;
+    font-size: 12px;
+    color: #404040;
+}}
+QTableView#applicationTable QHeaderView::section:first {{
+    border-left: none;
+    border-top-left-radius: 10px;
+}}
+QTableView#applicationTable QHeaderView::section:last {{
+    border-right: none;
+    border-top-right-radius: 10px;
+}}
+"""
+
+
+def effects_enabled():
+    """True unless decorative effects were turned off with CVM_UI_EFFECTS=off"""
+    return UI_EFFECTS
+
+
+def apply_theme(app=None):
+    """
+    Install STYLESHEET on the application. Only the first call per
+    application does any work, so every window can call it.
+    """
+    app = app or QApplication.instance()
+    if app is None or app.property("cvmThemed"):
+        return
+    app.setStyleSheet(STYLESHEET)
+    app.setProperty("cvmThemed", True)
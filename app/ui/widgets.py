@@ -0,0 +1,147 @@
+# app/ui/widgets.py
+"""
+Styled widgets shared by the main window and dialogs. They only tag
+themselves with properties; their look comes from app.ui.theme.
+"""
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import (
+    QDateEdit, QFrame, QLineEdit, QPushButton, QTableView, QTextEdit, QVBoxLayout, QWidget
+)
+
+from app.ui import theme
+
+
+def _field(widget, large):
+    widget.setProperty("field", True)
+    widget.setProperty("size", "large" if large else "normal")
+
+
+class ModernButton(QPushButton):
+    """Push button in one of the theme's variants: primary, secondary or danger"""
+    def __init__(self, text, button_type="primary", large=False):
+        super().__init__(text)
+        self.button_type = button_type
+        self.setProperty("variant", button_type)
+        self.setProperty("size", "large" if large else "normal")
+
+
+class ModernLineEdit(QLineEdit):
+    """Themed line edit; large=True for the roomier dialog layout"""
+    def __init__(self, placeholder="", large=False):
+        super().__init__()
+        self.setPlaceholderText(placeholder)
+        _field(self, large)
+
+
+class ModernDateEdit(QDateEdit):
+    """Themed date edit"""
+    def __init__(self, large=False):
+        super().__init__()
+        _field(self, large)
+
+
+class ModernTextEdit(QTextEdit):
+    """Themed multi-line text edit"""
+    def __init__(self, placeholder="", large=False):
+        super().__init__()
+        self.setPlaceholderText(placeholder)
+        _field(self, large)
+
+
+class ModernTable(QTableView):
+    """The applications table"""
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("applicationTable")
+
+
+class Card(QFrame):
+    """White rounded panel that groups related controls"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("card")
+
+
+# (blur, radius, alpha) -> nine-patch shadow pixmap
+_shadow_cache = {}
+
+
+def _shadow_patch(blur, radius, alpha):
+    """
+    A small pixmap holding a soft rounded-rect shadow, built once per style.
+    The falloff is stacked translucent rounded rects: close enough to a blur
+    for a drop shadow, without a blur pass.
+    """
+    key = (blur, radius, alpha)
+    patch = _shadow_cache.get(key)
+    if patch is not None:
+        return patch
+    corner = blur + radius
+    patch = QPixmap(2 * corner + 1, 2 * corner + 1)
+    patch.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(patch)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    steps = max(1, blur)
+    # Per-layer opacity such that all layers together reach `alpha`
+    layer = 1 - (1 - alpha / 255) ** (1 / steps)
+    painter.setBrush(QColor(0, 0, 0, max(1, round(layer * 255))))
+    for i in range(steps):
+        inset = i * blur / steps
+        rect = QRectF(patch.rect()).adjusted(inset, inset, -inset, -inset)
+        painter.drawRoundedRect(rect, radius + blur - inset, radius + blur - inset)
+    painter.end()
+    _shadow_cache[key] = patch
+    return patch
+
+
+class ShadowFrame(QWidget):
+    """
+    Holds one widget and paints a drop shadow around it from a cached
+    nine-patch. Unlike QGraphicsDropShadowEffect nothing is rendered
+    offscreen: the shadow is only drawn when this frame itself repaints, so
+    scrolling the content costs no more than without a shadow. With effects
+    turned off (theme.effects_enabled()) it is a plain container.
+    """
+    def __init__(self, content, blur=10, offset=2, alpha=30, radius=12, parent=None):
+        super().__init__(parent)
+        self.content = content
+        self.blur = blur
+        self.offset = offset
+        self.alpha = alpha
+        self.radius = radius
+        self._enabled = theme.effects_enabled()
+        layout = QVBoxLayout(self)
+        if self._enabled:
+            layout.setContentsMargins(blur, max(0, blur - offset), blur, blur + offset)
+        else:
+            layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(content)
+
+    def paintEvent(self, event):
+        if not self._enabled:
+            return
+        patch = _shadow_patch(self.blur, self.radius, self.alpha)
+        corner = self.blur + self.radius
+        target = self.content.geometry().translated(0, self.offset).adjusted(
+            -self.blur, -self.blur, self.blur, self.blur
+        )
+        if target.width() < 2 * corner or target.height() < 2 * corner:
+            return
+        painter = QPainter(self)
+        # Source and destination strips: left/top corner, stretchable middle, right/bottom corner
+        src_x = (0, corner, corner + 1)
+        src_w = (corner, 1, corner)
+        dst_x = (target.left(), target.left() + corner, target.right() - corner + 1)
+        dst_w = (corner, target.width() - 2 * corner, corner)
+        dst_y = (target.top(), target.top() + corner, target.bottom() - corner + 1)
+        dst_h = (corner, target.height() - 2 * corner, corner)
+        for col in range(3):
+            for row in range(3):
+                painter.drawPixmap(
+                    QRect(dst_x[col], dst_y[row], dst_w[col], dst_h[row]),
+                    patch,
+                    QRect(src_x[col], src_x[row], src_w[col], src_w[row]),
+                )
+        painter.end()
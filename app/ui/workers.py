@@ -0,0 +1,39 @@
+# app/ui/workers.py
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class JobSignals(QObject):
+    """Signals a background job uses to talk to the GUI thread"""
+    progress = Signal(int, int, str)  # done, total, message
+    finished = Signal(object)         # return value of the job
+    failed = Signal(str)              # error message
+
+
+class BackgroundJob(QRunnable):
+    """
+    Runs fn(progress, cancel) on the global thread pool.
+    `progress(done, total, message)` may be called from the worker; `cancel`
+    is a threading.Event the GUI sets to ask the job to stop early.
+    """
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.cancel = threading.Event()
+        self.signals = JobSignals()
+
+    def run(self):
+        try:
+            result = self.fn(self._report, self.cancel)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+    def _report(self, done, total, message=""):
+        self.signals.progress.emit(done, total, str(message))
+
+    def start(self):
+        """Queue the job on the global thread pool"""
+        QThreadPool.globalInstance().start(self)
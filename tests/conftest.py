@@ -0,0 +1,18 @@
+import pytest
+
+from app.core import database, pdf_text
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """
+    Points the database and archive at a temporary directory.
+    """
+    monkeypatch.setattr(database, "DATABASE_BASE_DIR", tmp_path / "db")
+    monkeypatch.setattr(database, "ARCHIVE_ROOT_DIR", tmp_path / "archive")
+    database.close_connections()
+    database.init_db()
+    yield tmp_path
+    # Don't let queued text extraction run on into the next test's database
+    pdf_text.wait_idle()
+    database.close_connections()
@@ -0,0 +1,52 @@
+import threading
+
+from app.core import bulk_import, database
+
+
+def _make_pdfs(folder, names):
+    folder.mkdir(parents=True, exist_ok=True)
+    for i, name in enumerate(names):
+        (folder / name).write_bytes(b"%PDF-1.4 " + str(i).encode())
+    return folder
+
+
+def test_bulk_import_folder(tmp_db):
+    src = _make_pdfs(tmp_db / "in", ["a.pdf", "b.PDF", "2024-03-01__globex__analyst__v1.pdf", "skip.txt"])
+    paths = bulk_import.collect_pdfs([src])
+    assert len(paths) == 3
+    items, failures = bulk_import.plan_imports(paths, {"company": "Acme", "role": "Dev", "date": "2024-01-01"})
+    assert failures == []
+    seen = []
+    result = bulk_import.bulk_import(items, batch_size=2, progress=lambda d, t, p: seen.append((d, t)))
+    assert result.imported == 3 and not result.failures
+    assert seen[-1] == (3, 3)
+    apps = database.fetch_all_applications()
+    assert sorted(a["company"] for a in apps) == ["Acme", "Acme", "globex"]
+    # Same company/role/date imported concurrently never overwrite each other
+    assert len({a["file_path"] for a in apps}) == 3
+
+
+def test_bulk_import_reports_missing_metadata_and_cancel(tmp_db):
+    src = _make_pdfs(tmp_db / "in", ["a.pdf"])
+    items, failures = bulk_import.plan_imports(bulk_import.collect_pdfs([src]), {"company": "", "date": ""})
+    assert items == [] and len(failures) == 1
+    cancel = threading.Event()
+    cancel.set()
+    items, _ = bulk_import.plan_imports(bulk_import.collect_pdfs([src]), {"company": "Acme", "date": "2024-01-01"})
+    result = bulk_import.bulk_import(items, cancel=cancel)
+    assert result.cancelled and result.imported == 0
+
+
+def test_bulk_import_dedups_within_run(tmp_db):
+    src = tmp_db / "in"
+    src.mkdir()
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        (src / name).write_bytes(b"%PDF-1.4 identical")
+    items, _ = bulk_import.plan_imports(bulk_import.collect_pdfs([src]), {"company": "Acme", "date": "2024-01-01"})
+    result = bulk_import.bulk_import(items, batch_size=1, dedup="link")
+    assert (result.imported, result.linked) == (1, 2)
+    apps = database.fetch_all_applications()
+    assert len(apps) == 3 and len({a["file_path"] for a in apps}) == 1
+
+    result = bulk_import.bulk_import(items, dedup="skip")
+    assert (result.imported, result.skipped) == (0, 3)
@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from app import cli
+from app.core import database
+
+
+def test_cli_import_list_export_delete(tmp_db, capsys):
+    src = tmp_db / "cv.pdf"
+    src.write_bytes(b"%PDF cli")
+    assert cli.main(["import", str(src), "--company", "Acme", "--role", "Dev", "--date", "2024-05-01"]) == 0
+    action, app_id = capsys.readouterr().out.split()
+    assert action == "imported"
+
+    assert cli.main(["list", "--search", "acm", "--json"]) == 0
+    [row] = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert (row["id"], row["company"]) == (int(app_id), "Acme")
+
+    out = tmp_db / "out.csv"
+    assert cli.main(["export", "--since", "2024-01-01", "-o", str(out)]) == 0
+    assert out.read_text().splitlines()[1].startswith(f"{app_id},Acme,Dev,2024-05-01")
+
+    assert cli.main(["verify"]) == 0
+    assert cli.main(["delete", app_id, "999"]) == 1
+    assert database.fetch_all_applications() == []
+
+
+def test_cli_list_json_has_full_notes_in_one_query(tmp_db, capsys, monkeypatch):
+    notes = "n" * (database.NOTES_PREVIEW_CHARS * 2)
+    for day in (1, 2, 3):
+        database.insert_application("Acme", "Dev", f"2024-05-0{day}", notes, f"/tmp/{day}.pdf")
+    monkeypatch.setattr(database, "get_notes", lambda app_id: pytest.fail("notes read per row"))
+    assert cli.main(["list", "--json", "--limit", "2", "--offset", "1"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["date_applied"] for r in rows] == ["2024-05-02", "2024-05-01"]
+    assert all(r["notes"] == notes for r in rows)
+
+
+def test_cli_does_not_import_qt():
+    code = (
+        "import sys, app.cli; "
+        "sys.exit(any(m.split('.')[0] in ('PyQt6', 'PySide6') for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,277 @@
+import _thread
+import gc
+import threading
+
+import pytest
+
+from app.core import database
+
+
+def _insert(company="Acme", role="Engineer", date="2024-01-15", notes="", path="/tmp/a.pdf"):
+    return database.insert_application(company, role, date, notes, path)
+
+
+def test_connection_reused_within_thread(tmp_db):
+    assert database._connect() is database._connect()
+
+
+def test_connection_per_thread(tmp_db):
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(database._connect()))
+    t.start()
+    t.join()
+    assert seen[0] is not database._connect()
+
+
+def test_untracked_thread_keeps_its_connection(tmp_db):
+    # QThreadPool workers never appear in threading.enumerate()
+    _insert()
+    opened, go, done = threading.Event(), threading.Event(), threading.Event()
+    result = []
+
+    def worker():
+        database._connect()
+        opened.set()
+        go.wait(5)
+        try:
+            result.append(database.count_applications(search="acme"))
+        except Exception as e:
+            result.append(e)
+        done.set()
+
+    _thread.start_new_thread(worker, ())
+    opened.wait(5)
+    t = threading.Thread(target=database._connect)
+    t.start()
+    t.join()
+    go.set()
+    done.wait(5)
+    assert result == [1]
+
+
+def test_exited_thread_releases_connection(tmp_db):
+    database._connect()
+    before = len(database._connections)
+    t = threading.Thread(target=database._connect)
+    t.start()
+    t.join()
+    gc.collect()
+    assert len(database._connections) == before
+
+
+def test_close_connections_reopens(tmp_db):
+    app_id = _insert()
+    database.close_connections()
+    assert database.get_application_by_id(app_id)["company"] == "Acme"
+
+
+def test_crud_roundtrip(tmp_db):
+    app_id = _insert(notes="hello")
+    database.update_application(app_id, "Beta", "Dev", "2024-02-01", "bye", "/tmp/b.pdf")
+    app = database.get_application_by_id(app_id)
+    assert (app["company"], app["notes"]) == ("Beta", "bye")
+    database.delete_application(app_id)
+    assert database.get_application_by_id(app_id) is None
+
+
+def test_wal_profile_applied(tmp_db):
+    conn = database._connect()
+    assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+
+
+def test_reader_not_blocked_by_open_write(tmp_db):
+    _insert()
+    writer = database._connect()
+    writer.execute("BEGIN IMMEDIATE;")
+    writer.execute("INSERT INTO applications (company, date_applied, file_path) VALUES ('W', '2024-01-01', '/x');")
+    rows = []
+    t = threading.Thread(target=lambda: rows.extend(database.fetch_all_applications()))
+    t.start()
+    t.join(timeout=2)
+    writer.rollback()
+    assert [r["company"] for r in rows] == ["Acme"]
+
+
+def test_checkpoint_truncates_wal(tmp_db):
+    _insert()
+    database.checkpoint("TRUNCATE")
+    wal = database.db_path().with_name("app.db-wal")
+    assert not wal.exists() or wal.stat().st_size == 0
+
+
+def test_search_filters_in_sql(tmp_db):
+    _insert("Acme", "Engineer", "2024-01-15", "Python role")
+    _insert("Globex", "Analyst", "2023-06-01", "100% remote")
+    _insert("Initech", "Dev_Ops", "2024-03-01", "")
+    assert [a["company"] for a in database.search_applications(search="PYTHON")] == ["Acme"]
+    assert [a["company"] for a in database.search_applications(search="%")] == ["Globex"]
+    assert [a["company"] for a in database.search_applications(search="v_o")] == ["Initech"]
+    assert [a["company"] for a in database.search_applications(search="e_g")] == []
+    assert [a["company"] for a in database.search_applications(min_date="2024-01-01")] == ["Initech", "Acme"]
+    assert database.count_applications(min_date="2024-01-01") == 2
+    page = database.search_applications(order_by="company ASC, date_applied DESC", limit=1, offset=1)
+    assert [a["company"] for a in page] == ["Globex"]
+
+
+def test_keyset_pages_match_full_ordering(tmp_db):
+    for i in range(23):
+        _insert(["Acme", "Globex", "Initech"][i % 3], "Dev", f"2024-01-{i % 5 + 1:02d}", "x")
+    for order_by, keys in database._KEYSET_ORDERS.items():
+        expected = database.search_applications(min_date="2024-01-02")
+        for column, direction in reversed(keys):
+            expected.sort(key=lambda a: a[column], reverse=direction == "DESC")
+        seen, after = [], None
+        while True:
+            page, after = database.fetch_page(order_by=order_by, limit=4, after=after, min_date="2024-01-02")
+            seen.extend(page)
+            if after is None:
+                break
+        assert [a["id"] for a in seen] == [a["id"] for a in expected]
+        lazy = database.iter_pages(order_by=order_by, page_size=4, min_date="2024-01-02")
+        assert [a["id"] for a in lazy] == [a["id"] for a in expected]
+    with pytest.raises(ValueError):
+        database.fetch_page(after=("2024-01-01",))
+
+
+def test_application_records_act_like_dicts_with_lazy_notes(tmp_db):
+    long_notes = "n" * (database.NOTES_PREVIEW_CHARS + 50)
+    first = _insert("Acme", "Dev", "2024-01-01", long_notes)
+    _insert("Acme", "Dev", "2024-01-02", "short")
+    database.set_hashes([("ab" * 32, first)])
+
+    rows = database.search_applications(order_by="date_applied ASC, id ASC")
+    app, other = rows
+    assert app.company is other.company  # interned
+    assert app.notes_preview == long_notes[:database.NOTES_PREVIEW_CHARS]
+    assert app["notes"] == long_notes and app.notes_preview == long_notes
+    assert app["sha256"] == "ab" * 32 and app.get("rank") is None
+    assert dict(app)["id"] == first and "version" in app
+    app.update({"role": "Lead", "rank": 1.5})
+    assert (app["role"], app["rank"]) == ("Lead", 1.5)
+    fresh = database.get_application_by_id(first)
+    expected = dict(app)
+    del expected["rank"]
+    assert fresh == {**expected, "role": "Dev"}
+
+
+def test_query_cache_invalidated_by_writes(tmp_db):
+    import sqlite3
+
+    acme = _insert("Acme", "Dev", "2024-01-01")
+    first = database.search_applications(search="acme", fulltext=True)
+    cached = len(database._query_cache)
+    again = database.search_applications(search=" acme ", fulltext=True)
+    assert again == first and len(database._query_cache) == cached  # served from the cache
+    assert database.count_applications() == 1
+
+    # Each call gets its own records; editing one leaves the cache alone
+    assert again[0] is not first[0]
+    first[0]["company"] = "HACKED"
+    assert database.search_applications(search="acme", fulltext=True)[0]["company"] == "Acme"
+
+    database.update_application(acme, "Acme", "Lead", "2024-01-01", "", "/tmp/a.pdf")
+    assert database.search_applications(search="acme", fulltext=True)[0]["role"] == "Lead"
+
+    # A write from another process is seen through PRAGMA data_version
+    other = sqlite3.connect(database.db_path())
+    with other:
+        other.execute("DELETE FROM applications;")
+    other.close()
+    assert database.search_applications(search="acme", fulltext=True) == []
+    assert database.count_applications() == 0
+
+
+def test_query_cache_is_bounded_by_rows(tmp_db, monkeypatch):
+    monkeypatch.setattr(database, "QUERY_CACHE_ROWS", 3)
+    for day in range(1, 5):
+        _insert("Acme", "Dev", f"2024-01-0{day}")
+    assert len(database.search_applications(limit=2)) == 2
+    assert len(database.search_applications(limit=2, offset=2)) == 2
+    assert database._query_cache_rows == 2 and len(database._query_cache) == 1
+    # Too big to cache at all
+    assert len(database.fetch_all_applications()) == 4
+    assert database._query_cache_rows == 2
+
+
+def test_fulltext_search_tracks_writes(tmp_db):
+    acme = _insert("Acme Corp", "Platform Engineer", "2024-01-15", "Kubernetes and Go")
+    _insert("Globex", "Analyst", "2024-02-01", "mentions acme once")
+    assert [a["id"] for a in database.fulltext_search("acm")][0] == acme
+    assert database.fulltext_search("engineer platform", mode="phrase") == []
+    assert len(database.fulltext_search("platform engineer", mode="phrase")) == 1
+    database.update_application(acme, "Acme Corp", "Platform Engineer", "2024-01-15", "Rust", "/tmp/a.pdf")
+    assert database.search_applications(search="kube", fulltext=True) == []
+    database.delete_application(acme)
+    assert [a["company"] for a in database.search_applications(search="acme", fulltext=True)] == ["Globex"]
+
+
+def test_fts_backfills_existing_rows(tmp_db):
+    _insert("Initech", "Dev", "2024-01-01", "")
+    conn = database._connect()
+    with conn:
+        for name in ("applications_fts_ai", "applications_fts_ad", "applications_fts_au"):
+            conn.execute(f"DROP TRIGGER {name};")
+        conn.execute("DROP TABLE applications_fts;")
+    database.init_db()
+    assert database.count_applications(search="init", fulltext=True) == 1
+
+
+def test_fulltext_search_includes_substring_matches(tmp_db):
+    microsoft = _insert("Microsoft", "Dev", "2024-01-01", "")
+    software = _insert("Globex", "Software Engineer", "2024-01-02", "")
+    _insert("Initech", "Analyst", "2024-01-03", "")
+    # "soft" starts a word in one row and sits inside a word in the other;
+    # the full-text search returns both whatever else the table holds
+    for term in ("soft", "so", "micro", "ware eng"):
+        substring = {a["id"] for a in database.search_applications(search=term)}
+        fulltext = {a["id"] for a in database.search_applications(search=term, fulltext=True)}
+        assert substring <= fulltext
+        assert database.count_applications(search=term, fulltext=True) == len(fulltext)
+    assert {a["id"] for a in database.search_applications(search="soft", fulltext=True)} == {microsoft, software}
+    # Words in different fields still match through the index
+    assert [a["id"] for a in database.search_applications(search="glob eng", fulltext=True)] == [software]
+
+
+def test_fts_query_quotes_syntax():
+    assert database.fts_query('a" OR b*') == '"a"* "OR"* "b"*'
+    assert database.fts_query("  ") is None
+
+
+def test_cancellable_aborts_query(tmp_db):
+    with pytest.raises(database.QueryCancelled):
+        with database.cancellable(lambda: True, check_every=1):
+            database.search_applications()
+    # The handler is removed afterwards
+    assert database.search_applications() == []
+
+
+def test_init_db_migrates_old_schema(tmp_db):
+    conn = database._connect()
+    with conn:
+        for name in ("applications_fts_ai", "applications_fts_ad", "applications_fts_au"):
+            conn.execute(f"DROP TRIGGER {name};")
+        conn.execute("DROP TABLE applications_fts;")
+        conn.execute("DROP TABLE applications;")
+        conn.execute(
+            "CREATE TABLE applications (id INTEGER PRIMARY KEY AUTOINCREMENT, company TEXT NOT NULL, "
+            "role TEXT, date_applied TEXT NOT NULL, notes TEXT, file_path TEXT NOT NULL, "
+            "created_at TEXT DEFAULT (datetime('now')));"
+        )
+        conn.execute(
+            "INSERT INTO applications (company, date_applied, file_path) "
+            "VALUES ('Old', '2020-01-01', '/x/2020-01-01__old____v2.pdf');"
+        )
+    database.init_db()
+    assert database.find_by_hash("abc") is None
+    assert database.next_version("Old", None, "2020-01-01") == 3
+    assert database.count_applications(search="old", fulltext=True) == 1
+
+
+def test_db_path_creates_directory_once(tmp_db, monkeypatch):
+    database.db_path()
+    calls = []
+    monkeypatch.setattr(type(database.DATABASE_BASE_DIR), "mkdir", lambda self, **kw: calls.append(self))
+    database.close_connections()
+    database.search_applications()
+    assert calls == []
@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+import threading
+
+import pytest
+
+from app.core import database, export
+
+
+def _seed(count):
+    database.insert_applications(
+        (f"Company {i}", "Dev" if i % 2 else "Ops", f"2024-01-{i % 28 + 1:02d}", "n" * (i % 3), f"/cv/{i}.pdf", None)
+        for i in range(count)
+    )
+
+
+def test_formats_round_trip_with_filters(tmp_db, monkeypatch):
+    monkeypatch.setattr(export, "ROW_GROUP_SIZE", 7)
+    _seed(40)
+    expected = database.search_applications(search="ops", min_date="2024-01-10", fulltext=True)
+
+    out = tmp_db / "apps.cvcol"
+    assert export.export_applications(out, "columnar", search="ops", min_date="2024-01-10") == len(expected)
+    assert list(export.read_columnar(out)) == [
+        {name: row[name] for name, _ in export.EXPORT_COLUMNS} for row in expected
+    ]
+    assert [r["company"] for r in export.read_columnar(out, columns=["company"])] == [r["company"] for r in expected]
+
+    buf = io.BytesIO()
+    export.export_applications(buf, "csv", search="ops", min_date="2024-01-10")
+    rows = list(csv.DictReader(io.StringIO(buf.getvalue().decode("utf-8"))))
+    assert [int(r["id"]) for r in rows] == [r["id"] for r in expected]
+
+    buf = io.BytesIO()
+    export.export_applications(buf, "jsonl")
+    assert len([json.loads(line) for line in buf.getvalue().splitlines()]) == 40
+
+
+def test_cancelled_export_leaves_no_file(tmp_db, monkeypatch):
+    monkeypatch.setattr(export, "ROW_GROUP_SIZE", 5)
+    _seed(20)
+    cancel = threading.Event()
+    out = tmp_db / "apps.csv"
+    with pytest.raises(export.ExportCancelled):
+        export.export_applications(out, "csv", progress=lambda n: cancel.set(), cancel=cancel)
+    assert not out.exists()
+    assert list(tmp_db.glob(".apps.csv.*")) == []
@@ -0,0 +1,237 @@
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core import database, file_manager
+
+
+def _pdf(folder, name, content=b"%PDF-1.4 same"):
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / name
+    path.write_bytes(content)
+    return path
+
+
+def test_parse_filename_roundtrip():
+    name = file_manager.make_filename("2024-05-01", "Acme Corp", "Platform Eng", 3)
+    assert file_manager.parse_filename(name) == {
+        "date": "2024-05-01", "company": "acme corp", "role": "platform eng", "version": 3,
+    }
+    assert file_manager.parse_filename("resume.pdf") is None
+
+
+def test_import_pdf_dedup_policies(tmp_db):
+    src = _pdf(tmp_db / "in", "cv.pdf")
+    first, action = file_manager.import_pdf(src, "Acme", "Dev", "2024-01-01")
+    assert action == "imported"
+    assert file_manager.import_pdf(src, "Globex", "Dev", "2024-01-02", dedup="skip") == (first, "skipped")
+
+    linked, action = file_manager.import_pdf(src, "Globex", "Dev", "2024-01-02", dedup="link")
+    assert action == "linked"
+    shared = database.get_application_by_id(first)["file_path"]
+    assert database.get_application_by_id(linked)["file_path"] == shared
+
+    _, action = file_manager.import_pdf(src, "Initech", "Dev", "2024-01-03", dedup="new_version")
+    assert action == "imported"
+
+    # The shared file survives until its last reference is deleted
+    file_manager.delete_application_and_file(first)
+    assert database.get_application_by_id(linked) is not None
+    assert Path(shared).exists()
+    file_manager.delete_application_and_file(linked)
+    assert not Path(shared).exists()
+
+
+def test_import_pdf_reuses_given_hash(tmp_db, monkeypatch):
+    src = _pdf(tmp_db / "in", "cv.pdf")
+    sha, existing = file_manager.find_duplicate(src)
+    assert existing is None
+    hashed = []
+    real = file_manager.compute_hash
+    monkeypatch.setattr(file_manager, "compute_hash", lambda p: hashed.append(p) or real(p))
+    app_id, action = file_manager.import_pdf(src, "Acme", "Dev", "2024-01-01", sha256=sha)
+    assert action == "imported" and hashed == []
+    assert database.get_application_by_id(app_id)["sha256"] == sha
+
+
+def test_backfill_hashes(tmp_db):
+    src = _pdf(tmp_db / "in", "cv.pdf")
+    app_id, _ = file_manager.import_pdf(src, "Acme", "Dev", "2024-01-01")
+    # As if imported before the sha256 column existed
+    database.set_hashes([(None, app_id)])
+    database.insert_application("Gone", "Dev", "2024-01-01", "", str(tmp_db / "missing.pdf"))
+    assert file_manager.backfill_hashes(workers=2, batch_size=1) == 1
+    assert database.get_application_by_id(app_id)["sha256"] == file_manager.compute_hash(src)
+
+
+def test_blob_storage_mode(tmp_db, monkeypatch):
+    monkeypatch.setattr(file_manager, "STORAGE_MODE", "blob")
+    src = _pdf(tmp_db / "in", "cv.pdf", b"%PDF-1.4 blob")
+    first, _ = file_manager.import_pdf(src, "Acme", "Dev", "2024-01-01", dedup="new_version")
+    second, _ = file_manager.import_pdf(src, "Globex", "Dev", "2024-01-02", dedup="new_version")
+    sha = file_manager.compute_hash(src)
+    blob = file_manager.blob_path(sha)
+    a = Path(database.get_application_by_id(first)["file_path"])
+    b = Path(database.get_application_by_id(second)["file_path"])
+    assert a != b and a.read_bytes() == b.read_bytes() == blob.read_bytes()
+    assert a.name == "2024-01-01__acme__dev__v1.pdf"
+
+    file_manager.delete_application_and_file(first)
+    assert blob.exists() and not a.exists()
+    file_manager.delete_application_and_file(second)
+    assert not blob.exists() and not b.exists()
+
+
+def test_versions_allocated_in_db_under_concurrency(tmp_db):
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = [_pdf(tmp_db / "in", f"cv{i}.pdf", f"%PDF-1.4 {i}".encode()) for i in range(12)]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        ids = list(pool.map(lambda p: file_manager.import_pdf(p, "Acme", "Dev", "2024-01-01")[0], sources))
+    apps = [database.get_application_by_id(i) for i in ids]
+    assert sorted(a["version"] for a in apps) == list(range(1, 13))
+    for a in apps:
+        assert Path(a["file_path"]).name == f"2024-01-01__acme__dev__v{a['version']}.pdf"
+        assert Path(a["file_path"]).exists()
+    assert file_manager.next_version("Acme", "Dev", "2024-01-01") == 13
+    assert not list((tmp_db / "archive").rglob(".staging/*.pdf"))
+
+
+def test_legacy_file_is_never_overwritten(tmp_db):
+    legacy = file_manager.company_dir("Acme") / "2024-01-01__acme__dev__v1.pdf"
+    legacy.write_bytes(b"%PDF-1.4 legacy")
+    app_id, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "cv.pdf"), "Acme", "Dev", "2024-01-01")
+    app = database.get_application_by_id(app_id)
+    assert legacy.read_bytes() == b"%PDF-1.4 legacy"
+    assert Path(app["file_path"]).name == "2024-01-01__acme__dev__v1_dup1.pdf"
+
+
+def test_notes_only_rename_keeps_dup_name(tmp_db):
+    legacy = file_manager.company_dir("Acme") / "2024-01-01__acme__dev__v1.pdf"
+    legacy.write_bytes(b"%PDF-1.4 legacy")
+    app_id, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "cv.pdf"), "Acme", "Dev", "2024-01-01")
+    path = database.get_application_by_id(app_id)["file_path"]
+    assert Path(path).name == "2024-01-01__acme__dev__v1_dup1.pdf"
+    for notes in ("first", "second"):
+        assert file_manager.rename_file(app_id, "Acme", "Dev", "2024-01-01", notes) == path
+    assert database.journal_pending() == []
+    assert database.get_application_by_id(app_id)["notes"] == "second"
+
+
+def test_rename_many_allocates_versions_and_keeps_notes(tmp_db):
+    a, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "a.pdf", b"%PDF a"), "Acme", "Dev", "2024-01-01", "keep")
+    b, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "b.pdf", b"%PDF b"), "Globex", "Dev", "2024-01-01")
+    paths = file_manager.rename_many([
+        (a, "Initech", "Ops", "2024-02-02", None),
+        (b, "Initech", "Ops", "2024-02-02", "new notes"),
+    ])
+    assert Path(paths[a]).name == "2024-02-02__initech__ops__v1.pdf"
+    assert Path(paths[b]).name == "2024-02-02__initech__ops__v2.pdf"
+    assert all(Path(p).exists() for p in paths.values())
+    assert database.get_application_by_id(a)["notes"] == "keep"
+    assert database.get_application_by_id(b)["notes"] == "new notes"
+
+
+def test_rename_many_rolls_back_on_failure(tmp_db, monkeypatch):
+    a, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "a.pdf", b"%PDF a"), "Acme", "Dev", "2024-01-01")
+    b, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "b.pdf", b"%PDF b"), "Acme", "Dev", "2024-01-01")
+    before = database.get_applications_by_ids([a, b])
+    real_retag = database.retag_application
+    calls = []
+
+    def failing_retag(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        real_retag(*args)
+
+    monkeypatch.setattr(database, "retag_application", failing_retag)
+    with pytest.raises(OSError):
+        file_manager.rename_many([(a, "Initech", "Ops", "2024-02-02", None), (b, "Initech", "Ops", "2024-02-02", None)])
+    assert database.get_applications_by_ids([a, b]) == before
+    assert all(Path(app["file_path"]).exists() for app in before.values())
+
+
+def test_delete_many(tmp_db):
+    ids = [
+        file_manager.import_pdf(_pdf(tmp_db / "in", f"{i}.pdf", f"%PDF {i}".encode()), "Acme", "Dev", "2024-01-01")[0]
+        for i in range(3)
+    ]
+    paths = [database.get_application_by_id(i)["file_path"] for i in ids]
+    assert file_manager.delete_many(ids[:2]) == 2
+    assert [Path(p).exists() for p in paths] == [False, False, True]
+    assert [a["id"] for a in database.fetch_all_applications()] == ids[2:]
+    assert database.journal_pending() == []
+
+
+def test_interrupted_operations_are_replayed_at_startup(tmp_db, monkeypatch):
+    a, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "a.pdf", b"%PDF a"), "Acme", "Dev", "2024-01-01")
+    b, _ = file_manager.import_pdf(_pdf(tmp_db / "in", "b.pdf", b"%PDF b"), "Acme", "Dev", "2024-01-01")
+    doomed = database.get_application_by_id(b)["file_path"]
+
+    # Crash after the rename/delete transactions committed, before any file was touched
+    with monkeypatch.context() as m:
+        m.setattr(file_manager, "_move_no_clobber", lambda src, dst: None)
+        m.setattr(database, "journal_done", lambda op_ids: None)
+        file_manager.rename_file(a, "Initech", "Ops", "2024-02-02")
+        m.setattr(file_manager, "_remove_unreferenced", lambda *args: None)
+        file_manager.delete_many([b])
+
+    moved = database.get_application_by_id(a)["file_path"]
+    assert not Path(moved).exists() and Path(doomed).exists()
+    assert {op["op"] for op in database.journal_pending()} == {"move", "delete"}
+
+    database.close_connections()
+    database.init_db()
+    assert Path(moved).exists() and not Path(doomed).exists()
+    assert database.journal_pending() == []
+
+
+def _crashed_publish(tmp_db, content=b"%PDF-1.4 staged"):
+    """Stage and record an import, as if the process died before publishing it"""
+    staged, is_blob = file_manager.stage_file(_pdf(tmp_db / "in", "cv.pdf", content))
+    sha = file_manager.compute_hash(staged)
+    prefix = file_manager.archive_path_prefix("Acme", "Dev", "2024-01-01")
+    row = file_manager.record_staged([("Acme", "Dev", "2024-01-01", "", sha, prefix)], [(staged, is_blob)])[0]
+    return row, staged
+
+
+def test_replay_publishes_beside_an_unrelated_file(tmp_db):
+    row, staged = _crashed_publish(tmp_db)
+    squatter = Path(row["file_path"])
+    squatter.write_bytes(b"%PDF-1.4 someone else")
+
+    database.close_connections()
+    database.init_db()
+    path = Path(database.get_application_by_id(row["id"])["file_path"])
+    assert path.name == "2024-01-01__acme__dev__v1_dup1.pdf"
+    assert path.read_bytes() == b"%PDF-1.4 staged"
+    assert squatter.read_bytes() == b"%PDF-1.4 someone else"
+    assert not staged.exists()
+    assert database.journal_pending() == []
+
+
+def test_recovery_skips_entries_of_a_running_process(tmp_db):
+    row, staged = _crashed_publish(tmp_db)
+    with sqlite3.connect(database.db_path()) as conn:
+        conn.execute("UPDATE file_ops SET owner_pid = ?;", (os.getppid(),))
+    conn.close()
+
+    database.close_connections()
+    database.init_db()
+    assert staged.exists() and not Path(row["file_path"]).exists()
+    assert [op["app_id"] for op in database.journal_pending()] == [row["id"]]
+
+    # Once the owner has exited, the next start finishes the publish
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    with sqlite3.connect(database.db_path()) as conn:
+        conn.execute("UPDATE file_ops SET owner_pid = ?;", (int(dead.stdout),))
+    conn.close()
+    database.close_connections()
+    database.init_db()
+    assert Path(row["file_path"]).read_bytes() == b"%PDF-1.4 staged"
+    assert not staged.exists()
@@ -0,0 +1,37 @@
+from app.core import database, file_manager, inbox
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_inbox_waits_for_files_to_settle_then_imports(tmp_db):
+    box = tmp_db / "inbox"
+    box.mkdir()
+    clock = _Clock()
+    watcher = inbox.InboxWatcher(box, settle_seconds=2, clock=clock)
+
+    named = box / file_manager.make_filename("2024-05-01", "Acme", "Dev", 1)
+    named.write_bytes(b"%PDF partial")
+    assert watcher.poll() == []
+
+    clock.now = 1.5
+    named.write_bytes(b"%PDF complete")  # still being written
+    (box / "resume.pdf").write_bytes(b"%PDF no metadata")
+    assert watcher.poll() == []
+
+    clock.now = 4.0
+    ready = watcher.poll()
+    assert sorted(p.name for p in ready) == sorted([named.name, "resume.pdf"])
+
+    result = watcher.ingest(ready)
+    assert result.imported == 1 and len(result.failures) == 1
+    [app] = database.fetch_all_applications()
+    assert (app["company"], app["role"], app["date_applied"]) == ("acme", "dev", "2024-05-01")
+    assert (box / inbox.IMPORTED_DIR_NAME / named.name).exists()
+    assert (box / inbox.FAILED_DIR_NAME / "resume.pdf").exists()
+    assert watcher.poll() == []
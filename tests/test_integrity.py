@@ -0,0 +1,66 @@
+import json
+import os
+from pathlib import Path
+
+from app.core import database, file_manager, integrity
+
+
+def _import(tmp_db, name, content, company="Acme"):
+    src = tmp_db / "in" / name
+    src.parent.mkdir(parents=True, exist_ok=True)
+    src.write_bytes(content)
+    app_id, _ = file_manager.import_pdf(src, company, "Dev", "2024-01-01", dedup="new_version")
+    return app_id, Path(database.get_application_by_id(app_id)["file_path"])
+
+
+def test_scan_reports_problems_and_reuses_stat_cache(tmp_db):
+    _, healthy = _import(tmp_db, "a.pdf", b"%PDF a")
+    gone_id, gone = _import(tmp_db, "b.pdf", b"%PDF b")
+    drift_id, drift = _import(tmp_db, "c.pdf", b"%PDF c")
+
+    report = integrity.scan()
+    assert report.ok and report.hashed == 3
+
+    gone.unlink()
+    drift.write_bytes(b"%PDF changed")
+    orphan = healthy.parent / "notes.pdf"
+    orphan.write_bytes(b"%PDF orphan")
+
+    report = integrity.scan()
+    assert report.hashed == 2  # the edited file and the orphan; the rest came from the cache
+    assert [m["id"] for m in report.missing] == [gone_id]
+    assert [d["id"] for d in report.drifted] == [drift_id]
+    assert [o["path"] for o in report.orphans] == [str(orphan)]
+    assert json.loads(json.dumps(report.to_dict()))["ok"] is False
+
+
+def test_repair_plan_restores_from_moved_orphan(tmp_db):
+    app_id, path = _import(tmp_db, "a.pdf", b"%PDF a")
+    stray = path.parent / "copy of cv.pdf"
+    os.replace(path, stray)
+
+    plan = integrity.repair_plan(integrity.scan())
+    assert [(step.action, step.source) for step in plan] == [("restore", str(stray))]
+
+    assert integrity.apply_repairs(plan) == {"restore": 1}
+    assert path.exists() and not stray.exists()
+    assert integrity.scan().ok
+
+
+def test_repair_plan_adopts_named_orphans_and_keeps_drop_row_opt_in(tmp_db):
+    gone_id, gone = _import(tmp_db, "a.pdf", b"%PDF a")
+    gone.unlink()
+    named = file_manager.company_dir("Globex") / file_manager.make_filename("2024-03-01", "Globex", "Ops", 1)
+    named.write_bytes(b"%PDF named")
+
+    plan = integrity.repair_plan(integrity.scan())
+    assert sorted(step.action for step in plan) == ["adopt", "drop_row"]
+
+    integrity.apply_repairs(plan)
+    assert database.get_application_by_id(gone_id) is not None
+    adopted = database.find_by_hash(file_manager.compute_hash(named))
+    assert (adopted["company"], adopted["version"]) == ("globex", 1)
+
+    integrity.apply_repairs(plan, actions=["drop_row"])
+    assert database.get_application_by_id(gone_id) is None
+    assert integrity.scan().ok
@@ -0,0 +1,49 @@
+import json
+
+from app.core import database, manifest
+
+
+def _write_pdfs(folder, count):
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (folder / f"{i}.pdf").write_bytes(f"%PDF {i}".encode())
+
+
+def test_csv_manifest_imports_in_batches_and_rejects_bad_rows(tmp_db):
+    _write_pdfs(tmp_db / "pdfs", 5)
+    path = tmp_db / "manifest.csv"
+    path.write_text(
+        "company,role,date,notes,pdf\n"
+        "Acme,Dev,2024-01-01,first,pdfs/0.pdf\n"
+        "Acme,Dev,2024-02-30,bad date,pdfs/1.pdf\n"
+        "Globex,Ops,2024/03/01,wrong format,pdfs/2.pdf\n"
+        ",Ops,2024-03-01,no company,pdfs/3.pdf\n"
+        "Initech,QA,2024-04-01,,pdfs/missing.pdf\n"
+        "Initech,QA,2024-04-02,,pdfs/4.pdf\n",
+        encoding="utf-8",
+    )
+
+    dry = manifest.import_manifest(path, dry_run=True, batch_size=2)
+    assert (dry.rows, dry.accepted) == (6, 2)
+    assert [r.line for r in dry.rejected] == [3, 4, 5, 6]
+    assert database.fetch_all_applications() == []
+
+    result = manifest.import_manifest(path, batch_size=2)
+    assert (result.imported, len(result.rejected)) == (2, 4)
+    apps = database.fetch_all_applications(order_by="date_applied ASC, id ASC")
+    assert [(a["company"], a["notes"]) for a in apps] == [("Acme", "first"), ("Initech", "")]
+
+
+def test_jsonl_manifest(tmp_db):
+    _write_pdfs(tmp_db / "pdfs", 2)
+    path = tmp_db / "manifest.jsonl"
+    records = [
+        {"company": "Acme", "title": "Dev", "date_applied": "2024-01-01", "file_path": str(tmp_db / "pdfs" / "0.pdf")},
+        "not an object",
+    ]
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n{broken\n", encoding="utf-8")
+
+    result = manifest.import_manifest(path)
+    assert result.imported == 1
+    assert [r.line for r in result.rejected] == [2, 3]
+    assert database.fetch_all_applications()[0]["role"] == "Dev"
@@ -0,0 +1,107 @@
+import threading
+import zlib
+
+from app.core import bulk_import, database, file_manager, pdf_text
+
+
+def _pdf(*lines, compress=True):
+    """A minimal one-page PDF showing `lines` of text."""
+    ops = b"BT /F1 12 Tf 72 720 Td " + b" 0 -14 Td ".join(
+        b"(" + line.replace(b"(", b"\\(").replace(b")", b"\\)") + b") Tj" for line in lines
+    ) + b" ET"
+    body = zlib.compress(ops) if compress else ops
+    filt = b" /Filter /FlateDecode" if compress else b""
+    return (
+        b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+        b"4 0 obj << /Length " + str(len(body)).encode() + filt + b" >>\nstream\n"
+        + body + b"\nendstream\nendobj\n%%EOF\n"
+    )
+
+
+def _write(tmp_db, name, content):
+    src = tmp_db / "in" / name
+    src.parent.mkdir(parents=True, exist_ok=True)
+    src.write_bytes(content)
+    return src
+
+
+def test_extract_text_decodes_flate_and_string_escapes(tmp_path):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(_pdf(b"Jane Doe", b"Kubernetes (CKA) \\101WS"))
+    assert pdf_text.extract_text(path) == "Jane Doe\nKubernetes (CKA) AWS"
+
+    path.write_bytes(_pdf(b"plain", compress=False))
+    assert pdf_text.extract_text(path) == "plain"
+
+    stream = b"BT [(Site) -300 (Reliability)] TJ T* <FEFF00C9 0063 006F 006C 0065> Tj ET"
+    assert pdf_text._content_text(stream).split() == ["Site", "Reliability", "École"]
+
+
+def test_import_indexes_contents_for_search(tmp_db):
+    src = _write(tmp_db, "a.pdf", _pdf(b"Built Kubernetes operators"))
+    app_id, _ = file_manager.import_pdf(src, "Acme", "SRE", "2024-01-01")
+    other = _write(tmp_db, "b.pdf", _pdf(b"Frontend work"))
+    file_manager.import_pdf(other, "Beta", "Dev", "2024-01-02")
+    pdf_text.wait_idle()
+
+    hits = database.search_applications(search="kubern", fulltext=True)
+    assert [r["id"] for r in hits] == [app_id]
+    assert database.count_applications(search="frontend", fulltext=True) == 1
+    # Short words search the PDF text too
+    assert [r["id"] for r in database.search_applications(search="op", fulltext=True)] == [app_id]
+
+    file_manager.delete_many([app_id])
+    assert database.get_pdf_text(file_manager.compute_hash(src)) is None
+
+
+def test_import_does_not_wait_for_extraction(tmp_db, monkeypatch):
+    release = threading.Event()
+    real = pdf_text._extract_or_empty
+    monkeypatch.setattr(pdf_text, "_extract_or_empty", lambda p: release.wait(5) and real(p))
+    src = _write(tmp_db, "a.pdf", _pdf(b"Kubernetes"))
+    app_id, _ = file_manager.import_pdf(src, "Acme", "SRE", "2024-01-01")
+    assert database.get_application_by_id(app_id) is not None
+    assert database.count_applications(search="kubernetes", fulltext=True) == 0
+
+    release.set()
+    pdf_text.wait_idle()
+    assert database.count_applications(search="kubernetes", fulltext=True) == 1
+
+
+def test_identical_files_are_extracted_once(tmp_db, monkeypatch):
+    items = [
+        bulk_import.ImportItem(_write(tmp_db, f"{i}.pdf", _pdf(b"Same CV")), "Acme", "Dev", "2024-01-01")
+        for i in range(3)
+    ]
+    calls = []
+    real = pdf_text._extract_or_empty
+    monkeypatch.setattr(pdf_text, "_extract_or_empty", lambda p: calls.append(p) or real(p))
+    result = bulk_import.bulk_import(items, workers=1, dedup="new_version")
+    assert result.imported == 3
+    pdf_text.wait_idle()
+    assert len(calls) == 1
+    assert database.count_applications(search="same", fulltext=True) == 3
+
+
+def test_backfill_resumes_where_it_stopped(tmp_db, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(pdf_text, "index_later", lambda pairs: None)
+        for i in range(5):
+            src = _write(tmp_db, f"{i}.pdf", _pdf(b"Resume number %d" % i))
+            file_manager.import_pdf(src, "Acme", "Dev", f"2024-01-0{i + 1}")
+    assert database.count_applications(search="resume", fulltext=True) == 0
+
+    seen = []
+    def stop_after_first_batch(indexed):
+        seen.append(indexed)
+        if len(seen) == 1:
+            raise KeyboardInterrupt
+    try:
+        pdf_text.backfill(workers=1, batch_size=2, progress=stop_after_first_batch)
+    except KeyboardInterrupt:
+        pass
+    assert database.count_applications(search="resume", fulltext=True) == 2
+
+    assert pdf_text.backfill(workers=1, batch_size=2) == 3
+    assert database.count_applications(search="resume", fulltext=True) == 5
+    assert pdf_text.backfill(workers=1) == 0
@@ -0,0 +1,29 @@
+import os
+
+from app.core import thumbnails
+
+
+def test_memory_tier_then_disk(tmp_path):
+    cache = thumbnails.ThumbnailCache(tmp_path, max_bytes=1000, memory_items=1)
+    cache.put("aa11", 240, b"first")
+    cache.put("bb22", 240, b"second")
+    assert cache.peek("bb22", 240) == b"second"
+    assert cache.peek("aa11", 240) is None  # pushed out of memory...
+    assert cache.get("aa11", 240) == b"first"  # ...but still on disk
+    assert cache.peek("aa11", 240) == b"first"
+    assert cache.get("aa11", 480) is None
+
+
+def test_disk_eviction_drops_least_recently_used(tmp_path):
+    cache = thumbnails.ThumbnailCache(tmp_path, max_bytes=350, memory_items=0)
+    for i, sha in enumerate(["aa", "bb", "cc"]):
+        cache.put(sha, 240, b"x" * 100)
+        path = cache._path(sha, 240)
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    # Reading "aa" makes it the most recently used, so "bb" goes next
+    assert cache.get("aa", 240) is not None
+    cache.put("dd", 240, b"x" * 100)
+    assert cache.disk_usage() <= 350
+    assert cache.get("bb", 240) is None
+    assert cache.get("aa", 240) is not None
+    assert cache.get("dd", 240) is not None